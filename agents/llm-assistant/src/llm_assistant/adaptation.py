@@ -14,6 +14,7 @@ class AssistantAdaptationPlugin(AdaptationPlugin):
     """Applies online learning updates from assistant feedback events."""
 
     name = "assistant.adaptation"
+    domains = frozenset({"assistant"})
 
     def __init__(self, storage: AssistantStorage) -> None:
         self._storage = storage
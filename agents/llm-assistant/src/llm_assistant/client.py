@@ -1,15 +1,18 @@
-"""OpenRouter async HTTP client wrapper used by assistant decision plugin."""
+"""OpenRouter HTTP client wrapper used by assistant decision plugin."""
 
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
 import re
-from collections.abc import Coroutine
+import threading
+import time
 from typing import Any
 
 import httpx
 
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+_RETRY_DELAY_S = 0.1
+
 
 class OpenRouterError(Exception):
     """Base OpenRouter client error."""
@@ -20,7 +23,11 @@ class OpenRouterMissingAPIKeyError(OpenRouterError):
 
 
 class OpenRouterClient:
-    """Async OpenRouter chat completion client with short timeout and single retry."""
+    """OpenRouter chat completion client with short timeout and single retry.
+
+    HTTP clients are created lazily and kept for the lifetime of the instance so
+    consecutive calls reuse pooled keep-alive connections.
+    """
 
     def __init__(
         self,
@@ -35,9 +42,17 @@ class OpenRouterClient:
         self._api_key = api_key.strip()
         self._model = model.strip()
         self._base_url = base_url
-        self._timeout_s = timeout_s
-        self._referer = referer.strip()
-        self._title = title.strip()
+        self._timeout = httpx.Timeout(timeout_s)
+        self._headers = {"Authorization": f"Bearer {self._api_key}"}
+        if referer.strip():
+            self._headers["HTTP-Referer"] = referer.strip()
+        if title.strip():
+            self._headers["X-Title"] = title.strip()
+        self._sync_client: httpx.Client | None = None
+        # AsyncClient connections are bound to the loop that opened them.
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._clients_lock = threading.Lock()
 
     @property
     def model(self) -> str:
@@ -53,56 +68,19 @@ class OpenRouterClient:
         presence_penalty: float,
     ) -> str:
         """Generate assistant text from chat-completions endpoint."""
-        if not self._api_key:
-            raise OpenRouterMissingAPIKeyError("OPENROUTER_API_KEY is not configured")
-        if not self._model:
-            raise OpenRouterError("OPENROUTER_MODEL is not configured")
-
-        payload = {
-            "model": self._model,
-            "messages": messages,
-            "temperature": temperature,
-            "top_p": top_p,
-            "presence_penalty": presence_penalty,
-        }
-
-        headers = {"Authorization": f"Bearer {self._api_key}"}
-        if self._referer:
-            headers["HTTP-Referer"] = self._referer
-        if self._title:
-            headers["X-Title"] = self._title
-
+        payload = self._build_payload(messages, temperature, top_p, presence_penalty)
+        client = self._get_async_client()
         for attempt in range(2):
             try:
-                timeout = httpx.Timeout(self._timeout_s)
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(self._base_url, headers=headers, json=payload)
-                response.raise_for_status()
-                body = response.json()
-                choices = body.get("choices")
-                if not isinstance(choices, list) or not choices:
-                    raise OpenRouterError("OpenRouter response without choices")
-                message = choices[0].get("message")
-                if not isinstance(message, dict):
-                    raise OpenRouterError("OpenRouter response without message payload")
-                content = message.get("content")
-                if not isinstance(content, str) or not content.strip():
-                    raise OpenRouterError("OpenRouter returned empty content")
-                return content.strip()
+                response = await client.post(self._base_url, headers=self._headers, json=payload)
+                return _parse_reply(response)
             except httpx.TimeoutException as exc:
                 if attempt == 0:
-                    await asyncio.sleep(0.1)
+                    await asyncio.sleep(_RETRY_DELAY_S)
                     continue
                 raise OpenRouterError("OpenRouter timeout after retry") from exc
-            except httpx.HTTPStatusError as exc:
-                status_code = exc.response.status_code
-                body_excerpt = _extract_response_excerpt(exc.response.text, limit=500)
-                raise OpenRouterError(
-                    "OpenRouter request failed "
-                    f"(status={status_code}, body={body_excerpt!r})"
-                ) from exc
             except (httpx.HTTPError, ValueError) as exc:
-                raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
+                raise _request_error(exc) from exc
 
         raise OpenRouterError("OpenRouter request failed unexpectedly")
 
@@ -114,26 +92,120 @@ class OpenRouterClient:
         top_p: float,
         presence_penalty: float,
     ) -> str:
-        """Sync bridge for environments where plugin interfaces are synchronous."""
-        coro = self.generate_reply(
-            messages,
-            temperature=temperature,
-            top_p=top_p,
-            presence_penalty=presence_penalty,
-        )
-        return _run_coro_sync(coro)
+        """Blocking variant for synchronous plugin interfaces, on a pooled sync client."""
+        payload = self._build_payload(messages, temperature, top_p, presence_penalty)
+        client = self._get_sync_client()
+        for attempt in range(2):
+            try:
+                response = client.post(self._base_url, headers=self._headers, json=payload)
+                return _parse_reply(response)
+            except httpx.TimeoutException as exc:
+                if attempt == 0:
+                    time.sleep(_RETRY_DELAY_S)
+                    continue
+                raise OpenRouterError("OpenRouter timeout after retry") from exc
+            except (httpx.HTTPError, ValueError) as exc:
+                raise _request_error(exc) from exc
 
+        raise OpenRouterError("OpenRouter request failed unexpectedly")
 
-def _run_coro_sync(coro: Coroutine[Any, Any, str]) -> str:
-    """Execute coroutine safely from synchronous plugin code."""
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
+    def close(self) -> None:
+        """Close the pooled sync client and schedule the async one to close on its loop."""
+        with self._clients_lock:
+            sync_client, self._sync_client = self._sync_client, None
+            async_client, self._async_client = self._async_client, None
+            async_loop, self._async_loop = self._async_loop, None
+        if sync_client is not None:
+            sync_client.close()
+        if async_client is not None:
+            _aclose_on_loop(async_client, async_loop)
+
+    async def aclose(self) -> None:
+        """Close both pooled clients, awaiting the async one if it belongs to this loop."""
+        with self._clients_lock:
+            async_client, self._async_client = self._async_client, None
+            async_loop, self._async_loop = self._async_loop, None
+        if async_client is not None:
+            if async_loop is asyncio.get_running_loop():
+                await async_client.aclose()
+            else:
+                _aclose_on_loop(async_client, async_loop)
+        self.close()
+
+    def _build_payload(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        top_p: float,
+        presence_penalty: float,
+    ) -> dict[str, Any]:
+        if not self._api_key:
+            raise OpenRouterMissingAPIKeyError("OPENROUTER_API_KEY is not configured")
+        if not self._model:
+            raise OpenRouterError("OPENROUTER_MODEL is not configured")
+        return {
+            "model": self._model,
+            "messages": messages,
+            "temperature": temperature,
+            "top_p": top_p,
+            "presence_penalty": presence_penalty,
+        }
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(asyncio.run, coro)
-        return future.result()
+    def _get_sync_client(self) -> httpx.Client:
+        with self._clients_lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(timeout=self._timeout, limits=_POOL_LIMITS)
+            return self._sync_client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            if self._async_client is not None and self._async_loop is loop:
+                return self._async_client
+            stale_client, stale_loop = self._async_client, self._async_loop
+            self._async_client = httpx.AsyncClient(timeout=self._timeout, limits=_POOL_LIMITS)
+            self._async_loop = loop
+            client = self._async_client
+        if stale_client is not None:
+            _aclose_on_loop(stale_client, stale_loop)
+        return client
+
+
+def _aclose_on_loop(
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+) -> None:
+    """Schedule ``client.aclose()`` on the loop that owns its connections, if still open."""
+    if loop is not None and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def _parse_reply(response: httpx.Response) -> str:
+    """Extract the first choice text from a chat-completions response."""
+    response.raise_for_status()
+    body = response.json()
+    choices = body.get("choices")
+    if not isinstance(choices, list) or not choices:
+        raise OpenRouterError("OpenRouter response without choices")
+    message = choices[0].get("message")
+    if not isinstance(message, dict):
+        raise OpenRouterError("OpenRouter response without message payload")
+    content = message.get("content")
+    if not isinstance(content, str) or not content.strip():
+        raise OpenRouterError("OpenRouter returned empty content")
+    return content.strip()
+
+
+def _request_error(exc: httpx.HTTPError | ValueError) -> OpenRouterError:
+    """Map a transport/decoding failure into an OpenRouterError with safe diagnostics."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        body_excerpt = _extract_response_excerpt(exc.response.text, limit=500)
+        return OpenRouterError(
+            "OpenRouter request failed "
+            f"(status={status_code}, body={body_excerpt!r})"
+        )
+    return OpenRouterError(f"OpenRouter request failed: {exc}")
 
 
 def _extract_response_excerpt(raw_text: str, *, limit: int) -> str:
@@ -5,31 +5,56 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+import threading
 import time
 from typing import Any
 
+from pce.core.ids import time_ordered_id
 from pce.core.plugins import DecisionPlugin
 from pce.core.types import ActionPlan, PCEEvent
-from llm_assistant.client import OpenRouterError, OpenRouterMissingAPIKeyError
+from llm_assistant.client import OpenRouterError
 from llm_assistant.policy import apply_profile_override, choose_profile
 from llm_assistant.storage import AssistantStorage
 from llm_assistant.value_model import AssistantValueModelPlugin
 
 
+_LLM_ERROR_REPLY = (
+    "Configuração ausente/erro OpenRouter. Ajuste "
+    "OPENROUTER_API_KEY/OPENROUTER_MODEL."
+)
+
+# session_id, user_text, messages, final_decoding, prompt_hash
+_DeferredReply = tuple[str, str, list[dict[str, str]], dict[str, float], str]
+# Deferred replies waiting for their OpenRouter call; once full, replies are generated inline.
+_MAX_DEFERRED_REPLIES = 256
+
+
 class AssistantDecisionPlugin(DecisionPlugin):
-    """Builds LLM prompts and emits reply action payloads."""
+    """Builds LLM prompts and emits reply action payloads.
+
+    With ``defer_replies`` the plan is returned without waiting for OpenRouter:
+    the action carries a ``reply_id`` and :meth:`complete_deferred_reply` stores
+    the generated text once it runs (e.g. as a post-response background task).
+    A ``pending`` reply record is saved as soon as the plan is built.
+    """
 
     name = "assistant.decision"
+    domains = frozenset({"assistant"})
 
     def __init__(
         self,
         storage: AssistantStorage,
         value_model: AssistantValueModelPlugin,
         llm_client: Any,
+        *,
+        defer_replies: bool = False,
     ) -> None:
         self._storage = storage
         self._value_model = value_model
         self._llm_client = llm_client
+        self._defer_replies = defer_replies
+        self._deferred: dict[str, _DeferredReply] = {}
+        self._deferred_lock = threading.Lock()
 
     def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
         _ = state
@@ -73,35 +98,18 @@ class AssistantDecisionPlugin(DecisionPlugin):
         }
 
         openrouter_error: str | None = None
-        try:
-            reply_text = self._llm_client.generate_reply_sync(messages, **final_decoding)
-        except OpenRouterMissingAPIKeyError as exc:
-            openrouter_error = _format_exception_short(exc)
-            _log_llm_error(
-                session_id=session_id,
-                model=getattr(self._llm_client, "model", "unknown"),
-                prompt_hash=prompt_hash,
-                error=openrouter_error,
+        reply_id: str | None = None
+        if self._defer_replies:
+            # The user turn is stored with the reply, so a discarded job leaves no trace.
+            reply_id = self._defer((session_id, user_text, messages, final_decoding, prompt_hash))
+        if reply_id is not None:
+            reply_text = ""
+        else:
+            self._storage.append_session_message(session_id, "user", user_text)
+            reply_text, openrouter_error = self._generate(
+                session_id, messages, final_decoding, prompt_hash
             )
-            reply_text = (
-                "Configuração ausente/erro OpenRouter. Ajuste "
-                "OPENROUTER_API_KEY/OPENROUTER_MODEL."
-            )
-        except OpenRouterError as exc:
-            openrouter_error = _format_exception_short(exc)
-            _log_llm_error(
-                session_id=session_id,
-                model=getattr(self._llm_client, "model", "unknown"),
-                prompt_hash=prompt_hash,
-                error=openrouter_error,
-            )
-            reply_text = (
-                "Configuração ausente/erro OpenRouter. Ajuste "
-                "OPENROUTER_API_KEY/OPENROUTER_MODEL."
-            )
-
-        self._storage.append_session_message(session_id, "user", user_text)
-        self._storage.append_session_message(session_id, "assistant", reply_text)
+            self._storage.append_session_message(session_id, "assistant", reply_text)
         self._storage.set_pending_feedback(
             session_id,
             {
@@ -181,6 +189,17 @@ class AssistantDecisionPlugin(DecisionPlugin):
             )
         )
 
+        action_payload: dict[str, Any] = {
+            "type": "assistant.reply",
+            "text": reply_text,
+            "format": "markdown",
+        }
+        metadata: dict[str, Any] = {"action_payload": action_payload, "explain": explain}
+        if reply_id is not None:
+            action_payload["reply_id"] = reply_id
+            metadata["llm_pending"] = True
+            metadata["reply_id"] = reply_id
+
         return ActionPlan(
             action_type="assistant.action",
             rationale=(
@@ -188,15 +207,70 @@ class AssistantDecisionPlugin(DecisionPlugin):
                 f"epsilon={bandit_choice.epsilon:.4f}"
             ),
             priority=2,
-            metadata={
-                "action_payload": {
-                    "type": "assistant.reply",
-                    "text": reply_text,
-                    "format": "markdown",
-                },
-                "explain": explain,
-            },
+            metadata=metadata,
+        )
+
+    def complete_deferred_reply(self, reply_id: str) -> dict[str, Any] | None:
+        """Run the OpenRouter call for a deferred plan and persist the reply."""
+        with self._deferred_lock:
+            job = self._deferred.pop(reply_id, None)
+        if job is None:
+            return None
+        session_id, user_text, messages, final_decoding, prompt_hash = job
+        reply_text, openrouter_error = self._generate(
+            session_id, messages, final_decoding, prompt_hash
+        )
+        self._storage.append_session_message(session_id, "user", user_text)
+        self._storage.append_session_message(session_id, "assistant", reply_text)
+        reply = {
+            "reply_id": reply_id,
+            "session_id": session_id,
+            "status": "completed",
+            "text": reply_text,
+            "format": "markdown",
+            "openrouter_error": openrouter_error,
+        }
+        self._storage.save_reply(reply_id, reply)
+        return reply
+
+    def discard_deferred_reply(self, reply_id: str) -> None:
+        """Forget a deferred plan whose event was rejected before it was committed."""
+        with self._deferred_lock:
+            job = self._deferred.pop(reply_id, None)
+        if job is not None:
+            self._storage.delete_reply(reply_id)
+
+    def _defer(self, job: _DeferredReply) -> str | None:
+        """Queue ``job`` and record its reply as pending; ``None`` when the queue is full."""
+        reply_id = time_ordered_id()
+        with self._deferred_lock:
+            if len(self._deferred) >= _MAX_DEFERRED_REPLIES:
+                return None
+            self._deferred[reply_id] = job
+        self._storage.save_reply(
+            reply_id, {"reply_id": reply_id, "session_id": job[0], "status": "pending"}
         )
+        return reply_id
+
+    def _generate(
+        self,
+        session_id: str,
+        messages: list[dict[str, str]],
+        final_decoding: dict[str, float],
+        prompt_hash: str,
+    ) -> tuple[str, str | None]:
+        """Call OpenRouter, mapping failures to the fallback reply plus a short error."""
+        try:
+            return self._llm_client.generate_reply_sync(messages, **final_decoding), None
+        except OpenRouterError as exc:
+            openrouter_error = _format_exception_short(exc)
+            _log_llm_error(
+                session_id=session_id,
+                model=getattr(self._llm_client, "model", "unknown"),
+                prompt_hash=prompt_hash,
+                error=openrouter_error,
+            )
+            return _LLM_ERROR_REPLY, openrouter_error
 
     @staticmethod
     def _build_messages(
@@ -133,6 +133,19 @@ class AssistantStorage:
             self._state_manager.plugin_delete_prefix(self.namespace, legacy_key)
         return legacy_pending if isinstance(legacy_pending, dict) else None
 
+    def save_reply(self, reply_id: str, reply: dict[str, Any]) -> None:
+        """Persist a deferred reply record, pending or completed."""
+        self._state_manager.plugin_set_json(self.namespace, f"reply:{reply_id}", reply)
+
+    def get_reply(self, reply_id: str) -> dict[str, Any] | None:
+        """Load a deferred reply record, or ``None`` for unknown ids."""
+        reply = self._state_manager.plugin_get_json(self.namespace, f"reply:{reply_id}")
+        return reply if isinstance(reply, dict) else None
+
+    def delete_reply(self, reply_id: str) -> None:
+        """Remove a deferred reply record whose plan was discarded."""
+        self._state_manager.plugin_delete_prefix(self.namespace, f"reply:{reply_id}")
+
     def append_session_message(self, session_id: str, role: str, text: str) -> dict[str, Any]:
         """Append one bounded message and refresh summary snapshot."""
         memory = self.get_session_memory(session_id)
@@ -178,7 +191,7 @@ class AssistantStorage:
     def clear_all(self) -> int:
         """Clear assistant namespace keys used by this plugin."""
         deleted = 0
-        for prefix in ("mem:", "pending:", "policy", "metrics", "reward_window"):
+        for prefix in ("mem:", "pending:", "reply:", "policy", "metrics", "reward_window"):
             deleted += self._state_manager.plugin_delete_prefix(self.namespace, prefix)
         self._state_manager.plugin_set_json(self.namespace, "policy", default_policy_state())
         self._state_manager.plugin_set_json(
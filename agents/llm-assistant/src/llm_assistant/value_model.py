@@ -10,6 +10,7 @@ class AssistantValueModelPlugin(ValueModelPlugin):
     """Scores assistant events against tactical values."""
 
     name = "assistant.value_model"
+    domains = frozenset({"assistant"})
 
     def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
         _ = state
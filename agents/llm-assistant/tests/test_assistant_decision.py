@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pce.core.types import PCEEvent
 from llm_assistant.client import OpenRouterError
+from llm_assistant import decision as decision_module
 from llm_assistant.decision import AssistantDecisionPlugin
 from llm_assistant.value_model import AssistantValueModelPlugin
 
@@ -63,3 +64,102 @@ def test_assistant_decision_exposes_openrouter_error_and_logs(capsys) -> None:
     assert '"session_id": "sess-1"' in stdout
     assert '"model": "provider/model"' in stdout
     assert '"prompt_hash":' in stdout
+
+
+class _ReplyStorageStub(_StorageStub):
+    def __init__(self) -> None:
+        self.replies: dict[str, dict[str, object]] = {}
+        self.messages: list[tuple[str, str]] = []
+
+    def append_session_message(self, session_id: str, role: str, text: str) -> None:
+        del session_id
+        self.messages.append((role, text))
+
+    def save_reply(self, reply_id: str, reply: dict[str, object]) -> None:
+        self.replies[reply_id] = reply
+
+    def delete_reply(self, reply_id: str) -> None:
+        self.replies.pop(reply_id, None)
+
+
+class _EchoLLMClient:
+    model = "provider/model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_reply_sync(self, messages, **kwargs):  # type: ignore[no-untyped-def]
+        del kwargs
+        self.calls += 1
+        return f"eco: {messages[-1]['content']}"
+
+
+def test_assistant_decision_defers_llm_call_until_completed() -> None:
+    storage = _ReplyStorageStub()
+    llm_client = _EchoLLMClient()
+    plugin = AssistantDecisionPlugin(
+        storage, AssistantValueModelPlugin(), llm_client, defer_replies=True
+    )
+    event = PCEEvent(
+        event_type="observation.assistant.v1",
+        source="assistant-ui",
+        payload={"domain": "assistant", "session_id": "sess-2", "text": "oi", "tags": []},
+    )
+
+    plan = plugin.deliberate(event, {"strategic_values": {}}, value_score=0.8, cci=0.9)
+
+    assert llm_client.calls == 0
+    assert plan.metadata["llm_pending"] is True
+    reply_id = plan.metadata["reply_id"]
+    assert plan.metadata["action_payload"]["reply_id"] == reply_id
+    assert storage.replies[reply_id]["status"] == "pending"
+
+    reply = plugin.complete_deferred_reply(reply_id)
+    assert reply is not None and reply["text"] == "eco: oi"
+    assert storage.replies[reply_id]["text"] == "eco: oi"
+    assert storage.replies[reply_id]["status"] == "completed"
+    assert storage.messages == [("user", "oi"), ("assistant", "eco: oi")]
+    assert plugin.complete_deferred_reply(reply_id) is None
+
+
+def test_assistant_decision_discarded_reply_leaves_session_untouched() -> None:
+    storage = _ReplyStorageStub()
+    llm_client = _EchoLLMClient()
+    plugin = AssistantDecisionPlugin(
+        storage, AssistantValueModelPlugin(), llm_client, defer_replies=True
+    )
+    event = PCEEvent(
+        event_type="observation.assistant.v1",
+        source="assistant-ui",
+        payload={"domain": "assistant", "session_id": "sess-3", "text": "oi", "tags": []},
+    )
+
+    plan = plugin.deliberate(event, {"strategic_values": {}}, value_score=0.8, cci=0.9)
+    plugin.discard_deferred_reply(plan.metadata["reply_id"])
+
+    assert plugin.complete_deferred_reply(plan.metadata["reply_id"]) is None
+    assert llm_client.calls == 0
+    assert storage.messages == []
+    assert storage.replies == {}
+
+
+def test_assistant_decision_replies_inline_when_deferred_queue_is_full(monkeypatch) -> None:
+    monkeypatch.setattr(decision_module, "_MAX_DEFERRED_REPLIES", 1)
+    storage = _ReplyStorageStub()
+    llm_client = _EchoLLMClient()
+    plugin = AssistantDecisionPlugin(
+        storage, AssistantValueModelPlugin(), llm_client, defer_replies=True
+    )
+    event = PCEEvent(
+        event_type="observation.assistant.v1",
+        source="assistant-ui",
+        payload={"domain": "assistant", "session_id": "sess-4", "text": "oi", "tags": []},
+    )
+
+    deferred = plugin.deliberate(event, {"strategic_values": {}}, value_score=0.8, cci=0.9)
+    inline = plugin.deliberate(event, {"strategic_values": {}}, value_score=0.8, cci=0.9)
+
+    assert deferred.metadata["llm_pending"] is True
+    assert "llm_pending" not in inline.metadata
+    assert inline.metadata["action_payload"]["text"] == "eco: oi"
+    assert llm_client.calls == 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 
 import httpx
 import pytest
@@ -59,3 +60,72 @@ def test_generate_reply_retries_only_timeout(monkeypatch) -> None:
         )
 
     assert calls["count"] == 2
+
+
+def test_generate_reply_sync_reuses_pooled_client(monkeypatch) -> None:
+    seen_clients: list[int] = []
+
+    def fake_post(self, url, *, headers, json):  # type: ignore[no-untyped-def]
+        del headers, json
+        seen_clients.append(id(self))
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("POST", url),
+            json={"choices": [{"message": {"content": " ok "}}]},
+        )
+
+    monkeypatch.setattr("httpx.Client.post", fake_post)
+
+    client = OpenRouterClient(api_key="test-key", model="provider/model")
+    for _ in range(3):
+        reply = client.generate_reply_sync(
+            [{"role": "user", "content": "oi"}],
+            temperature=0.2,
+            top_p=0.9,
+            presence_penalty=0.0,
+        )
+        assert reply == "ok"
+
+    assert len(seen_clients) == 3
+    assert len(set(seen_clients)) == 1
+    client.close()
+
+
+def test_aclose_releases_pooled_clients() -> None:
+    client = OpenRouterClient(api_key="test-key", model="provider/model")
+
+    async def run() -> httpx.AsyncClient:
+        async_client = client._get_async_client()
+        client._get_sync_client()
+        await client.aclose()
+        return async_client
+
+    async_client = asyncio.run(run())
+
+    assert async_client.is_closed
+    assert client._sync_client is None
+    assert client._async_client is None
+
+
+def test_async_client_replaced_on_new_loop_is_closed_on_its_own_loop() -> None:
+    client = OpenRouterClient(api_key="test-key", model="provider/model")
+    old_loop = asyncio.new_event_loop()
+    runner = threading.Thread(target=old_loop.run_forever, daemon=True)
+    runner.start()
+
+    async def get_client() -> httpx.AsyncClient:
+        return client._get_async_client()
+
+    try:
+        stale = asyncio.run_coroutine_threadsafe(get_client(), old_loop).result(timeout=5)
+        fresh = asyncio.run(get_client())
+        # Let the old loop run the scheduled aclose().
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), old_loop).result(timeout=5)
+    finally:
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        runner.join(timeout=5)
+        old_loop.close()
+
+    assert fresh is not stale
+    assert stale.is_closed
+    assert client._async_client is fresh
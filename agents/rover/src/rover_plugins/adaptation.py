@@ -14,6 +14,7 @@ class RoboticsAdaptationPlugin(AdaptationPlugin):
     """Q-learning adaptation for robotics feedback events."""
 
     name = "robotics.adaptation"
+    domains = frozenset({"robotics"})
 
     def __init__(self, storage: RoboticsStorage) -> None:
         self._storage = storage
@@ -19,6 +19,7 @@ class RoboticsDecisionPlugin(DecisionPlugin):
     """Epsilon-greedy robotics decision plugin."""
 
     name = "robotics.decision"
+    domains = frozenset({"robotics"})
 
     def __init__(self, storage: RoboticsStorage) -> None:
         self._storage = storage
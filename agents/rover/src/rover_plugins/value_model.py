@@ -10,6 +10,7 @@ class RoboticsValueModelPlugin(ValueModelPlugin):
     """Domain value evaluator for robotics observations and feedback."""
 
     name = "robotics.value_model"
+    domains = frozenset({"robotics"})
 
     def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
         _ = state
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
-from statistics import pstdev
+from math import sqrt
 from typing import Any
 
+_RECENT_ACTIONS_WINDOW = 20
+_CONTRADICTION_WINDOW = 500
+
 
 @dataclass(slots=True)
 class CCIInput:
@@ -16,6 +21,24 @@ class CCIInput:
     contradiction_rate: float
     predictive_accuracy: float
 
+    def as_dict(self) -> dict[str, float]:
+        """Return the components keyed by name, as exposed in API payloads."""
+        return {
+            "decision_consistency": self.decision_consistency,
+            "priority_stability": self.priority_stability,
+            "contradiction_rate": self.contradiction_rate,
+            "predictive_accuracy": self.predictive_accuracy,
+        }
+
+
+@dataclass(slots=True)
+class CCIWindow:
+    """Rolling action traces that back incremental CCI updates."""
+
+    recent_actions: deque[Mapping[str, Any]]
+    violation_flags: deque[bool]
+    violation_count: int = 0
+
 
 @dataclass(slots=True)
 class CCIMetric:
@@ -33,13 +56,16 @@ class CCIMetric:
           CCI = wc * consistency + ws * stability +
                 wn * (1 - contradiction_rate) + wp * predictive_accuracy
         """
-        values = [
-            data.decision_consistency,
-            data.priority_stability,
-            data.contradiction_rate,
-            data.predictive_accuracy,
-        ]
-        if any(v < 0.0 or v > 1.0 for v in values):
+        if (
+            data.decision_consistency < 0.0
+            or data.decision_consistency > 1.0
+            or data.priority_stability < 0.0
+            or data.priority_stability > 1.0
+            or data.contradiction_rate < 0.0
+            or data.contradiction_rate > 1.0
+            or data.predictive_accuracy < 0.0
+            or data.predictive_accuracy > 1.0
+        ):
             msg = "CCI input values must be normalized between 0 and 1"
             raise ValueError(msg)
 
@@ -53,31 +79,58 @@ class CCIMetric:
 
     def from_state_manager(self, state_manager: Any) -> tuple[float, CCIInput]:
         """Derive all CCI components from real action traces in StateManager."""
-        recent_actions = state_manager.get_recent_actions(20)
+        return self.from_window(self.load_window(state_manager))
+
+    def load_window(self, state_manager: Any) -> CCIWindow:
+        """Load the rolling action window with a single column-only StateManager read."""
+        signals = state_manager.get_recent_action_signals(_CONTRADICTION_WINDOW)
+        flags = deque((row[4] for row in signals), maxlen=_CONTRADICTION_WINDOW)
+        recent_actions: deque[Mapping[str, Any]] = deque(maxlen=_RECENT_ACTIONS_WINDOW)
+        for priority, expected, observed, respected, _ in signals[-_RECENT_ACTIONS_WINDOW:]:
+            recent_actions.append(
+                {
+                    "priority": priority,
+                    "expected_impact": expected,
+                    "observed_impact": observed,
+                    "respected_values": respected,
+                }
+            )
+        return CCIWindow(
+            recent_actions=recent_actions,
+            violation_flags=flags,
+            violation_count=sum(flags),
+        )
+
+    def update_with_action(
+        self,
+        window: CCIWindow,
+        action: Mapping[str, Any],
+    ) -> tuple[float, CCIInput]:
+        """Slide ``window`` forward by one persisted action and recompute the CCI.
+
+        The cost is bounded by the window sizes, not by the full action history.
+        """
+        flags = window.violation_flags
+        if len(flags) == flags.maxlen and flags[0]:
+            window.violation_count -= 1
+        violated = bool(action["violated_values"])
+        flags.append(violated)
+        window.violation_count += violated
+        window.recent_actions.append(action)
+        return self.from_window(window)
+
+    def from_window(self, window: CCIWindow) -> tuple[float, CCIInput]:
+        """Derive all CCI components from an already loaded action window."""
+        recent_actions = window.recent_actions
         if not recent_actions:
             baseline = CCIInput(0.5, 0.5, 0.0, 0.5)
             return self.compute(baseline), baseline
 
-        respected_count = sum(1 for action in recent_actions if action["respected_values"])
-        decision_consistency = respected_count / len(recent_actions)
-
-        priorities = [int(action["priority"]) for action in recent_actions]
-        if len(priorities) == 1:
-            priority_stability = 1.0
-        else:
-            spread = min(1.0, pstdev(priorities) / 3.0)
-            priority_stability = 1.0 - spread
-
-        contradictions = state_manager.calculate_contradictions()
-        contradiction_rate = float(contradictions["contradiction_rate"])
-
-        accuracies: list[float] = []
-        for action in recent_actions:
-            expected = float(action["expected_impact"])
-            observed = float(action["observed_impact"])
-            error = abs(expected - observed)
-            accuracies.append(max(0.0, 1.0 - error))
-        predictive_accuracy = sum(accuracies) / len(accuracies)
+        decision_consistency, priority_stability, predictive_accuracy = _window_components(
+            recent_actions
+        )
+        flags = window.violation_flags
+        contradiction_rate = window.violation_count / len(flags) if flags else 0.0
 
         components = CCIInput(
             decision_consistency=decision_consistency,
@@ -86,3 +139,31 @@ class CCIMetric:
             predictive_accuracy=predictive_accuracy,
         )
         return self.compute(components), components
+
+
+def _window_components(actions: deque[Mapping[str, Any]]) -> tuple[float, float, float]:
+    """Single pass over the action window for consistency, stability and accuracy.
+
+    Priority spread uses exact integer moments, so it agrees with ``statistics.pstdev``
+    on integer priorities (up to final float rounding) without ``Fraction`` arithmetic.
+    """
+    count = len(actions)
+    respected = 0
+    priority_sum = 0
+    priority_sq_sum = 0
+    accuracy_sum = 0.0
+    for action in actions:
+        if action["respected_values"]:
+            respected += 1
+        priority = int(action["priority"])
+        priority_sum += priority
+        priority_sq_sum += priority * priority
+        error = abs(float(action["expected_impact"]) - float(action["observed_impact"]))
+        accuracy_sum += max(0.0, 1.0 - error)
+
+    if count == 1:
+        priority_stability = 1.0
+    else:
+        variance = (count * priority_sq_sum - priority_sum * priority_sum) / (count * count)
+        priority_stability = 1.0 - min(1.0, sqrt(variance) / 3.0)
+    return respected / count, priority_stability, accuracy_sum / count
@@ -13,6 +13,13 @@ class Settings(BaseSettings):
     app_name: str = "pce-python-core"
     environment: str = Field(default="dev", pattern="^(dev|test|prod)$")
     db_url: str = "sqlite:///./pce_state.db"
+    db_pool_size: int = Field(default=10, ge=1)
+    # When false, the API acknowledges events before the pipeline write batch lands.
+    sync_persistence: bool = True
+    # Serve load_state from the last snapshot this process wrote; single-writer deployments only.
+    state_cache: bool = False
+    # When true, assistant replies are generated after the /events response is sent.
+    defer_assistant_replies: bool = False
     _core_root: ClassVar[Path] = Path(__file__).resolve().parents[3]
     _repo_root: ClassVar[Path] = Path(__file__).resolve().parents[4]
     event_schema_path: str = str(_core_root / "docs/contracts/events.schema.json")
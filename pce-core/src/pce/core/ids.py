@@ -0,0 +1,35 @@
+"""Identifier helpers for persisted PCE records."""
+
+from __future__ import annotations
+
+import os
+import time
+
+_VERSION_MASK = ~(0xF << 76) & ((1 << 128) - 1)
+_VARIANT_MASK = ~(0x3 << 62) & ((1 << 128) - 1)
+_VERSION_4 = 0x4 << 76
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC4122 = 0x2 << 62
+
+
+def time_ordered_id() -> str:
+    """Return a UUIDv7-formatted id whose leading 48 bits are the current epoch millis.
+
+    Ids created later sort after earlier ones, which keeps primary-key inserts close to
+    append-only, and the value is built from ``os.urandom`` without a ``UUID`` object.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = (value & _VERSION_MASK & _VARIANT_MASK) | _VERSION_7 | _VARIANT_RFC4122
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+def random_id() -> str:
+    """Return a random UUIDv4-formatted id built directly from ``os.urandom``.
+
+    Equivalent to ``str(uuid4())`` without constructing a ``UUID`` object.
+    """
+    value = int.from_bytes(os.urandom(16))
+    value = (value & _VERSION_MASK & _VARIANT_MASK) | _VERSION_4 | _VARIANT_RFC4122
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Protocol, TypeVar
 
 from pce.core.types import ActionPlan, ExecutionResult, PCEEvent
 
@@ -58,24 +58,42 @@ DeliberateFallback = Callable[[dict[str, object], float, float], ActionPlan]
 AdaptFallback = Callable[[dict[str, object], ExecutionResult], dict[str, object]]
 ExecuteFallback = Callable[[ActionPlan], ExecutionResult]
 
+PluginT = TypeVar("PluginT")
+# Per-domain candidate plugins plus the candidates for any other domain.
+DomainRoutes = tuple[dict[str, tuple[PluginT, ...]], tuple[PluginT, ...]]
+
 
 @dataclass(slots=True)
 class PluginRegistry:
-    """Registry that dispatches plugins by first successful match."""
+    """Registry that dispatches plugins by first successful match.
+
+    Value, decision and adaptation plugins may declare a ``domains`` frozenset; they
+    are then only offered events whose ``payload["domain"]`` is in it. Plugins without
+    ``domains`` are tried for every event. ``match`` stays authoritative and
+    registration order is preserved.
+    """
 
     _value_plugins: list[ValueModelPlugin] = field(default_factory=list)
     _decision_plugins: list[DecisionPlugin] = field(default_factory=list)
     _adaptation_plugins: list[AdaptationPlugin] = field(default_factory=list)
     _executor_plugins: list[ExecutorPlugin] = field(default_factory=list)
+    _value_routes: DomainRoutes[ValueModelPlugin] = field(default_factory=lambda: ({}, ()))
+    _decision_routes: DomainRoutes[DecisionPlugin] = field(default_factory=lambda: ({}, ()))
+    _adaptation_routes: DomainRoutes[AdaptationPlugin] = field(
+        default_factory=lambda: ({}, ())
+    )
 
     def register_value_model(self, plugin: ValueModelPlugin) -> None:
         self._value_plugins.append(plugin)
+        self._value_routes = _domain_routes(self._value_plugins)
 
     def register_decision(self, plugin: DecisionPlugin) -> None:
         self._decision_plugins.append(plugin)
+        self._decision_routes = _domain_routes(self._decision_plugins)
 
     def register_adaptation(self, plugin: AdaptationPlugin) -> None:
         self._adaptation_plugins.append(plugin)
+        self._adaptation_routes = _domain_routes(self._adaptation_plugins)
 
     def register_executor(self, plugin: ExecutorPlugin) -> None:
         self._executor_plugins.append(plugin)
@@ -143,7 +161,7 @@ class PluginRegistry:
         event: PCEEvent,
         state: dict[str, object],
     ) -> ValueModelPlugin | None:
-        for plugin in self._value_plugins:
+        for plugin in _routed(self._value_routes, event):
             if plugin.match(event, state):
                 return plugin
         return None
@@ -153,7 +171,7 @@ class PluginRegistry:
         event: PCEEvent,
         state: dict[str, object],
     ) -> DecisionPlugin | None:
-        for plugin in self._decision_plugins:
+        for plugin in _routed(self._decision_routes, event):
             if plugin.match(event, state):
                 return plugin
         return None
@@ -164,7 +182,7 @@ class PluginRegistry:
         state: dict[str, object],
         result: ExecutionResult,
     ) -> AdaptationPlugin | None:
-        for plugin in self._adaptation_plugins:
+        for plugin in _routed(self._adaptation_routes, event):
             if plugin.match(event, state, result):
                 return plugin
         return None
@@ -195,3 +213,29 @@ class PluginRegistry:
                 ensure_ascii=False,
             )
         )
+
+
+def _domain_routes(plugins: Sequence[PluginT]) -> DomainRoutes[PluginT]:
+    """Precompute, per declared domain, the plugins that may serve it (in order)."""
+    declared: set[str] = set()
+    for plugin in plugins:
+        declared.update(getattr(plugin, "domains", None) or ())
+    by_domain = {
+        domain: tuple(plugin for plugin in plugins if _serves(plugin, domain))
+        for domain in declared
+    }
+    any_domain = tuple(plugin for plugin in plugins if not getattr(plugin, "domains", None))
+    return by_domain, any_domain
+
+
+def _serves(plugin: object, domain: str) -> bool:
+    domains = getattr(plugin, "domains", None)
+    return not domains or domain in domains
+
+
+def _routed(routes: DomainRoutes[PluginT], event: PCEEvent) -> tuple[PluginT, ...]:
+    by_domain, any_domain = routes
+    domain = event.payload.get("domain")
+    if isinstance(domain, str):
+        return by_domain.get(domain, any_domain)
+    return any_domain
@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
+
+from pce.core.ids import random_id
 
 
 @dataclass(slots=True)
@@ -16,7 +17,7 @@ class PCEEvent:
     source: str
     payload: dict[str, Any]
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
-    event_id: str = field(default_factory=lambda: str(uuid4()))
+    event_id: str = field(default_factory=random_id)
 
 
 @dataclass(slots=True)
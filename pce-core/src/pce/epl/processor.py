@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,17 +12,23 @@ from jsonschema import Draft202012Validator
 from pce.core.types import PCEEvent
 
 
+@lru_cache(maxsize=8)
+def _compiled_validator(schema_path: str) -> Draft202012Validator:
+    """Parse and bind the event schema once per path, shared by every EPL instance."""
+    schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
+    return Draft202012Validator(schema)
+
+
 class EventProcessingLayer:
     """Validates incoming events against JSON Schema."""
 
     def __init__(self, schema_path: str) -> None:
-        schema = json.loads(Path(schema_path).read_text(encoding="utf-8"))
-        self._validator = Draft202012Validator(schema)
+        self._validator = _compiled_validator(str(Path(schema_path).resolve()))
 
     def ingest(self, raw_event: dict[str, Any]) -> PCEEvent:
         """Validate raw event and convert to internal event envelope."""
-        errors = sorted(self._validator.iter_errors(raw_event), key=str)
-        if errors:
+        if not self._validator.is_valid(raw_event):
+            errors = sorted(self._validator.iter_errors(raw_event), key=str)
             details = "; ".join(err.message for err in errors)
             raise ValueError(f"Invalid event payload: {details}")
 
@@ -30,3 +37,7 @@ class EventProcessingLayer:
             source=str(raw_event["source"]),
             payload=dict(raw_event["payload"]),
         )
+
+    def ingest_fields(self, event_type: str, source: str, payload: dict[str, Any]) -> PCEEvent:
+        """Validate already-parsed envelope fields without a model-to-dict round-trip."""
+        return self.ingest({"event_type": event_type, "source": source, "payload": payload})
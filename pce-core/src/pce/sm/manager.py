@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import json
+import threading
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, cast
 
-from sqlalchemy import DateTime, Engine, String, Text, create_engine, desc, select
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+import orjson
+from sqlalchemy import (
+    DateTime,
+    Engine,
+    String,
+    Text,
+    create_engine,
+    desc,
+    event,
+    insert,
+    select,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 
 from pce.core.types import PCEEvent
 
@@ -89,51 +102,105 @@ class PluginKV(Base):
     )
 
 
+@dataclass(slots=True)
+class PipelineWrites:
+    """Writes staged by one or more pipeline runs, committed together by ``commit_writes``.
+
+    Rows are kept as column dicts so each table is written with one ``executemany``.
+    """
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+    actions: list[dict[str, Any]] = field(default_factory=list)
+    cci_snapshots: list[dict[str, Any]] = field(default_factory=list)
+    state: Mapping[str, Any] | None = None
+
+    def queue_event(self, event: PCEEvent) -> None:
+        """Stage one event memory row."""
+        self.events.append(_event_row(event))
+
+    def queue_action(self, **fields: Any) -> None:
+        """Stage one action row; accepts the keyword arguments of ``remember_action``."""
+        self.actions.append(_action_row(**fields))
+
+    def queue_cci(self, cci_id: str, cci: float, metrics: Mapping[str, Any]) -> None:
+        """Stage one CCI history snapshot."""
+        self.cci_snapshots.append(_cci_row(cci_id, cci, metrics))
+
+
 class StateManager:
     """CRUD gateway for persistent state and event storage."""
 
-    def __init__(self, db_url: str) -> None:
-        self._engine: Engine = create_engine(db_url, future=True)
+    def __init__(
+        self,
+        db_url: str,
+        *,
+        pool_size: int | None = None,
+        cache_state: bool = False,
+    ) -> None:
+        engine_options: dict[str, Any] = {"future": True}
+        if pool_size is not None:
+            engine_options["pool_size"] = pool_size
+        self._engine: Engine = create_engine(db_url, **engine_options)
+        if self._engine.dialect.name == "sqlite":
+            event.listen(self._engine, "connect", _configure_sqlite_connection)
+        self._session = sessionmaker(self._engine)
         Base.metadata.create_all(self._engine)
+        # Serialized snapshot last read or written here; only sound when this instance
+        # is the sole writer of the database, hence opt-in.
+        self._cache_state = cache_state
+        self._state_json: str | None = None
+        self._state_lock = threading.Lock()
 
     def load_state(self) -> dict[str, Any]:
-        """Load global cognitive state snapshot."""
-        with Session(self._engine) as session:
-            record = session.get(CognitiveState, "global")
-            if record is None:
-                return {}
-            loaded = json.loads(record.state_json)
-            return cast(dict[str, Any], loaded)
+        """Load global cognitive state snapshot (a fresh dict on every call)."""
+        state_json = self._state_json
+        if state_json is None:
+            with self._session() as session:
+                record = session.get(CognitiveState, "global")
+                if record is None:
+                    return {}
+                state_json = record.state_json
+            if self._cache_state:
+                with self._state_lock:
+                    if self._state_json is None:
+                        self._state_json = state_json
+        return cast(dict[str, Any], orjson.loads(state_json))
 
     def save_state(self, state: Mapping[str, Any]) -> None:
         """Persist global state snapshot atomically."""
-        with Session(self._engine) as session:
-            record = session.get(CognitiveState, "global")
-            serialized = json.dumps(dict(state), ensure_ascii=False)
-            if record is None:
-                record = CognitiveState(key="global", state_json=serialized)
-                session.add(record)
-            else:
-                record.state_json = serialized
-                record.updated_at = datetime.now(UTC)
+        with self._session() as session:
+            self._commit_state(session, _upsert_state(session, state))
+
+    def commit_writes(self, writes: PipelineWrites) -> None:
+        """Persist every staged row and the state snapshot in a single transaction."""
+        with self._session() as session:
+            for model, rows in (
+                (EventMemory, writes.events),
+                (ActionMemory, writes.actions),
+                (CCIHistory, writes.cci_snapshots),
+            ):
+                if rows:
+                    session.execute(insert(model), rows)
+            serialized = None if writes.state is None else _upsert_state(session, writes.state)
+            self._commit_state(session, serialized)
+
+    def _commit_state(self, session: Session, serialized: str | None) -> None:
+        if not self._cache_state or serialized is None:
+            session.commit()
+            return
+        with self._state_lock:
             session.commit()
+            self._state_json = serialized
 
     def remember_event(self, event: PCEEvent) -> None:
         """Append event into event memory table."""
-        with Session(self._engine) as session:
-            session.add(
-                EventMemory(
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                    source=event.source,
-                    payload_json=json.dumps(event.payload, ensure_ascii=False),
-                )
-            )
+        with self._session() as session:
+            session.add(EventMemory(**_event_row(event)))
             session.commit()
 
     def recent_event_count(self) -> int:
         """Get event count for coherence/feedback metrics."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             result = session.execute(select(EventMemory.event_id))
             return len(result.scalars().all())
 
@@ -152,26 +219,25 @@ class StateManager:
         metadata: Mapping[str, Any] | None = None,
     ) -> None:
         """Append action decision and execution outcome for CCI traceability."""
-        with Session(self._engine) as session:
-            session.add(
-                ActionMemory(
-                    action_id=action_id,
-                    event_id=event_id,
-                    action_type=action_type,
-                    priority=priority,
-                    value_score=value_score,
-                    expected_impact=expected_impact,
-                    observed_impact=observed_impact,
-                    respected_values=respected_values,
-                    violated_values_json=json.dumps(violated_values or []),
-                    metadata_json=json.dumps(dict(metadata or {}), ensure_ascii=False),
-                )
+        with self._session() as session:
+            row = _action_row(
+                action_id=action_id,
+                event_id=event_id,
+                action_type=action_type,
+                priority=priority,
+                value_score=value_score,
+                expected_impact=expected_impact,
+                observed_impact=observed_impact,
+                respected_values=respected_values,
+                violated_values=violated_values,
+                metadata=metadata,
             )
+            session.add(ActionMemory(**row))
             session.commit()
 
     def get_recent_actions(self, n: int) -> list[dict[str, Any]]:
         """Return most recent action traces ordered from oldest to newest."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             rows = session.execute(
                 select(ActionMemory).order_by(desc(ActionMemory.created_at)).limit(max(0, n))
             ).scalars()
@@ -188,34 +254,54 @@ class StateManager:
                 "expected_impact": row.expected_impact,
                 "observed_impact": row.observed_impact,
                 "respected_values": row.respected_values,
-                "violated_values": json.loads(row.violated_values_json),
-                "metadata": json.loads(row.metadata_json),
+                "violated_values": orjson.loads(row.violated_values_json),
+                "metadata": orjson.loads(row.metadata_json),
                 "created_at": row.created_at.isoformat(),
             }
             for row in recent
         ]
 
-    def save_cci_snapshot(self, cci_id: str, cci: float, metrics: Mapping[str, Any]) -> None:
-        """Persist CCI and its components for historical analysis."""
-        with Session(self._engine) as session:
-            session.add(
-                CCIHistory(
-                    cci_id=cci_id,
-                    cci=cci,
-                    metrics_json=json.dumps(dict(metrics), ensure_ascii=False),
+    def get_recent_action_signals(self, n: int) -> list[tuple[int, float, float, bool, bool]]:
+        """Return CCI inputs of the most recent actions, ordered from oldest to newest.
+
+        Each row is ``(priority, expected_impact, observed_impact, respected_values,
+        has_violations)``; only these columns are selected and no JSON is decoded.
+        """
+        with self._session() as session:
+            result = session.execute(
+                select(
+                    ActionMemory.priority,
+                    ActionMemory.expected_impact,
+                    ActionMemory.observed_impact,
+                    ActionMemory.respected_values,
+                    ActionMemory.violated_values_json,
                 )
+                .order_by(desc(ActionMemory.created_at))
+                .limit(max(0, n))
             )
+            rows = list(result)
+
+        rows.reverse()
+        return [
+            (priority, expected, observed, respected, violated_json != _EMPTY_VIOLATIONS_JSON)
+            for priority, expected, observed, respected, violated_json in rows
+        ]
+
+    def save_cci_snapshot(self, cci_id: str, cci: float, metrics: Mapping[str, Any]) -> None:
+        """Persist CCI and its components for historical analysis."""
+        with self._session() as session:
+            session.add(CCIHistory(**_cci_row(cci_id, cci, metrics)))
             session.commit()
 
     def get_cci_history(self) -> list[dict[str, Any]]:
         """Load full CCI history ordered by creation time."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             rows = session.execute(select(CCIHistory).order_by(CCIHistory.created_at)).scalars()
             return [
                 {
                     "cci_id": row.cci_id,
                     "cci": row.cci,
-                    "metrics": json.loads(row.metrics_json),
+                    "metrics": orjson.loads(row.metrics_json),
                     "created_at": row.created_at.isoformat(),
                 }
                 for row in rows
@@ -246,17 +332,17 @@ class StateManager:
 
     def plugin_get_json(self, namespace: str, key: str) -> Any | None:
         """Load one plugin-scoped JSON value."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             row = session.get(PluginKV, {"namespace": namespace, "key": key})
             if row is None:
                 return None
-            return json.loads(row.value_json)
+            return orjson.loads(row.value_json)
 
     def plugin_set_json(self, namespace: str, key: str, value: Any) -> None:
         """Persist one plugin-scoped JSON value."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             row = session.get(PluginKV, {"namespace": namespace, "key": key})
-            serialized = json.dumps(value, ensure_ascii=False)
+            serialized = _dump_json(value)
             if row is None:
                 session.add(PluginKV(namespace=namespace, key=key, value_json=serialized))
             else:
@@ -266,7 +352,7 @@ class StateManager:
 
     def plugin_delete_prefix(self, namespace: str, key_prefix: str) -> int:
         """Delete plugin keys with a given prefix and return deleted count."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             rows = session.execute(
                 select(PluginKV).where(
                     PluginKV.namespace == namespace,
@@ -286,7 +372,7 @@ class StateManager:
         limit: int = 1000,
     ) -> list[tuple[str, Any]]:
         """List plugin keys + JSON values for a namespace/prefix window."""
-        with Session(self._engine) as session:
+        with self._session() as session:
             rows = session.execute(
                 select(PluginKV)
                 .where(
@@ -296,4 +382,96 @@ class StateManager:
                 .order_by(PluginKV.key)
                 .limit(max(1, limit))
             ).scalars()
-            return [(row.key, json.loads(row.value_json)) for row in rows]
+            return [(row.key, orjson.loads(row.value_json)) for row in rows]
+
+
+def _dump_json(value: Any) -> str:
+    """Serialize to compact JSON text; non-string dict keys are stringified like ``json``.
+
+    Unlike ``json``, NaN and ±Infinity are written as ``null``. Integers wider than 64
+    bits, which orjson rejects, are serialized by ``json`` instead and read back by
+    ``orjson.loads`` as floats; such values must not also hold NaN or ±Infinity.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError as exc:
+        try:
+            return json.dumps(value, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+        except (TypeError, ValueError):
+            raise exc from None
+
+
+_EMPTY_VIOLATIONS_JSON = _dump_json([])
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Use WAL with relaxed fsync: commits stay durable across crashes of the process."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _upsert_state(session: Session, state: Mapping[str, Any]) -> str:
+    record = session.get(CognitiveState, "global")
+    serialized = _dump_json(dict(state))
+    if record is None:
+        session.add(CognitiveState(key="global", state_json=serialized))
+    else:
+        record.state_json = serialized
+        record.updated_at = datetime.now(UTC)
+    return serialized
+
+
+def _event_row(event: PCEEvent) -> dict[str, Any]:
+    return {
+        "event_id": event.event_id,
+        "event_type": event.event_type,
+        "source": event.source,
+        "payload_json": _dump_json(event.payload),
+    }
+
+
+def _action_row(
+    *,
+    action_id: str,
+    event_id: str,
+    action_type: str,
+    priority: int,
+    value_score: float,
+    expected_impact: float,
+    observed_impact: float,
+    respected_values: bool,
+    violated_values: list[str] | None = None,
+    metadata: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    return {
+        "action_id": action_id,
+        "event_id": event_id,
+        "action_type": action_type,
+        "priority": priority,
+        "value_score": value_score,
+        "expected_impact": expected_impact,
+        "observed_impact": observed_impact,
+        "respected_values": respected_values,
+        "violated_values_json": _dump_json(violated_values or []),
+        "metadata_json": _dump_json(dict(metadata or {})),
+    }
+
+
+def _cci_row(cci_id: str, cci: float, metrics: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "cci_id": cci_id,
+        "cci": cci,
+        "metrics_json": _dump_json(dict(metrics)),
+    }
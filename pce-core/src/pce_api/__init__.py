@@ -1,5 +1,14 @@
 """Importable FastAPI package entrypoint for PCE API."""
 
-from pce_api.main import app
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``app`` lazily from :mod:`pce_api.main`."""
+    if name == "app":
+        from pce_api.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import AsyncIterator
-from typing import Any
-from uuid import uuid4
-
-from fastapi import FastAPI, HTTPException, Query, Request
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cache
+from typing import Annotated, Any
+
+import orjson
+from fastapi import BackgroundTasks, Body, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from llm_assistant import (
     AssistantAdaptationPlugin,
@@ -21,14 +23,15 @@ from llm_assistant import (
 from llm_assistant.config import load_openrouter_credentials
 from pce.afs.feedback import AdaptiveFeedbackSystem
 from pce.ao.orchestrator import ActionOrchestrator
-from pce.core.cci import CCIMetric
+from pce.core.cci import CCIMetric, CCIWindow
 from pce.core.config import Settings
+from pce.core.ids import time_ordered_id
 from pce.core.plugins import PluginRegistry
 from pce.core.types import ExecutionResult, PCEEvent
 from pce.de.engine import DecisionEngine
 from pce.epl.processor import EventProcessingLayer
 from pce.isi.integrator import InternalStateIntegrator
-from pce.sm.manager import StateManager
+from pce.sm.manager import PipelineWrites, StateManager
 from pce.vel.evaluator import ValueEvaluationLayer
 from pce_os import (
     ApprovalGate,
@@ -38,7 +41,11 @@ from pce_os import (
     RobotProjectState,
     RobotTwinStore,
 )
-from pce_os.transcript import append_transcript_item, items_since, read_transcript
+from pce_os.transcript import (
+    append_transcript_items,
+    items_since,
+    transcript_cursor,
+)
 from pydantic import BaseModel, Field
 from rover_plugins import (
     RoboticsAdaptationPlugin,
@@ -52,6 +59,9 @@ from agents.rover.app import runtime as rover_runtime
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on events accepted by one /events/batch request.
+_MAX_BATCH_EVENTS = 100
+
 
 class EventIn(BaseModel):
     """Raw event API input model."""
@@ -81,22 +91,88 @@ class OSStateOut(BaseModel):
     last_n_audit_trail: list[dict[str, Any]]
 
 
-def _sse_format(event: str, data: dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+def _trusted_event_in(event_payload: dict[str, Any]) -> EventIn:
+    """Wrap a control-plane event without re-validation; EPL still checks the schema."""
+    return EventIn.model_construct(
+        event_type=event_payload["event_type"],
+        source=event_payload["source"],
+        payload=event_payload["payload"],
+    )
+
+
+def current_state(request: Request) -> dict[str, Any]:
+    """Load the persisted state once per HTTP request and share it across dependencies."""
+    snapshot: dict[str, Any] | None = getattr(request.state, "state_snapshot", None)
+    if snapshot is None:
+        snapshot = request.app.state.sm.load_state()
+        request.state.state_snapshot = snapshot
+    return snapshot
+
+
+StateSnapshot = Annotated[dict[str, Any], Depends(current_state)]
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineDeps:
+    """Pipeline and plugin collaborators wired once in ``build_app`` and injected per request."""
+
+    sm: StateManager
+    epl: EventProcessingLayer
+    isi: InternalStateIntegrator
+    vel: ValueEvaluationLayer
+    de: DecisionEngine
+    ao: ActionOrchestrator
+    afs: AdaptiveFeedbackSystem
+    cci_metric: CCIMetric
+    plugin_registry: PluginRegistry
+    approval_gate: ApprovalGate
+    assistant_decision: AssistantDecisionPlugin
+    robotics_storage: RoboticsStorage
+    assistant_storage: AssistantStorage
+
+
+async def get_deps(request: Request) -> PipelineDeps:
+    """Return the app's dependency container (async, so no threadpool hop)."""
+    deps: PipelineDeps = request.app.state.deps
+    return deps
+
+
+Deps = Annotated[PipelineDeps, Depends(get_deps)]
+
+
+def _sse_format(event: str, data: dict[str, Any]) -> bytes:
+    encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + encoded + b"\n\n"
+
+
+SSEQueue = asyncio.Queue[dict[str, Any]]
 
 
 def _broadcast_sse(app: FastAPI, event: str, payload: dict[str, Any]) -> None:
-    queues = getattr(app.state, "os_stream_queues", [])
-    for queue in list(queues):
+    # Subscribers are swapped copy-on-write, so iterating the current frozenset is safe
+    # without a per-broadcast copy; saturated queues are unsubscribed after the fan-out.
+    queues: frozenset[SSEQueue] = getattr(app.state, "os_stream_queues", frozenset())
+    if not queues:
+        return
+    message = {"event": event, "data": payload}
+    dead: set[SSEQueue] = set()
+    for queue in queues:
         try:
-            queue.put_nowait({"event": event, "data": payload})
+            queue.put_nowait(message)
         except asyncio.QueueFull:
-            logger.warning("sse_queue_full dropping event=%s", event)
+            logger.warning("sse_queue_full dropping subscriber event=%s", event)
+            dead.add(queue)
+    if dead:
+        app.state.os_stream_queues = app.state.os_stream_queues - dead
 
 
-def _append_transcript_and_emit(
-    request: Request,
-    state: dict[str, object],
+TranscriptBatch = list[tuple[str, dict[str, Any]]]
+# Transcript items waiting to be broadcast as ``(event_name, item)`` once their run commits.
+SSEFrames = list[tuple[str, dict[str, Any]]]
+
+
+def _stage_transcript(
+    batch: TranscriptBatch,
     *,
     kind: str,
     payload: dict[str, Any],
@@ -104,22 +180,49 @@ def _append_transcript_and_emit(
     decision_id: str = "",
     agent: str = "",
     event_name: str,
-) -> tuple[dict[str, object], dict[str, Any]]:
-    next_state, item = append_transcript_item(
-        state,
-        kind=kind,
-        payload=payload,
-        correlation_id=correlation_id,
-        decision_id=decision_id,
-        agent=agent,
+) -> None:
+    record = {
+        "kind": kind,
+        "payload": payload,
+        "correlation_id": correlation_id,
+        "decision_id": decision_id,
+        "agent": agent,
+    }
+    batch.append((event_name, record))
+
+
+def _stage_approval_update(batch: TranscriptBatch, record: dict[str, Any]) -> None:
+    _stage_transcript(
+        batch,
+        kind="approval_updated",
+        payload=record,
+        correlation_id=str(record.get("metadata", {}).get("event_id", record.get("decision_id", ""))),
+        decision_id=str(record.get("decision_id", "")),
+        event_name="os.approval_updated",
     )
-    _broadcast_sse(request.app, event_name, item)
-    return next_state, item
+
+
+def _commit_transcript(
+    state: dict[str, object],
+    batch: TranscriptBatch,
+    frames: SSEFrames,
+) -> tuple[dict[str, object], list[dict[str, Any]]]:
+    """Write staged transcript records with one state copy, queueing their SSE frames."""
+    next_state, items = append_transcript_items(state, [record for _, record in batch])
+    frames.extend((event_name, item) for (event_name, _), item in zip(batch, items, strict=True))
+    return next_state, items
+
+
+def _emit_sse(app: FastAPI, frames: SSEFrames) -> None:
+    """Fan committed transcript items out to SSE subscribers."""
+    if app.state.os_stream_queues:
+        for event_name, item in frames:
+            _broadcast_sse(app, event_name, item)
 
 
 def load_twin(current_state: dict[str, object]) -> RobotProjectState:
-    """Load robotics twin from current request state snapshot."""
-    return RobotTwinStore.from_state(current_state)
+    """Load robotics twin from current request state snapshot (shared, read-only)."""
+    return RobotTwinStore.get_cached(current_state)
 
 
 def apply_os_event_to_twin(
@@ -138,29 +241,150 @@ def apply_os_event_to_twin(
 
 
 def _budget_remaining(state: dict[str, object]) -> float:
-    twin = RobotTwinStore.from_state(state)
+    twin = load_twin(state)
     return float(twin.budget_remaining)
 
 
+def _persist(
+    request: Request,
+    background_tasks: BackgroundTasks | None,
+    write: Callable[..., None],
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """Run a persistence write inline, or after the response when sync persistence is off."""
+    if background_tasks is None or request.app.state.sync_persistence:
+        write(*args, **kwargs)
+        return
+    background_tasks.add_task(write, *args, **kwargs)
+
+
 def _run_pipeline(
     request: Request,
+    deps: PipelineDeps,
     event_in: EventIn,
     *,
     initial_state: dict[str, object] | None = None,
+    background_tasks: BackgroundTasks | None = None,
+    transcript: TranscriptBatch | None = None,
 ) -> dict[str, object]:
-    """End-to-end event processing pipeline entrypoint with plugin dispatch."""
-    app_state = request.app.state
+    """End-to-end event processing pipeline entrypoint with plugin dispatch.
+
+    ``transcript`` holds records staged by the caller; they are committed ahead of the
+    event's own records and broadcast with them after the commit.
+    """
+    event = _ingest(deps, event_in)
+    state = initial_state if initial_state is not None else deps.sm.load_state()
+    writes = PipelineWrites()
+    reply_ids: list[str] = []
+    frames: SSEFrames = []
     try:
-        event = app_state.epl.ingest(event_in.model_dump())
+        response, _ = _pipeline_step(
+            deps,
+            event,
+            state,
+            writes,
+            deps.cci_metric.load_window(deps.sm),
+            reply_ids,
+            frames,
+            transcript=transcript,
+        )
+    except BaseException:
+        _discard_deferred_replies(deps, reply_ids)
+        raise
+    _persist(request, background_tasks, deps.sm.commit_writes, writes)
+    _emit_sse(request.app, frames)
+    _schedule_deferred_replies(deps, background_tasks, reply_ids)
+    return response
+
+
+def _run_pipeline_batch(
+    request: Request,
+    deps: PipelineDeps,
+    events_in: list[EventIn],
+    *,
+    initial_state: dict[str, object],
+    background_tasks: BackgroundTasks | None = None,
+) -> list[dict[str, object]]:
+    """Fold several events through the pipeline and persist all of them in one commit.
+
+    Each event sees the state and CCI window left by the previous one, exactly as if
+    they had been posted one by one. Every event is validated before any is processed,
+    so an invalid event rejects the whole batch without side effects.
+    """
+    events = [_ingest(deps, event_in) for event_in in events_in]
+    state = initial_state
+    writes = PipelineWrites()
+    cci_window = deps.cci_metric.load_window(deps.sm)
+    responses: list[dict[str, object]] = []
+    reply_ids: list[str] = []
+    frames: SSEFrames = []
+    try:
+        for event in events:
+            response, state = _pipeline_step(
+                deps, event, state, writes, cci_window, reply_ids, frames
+            )
+            responses.append(response)
+    except BaseException:
+        _discard_deferred_replies(deps, reply_ids)
+        raise
+    _persist(request, background_tasks, deps.sm.commit_writes, writes)
+    _emit_sse(request.app, frames)
+    _schedule_deferred_replies(deps, background_tasks, reply_ids)
+    return responses
+
+
+def _ingest(deps: PipelineDeps, event_in: EventIn) -> PCEEvent:
+    try:
+        return deps.epl.ingest_fields(event_in.event_type, event_in.source, event_in.payload)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    state = initial_state if initial_state is not None else app_state.sm.load_state()
+
+def _schedule_deferred_replies(
+    deps: PipelineDeps,
+    background_tasks: BackgroundTasks | None,
+    reply_ids: list[str],
+) -> None:
+    """Generate deferred assistant replies once their events are committed."""
+    for reply_id in reply_ids:
+        if background_tasks is None:
+            deps.assistant_decision.complete_deferred_reply(reply_id)
+        else:
+            background_tasks.add_task(deps.assistant_decision.complete_deferred_reply, reply_id)
+
+
+def _discard_deferred_replies(deps: PipelineDeps, reply_ids: list[str]) -> None:
+    """Drop deferred replies planned by a run that was rejected before committing."""
+    for reply_id in reply_ids:
+        deps.assistant_decision.discard_deferred_reply(reply_id)
+
+
+def _pipeline_step(
+    deps: PipelineDeps,
+    event: PCEEvent,
+    state: dict[str, object],
+    writes: PipelineWrites,
+    cci_window: CCIWindow,
+    reply_ids: list[str],
+    frames: SSEFrames,
+    *,
+    transcript: TranscriptBatch | None = None,
+) -> tuple[dict[str, object], dict[str, object]]:
+    """Process one ingested event against ``state``, staging its rows into ``writes``.
+
+    Returns the API response and the adapted state; ``cci_window`` is advanced in place
+    and ``transcript`` records staged by the caller are committed first.
+    Deferred assistant reply ids go to ``reply_ids`` and transcript SSE frames to
+    ``frames``, for the caller to handle after the commit.
+    """
     correlation_id = str(event.payload.get("correlation_id", event.event_id))
+    is_feedback = event.event_type.startswith("feedback.")
+    is_os_robotics = event.payload.get("domain") == "os.robotics"
+    transcript_batch: TranscriptBatch = list(transcript or ())
 
-    state, _ = _append_transcript_and_emit(
-        request,
-        state,
+    _stage_transcript(
+        transcript_batch,
         kind="event_ingested",
         payload={"event_id": event.event_id, "event_type": event.event_type, "source": event.source},
         correlation_id=correlation_id,
@@ -168,52 +392,34 @@ def _run_pipeline(
         event_name="os.event_ingested",
     )
 
-    updated_state = app_state.isi.integrate(state, event)
-    app_state.sm.remember_event(event)
+    updated_state = deps.isi.integrate(state, event)
+    # Event, state, action and CCI rows are committed together in one transaction.
+    writes.queue_event(event)
 
-    value_score = app_state.plugin_registry.evaluate(
+    value_score = deps.plugin_registry.evaluate(
         event,
         updated_state,
-        fallback=app_state.vel.evaluate_event,
+        fallback=deps.vel.evaluate_event,
     )
 
-    cci, components = app_state.cci_metric.from_state_manager(app_state.sm)
-    cci_payload = {
-        "decision_consistency": components.decision_consistency,
-        "priority_stability": components.priority_stability,
-        "contradiction_rate": components.contradiction_rate,
-        "predictive_accuracy": components.predictive_accuracy,
-    }
-    plan = app_state.plugin_registry.deliberate(
+    cci, components = deps.cci_metric.from_window(cci_window)
+    plan = deps.plugin_registry.deliberate(
         event,
         updated_state,
         value_score,
         cci,
-        fallback=app_state.de.deliberate,
+        fallback=deps.de.deliberate,
     )
 
     explain = plan.metadata.get("explain")
     if isinstance(explain, dict):
-        explain["cci"] = {"score": cci, "components": cci_payload}
+        explain["cci"] = {"score": cci, "components": components.as_dict()}
+        # Orchestrated plugins emit complete transcript records tagged with their SSE name.
         for item in explain.get("agent_transcript", []):
-            if not isinstance(item, dict):
-                continue
-            event_name = "os.agent_message"
-            if item.get("kind") == "actions_proposed":
-                event_name = "os.actions_proposed"
-            updated_state, _ = _append_transcript_and_emit(
-                request,
-                updated_state,
-                kind=str(item.get("kind", "agent_message")),
-                payload=item.get("payload", {}),
-                correlation_id=str(item.get("correlation_id", correlation_id)),
-                decision_id=str(item.get("decision_id", event.event_id)),
-                agent=str(item.get("agent", "")),
-                event_name=event_name,
-            )
+            transcript_batch.append((item["event_name"], item))
 
     state_for_adaptation = updated_state
-    if event.event_type.startswith("feedback."):
+    if is_feedback:
         result = ExecutionResult(
             action_type=event.event_type,
             success=True,
@@ -222,21 +428,20 @@ def _run_pipeline(
             metadata={"feedback": event.payload},
         )
     else:
-        needs_approval, rationale = app_state.approval_gate.decide_if_requires_approval(
+        needs_approval, rationale = deps.approval_gate.decide_if_requires_approval(
             plan,
             updated_state,
         )
         if needs_approval and event.event_type != "purchase.completed":
-            pending, state_for_adaptation = app_state.approval_gate.enqueue_pending_approval(
+            pending, state_for_adaptation = deps.approval_gate.enqueue_pending_approval(
                 decision_id=event.event_id,
                 plan=plan,
                 snapshot_state=updated_state,
                 state=updated_state,
                 metadata={"event_id": event.event_id, "gate_rationale": rationale},
             )
-            state_for_adaptation, _ = _append_transcript_and_emit(
-                request,
-                state_for_adaptation,
+            _stage_transcript(
+                transcript_batch,
                 kind="approval_created",
                 payload=pending,
                 correlation_id=correlation_id,
@@ -251,56 +456,65 @@ def _run_pipeline(
                 metadata={"approval_pending": True, "approval_id": pending["approval_id"]},
             )
         else:
-            result = app_state.plugin_registry.execute(plan, fallback=app_state.ao.execute)
+            result = deps.plugin_registry.execute(plan, fallback=deps.ao.execute)
 
-    adapted_state = app_state.plugin_registry.adapt(
+    adapted_state = deps.plugin_registry.adapt(
         state_for_adaptation,
         event,
         result,
-        fallback=app_state.afs.adapt,
+        fallback=deps.afs.adapt,
     )
 
-    if str(event.payload.get("domain")) == "os.robotics":
+    if is_os_robotics:
         twin = load_twin(adapted_state)
         twin_next = apply_os_event_to_twin(twin, event)
         adapted_state = RobotTwinStore.write_into_state_slice(adapted_state, twin_next)
 
-    adapted_state, final_item = _append_transcript_and_emit(
-        request,
-        adapted_state,
+    _stage_transcript(
+        transcript_batch,
         kind="state_updated",
         payload={"event_id": event.event_id, "action_type": plan.action_type},
         correlation_id=correlation_id,
         decision_id=event.event_id,
         event_name="os.state_updated",
     )
+    adapted_state, transcript_items = _commit_transcript(adapted_state, transcript_batch, frames)
 
-    app_state.sm.save_state(adapted_state)
+    writes.state = adapted_state
 
     violated_values = [] if value_score >= 0.6 else ["long_term_coherence"]
     respected_values = len(violated_values) == 0
 
-    app_state.sm.remember_action(
-        action_id=str(uuid4()),
+    expected_impact = float(plan.metadata.get("expected_impact", 0.5))
+    writes.queue_action(
+        action_id=time_ordered_id(),
         event_id=event.event_id,
         action_type=plan.action_type,
         priority=plan.priority,
         value_score=value_score,
-        expected_impact=float(plan.metadata.get("expected_impact", 0.5)),
+        expected_impact=expected_impact,
         observed_impact=result.observed_impact,
         respected_values=respected_values,
         violated_values=violated_values,
         metadata={"rationale": plan.rationale, "plan_metadata": plan.metadata},
     )
 
-    cci, components = app_state.cci_metric.from_state_manager(app_state.sm)
-    cci_payload = {
-        "decision_consistency": components.decision_consistency,
-        "priority_stability": components.priority_stability,
-        "contradiction_rate": components.contradiction_rate,
-        "predictive_accuracy": components.predictive_accuracy,
-    }
-    app_state.sm.save_cci_snapshot(cci_id=str(uuid4()), cci=cci, metrics=cci_payload)
+    cci, components = deps.cci_metric.update_with_action(
+        cci_window,
+        {
+            "priority": plan.priority,
+            "expected_impact": expected_impact,
+            "observed_impact": result.observed_impact,
+            "respected_values": respected_values,
+            "violated_values": violated_values,
+        },
+    )
+    cci_payload = components.as_dict()
+    writes.queue_cci(time_ordered_id(), cci, cci_payload)
+
+    reply_id = plan.metadata.get("reply_id")
+    if plan.metadata.get("llm_pending") and isinstance(reply_id, str):
+        reply_ids.append(reply_id)
 
     action_payload = plan.metadata.get("action_payload", plan.action_type)
     response: dict[str, object] = {
@@ -313,46 +527,62 @@ def _run_pipeline(
         "action": action_payload,
         "metadata": plan.metadata,
         "success": result.success,
-        "cursor": final_item["cursor"],
+        "cursor": transcript_items[-1]["cursor"],
     }
 
-    if event.event_type.startswith("feedback."):
+    if is_feedback:
         q_update = adapted_state.get("robotics_rl")
         response["updated"] = bool(q_update)
-        response["epsilon"] = q_update.get("epsilon") if isinstance(q_update, dict) else None
-        response["q_update"] = q_update if isinstance(q_update, dict) else {}
+        if isinstance(q_update, dict):
+            response["epsilon"] = q_update.get("epsilon")
+            response["q_update"] = q_update
+        else:
+            response["epsilon"] = None
+            response["q_update"] = {}
         assistant_learning = adapted_state.get("assistant_learning")
         if isinstance(assistant_learning, dict):
             response["assistant_learning"] = assistant_learning
 
-    return response
+    return response, adapted_state
 
 
-def _os_metrics(state: dict[str, object], cci: float) -> dict[str, Any]:
+def _os_metrics(state: dict[str, object], cci: float, approval_counts: dict[str, int]) -> dict[str, Any]:
     twin = load_twin(state)
-    approvals = state.get("pce_os", {}).get("pending_approvals", []) if isinstance(state.get("pce_os"), dict) else []
-    total = len([item for item in approvals if isinstance(item, dict)])
-    approved = len([item for item in approvals if isinstance(item, dict) and item.get("status") == "approved"])
+    total = sum(approval_counts.values())
+    approved = approval_counts.get("approved", 0)
     return {
         "budget_remaining": float(twin.budget_remaining),
         "risk_level": twin.risk_level,
         "projected_vs_actual": {
             "projected_cost": float(twin.cost_projection.projected_total_cost),
-            "actual_purchase_spend": sum(float(i.total_cost) for i in twin.purchase_history),
+            "actual_purchase_spend": float(twin.actual_purchase_spend),
         },
         "approval_rate": (approved / total) if total > 0 else 0.0,
         "cci": cci,
     }
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled outbound HTTP connections and agent threads when the app shuts down."""
+    yield
+    app.state.os_decision.orchestrator.close()
+    await app.state.assistant_client.aclose()
+
+
 def build_app(state_manager: StateManager | None = None) -> FastAPI:
     """Build FastAPI app with an explicit dependency container in ``app.state``."""
     settings = Settings()
-    sm = state_manager or StateManager(settings.db_url)
+    sm = state_manager or StateManager(
+        settings.db_url,
+        pool_size=settings.db_pool_size,
+        cache_state=settings.state_cache,
+    )
 
-    app = FastAPI(title="PCE API", version="0.1.0")
+    app = FastAPI(title="PCE API", version="0.1.0", lifespan=_lifespan)
 
     app.state.sm = sm
+    app.state.sync_persistence = settings.sync_persistence
     app.state.epl = EventProcessingLayer(settings.event_schema_path)
     app.state.isi = InternalStateIntegrator()
     app.state.vel = ValueEvaluationLayer()
@@ -360,13 +590,14 @@ def build_app(state_manager: StateManager | None = None) -> FastAPI:
     app.state.ao = ActionOrchestrator()
     app.state.afs = AdaptiveFeedbackSystem()
     app.state.cci_metric = CCIMetric()
-    app.state.os_stream_queues: list[asyncio.Queue[dict[str, Any]]] = []
+    app.state.os_stream_queues: frozenset[SSEQueue] = frozenset()
 
     app.state.plugin_registry = PluginRegistry()
     app.state.robotics_storage = RoboticsStorage(sm)
     app.state.assistant_storage = AssistantStorage(sm)
     app.state.approval_gate = ApprovalGate()
     app.state.assistant_value_model = AssistantValueModelPlugin()
+    app.state.os_decision = OSRoboticsDecisionPlugin()
 
     openrouter_credentials = load_openrouter_credentials()
     app.state.assistant_client = OpenRouterClient(
@@ -378,58 +609,112 @@ def build_app(state_manager: StateManager | None = None) -> FastAPI:
         title=openrouter_credentials["title"],
     )
 
+    app.state.assistant_decision = AssistantDecisionPlugin(
+        app.state.assistant_storage,
+        app.state.assistant_value_model,
+        app.state.assistant_client,
+        defer_replies=settings.defer_assistant_replies,
+    )
+    app.state.deps = PipelineDeps(
+        sm=sm,
+        epl=app.state.epl,
+        isi=app.state.isi,
+        vel=app.state.vel,
+        de=app.state.de,
+        ao=app.state.ao,
+        afs=app.state.afs,
+        cci_metric=app.state.cci_metric,
+        plugin_registry=app.state.plugin_registry,
+        approval_gate=app.state.approval_gate,
+        assistant_decision=app.state.assistant_decision,
+        robotics_storage=app.state.robotics_storage,
+        assistant_storage=app.state.assistant_storage,
+    )
+
     app.state.plugin_registry.register_value_model(RoboticsValueModelPlugin())
     app.state.plugin_registry.register_value_model(app.state.assistant_value_model)
     app.state.plugin_registry.register_value_model(OSRoboticsValueModelPlugin())
     app.state.plugin_registry.register_decision(RoboticsDecisionPlugin(app.state.robotics_storage))
-    app.state.plugin_registry.register_decision(OSRoboticsDecisionPlugin())
-    app.state.plugin_registry.register_decision(
-        AssistantDecisionPlugin(
-            app.state.assistant_storage,
-            app.state.assistant_value_model,
-            app.state.assistant_client,
-        )
-    )
+    app.state.plugin_registry.register_decision(app.state.os_decision)
+    app.state.plugin_registry.register_decision(app.state.assistant_decision)
     app.state.plugin_registry.register_adaptation(RoboticsAdaptationPlugin(app.state.robotics_storage))
     app.state.plugin_registry.register_adaptation(OSRoboticsAdaptationPlugin())
     app.state.plugin_registry.register_adaptation(AssistantAdaptationPlugin(app.state.assistant_storage))
 
     @app.post("/events")
     @app.post("/v1/events")
-    def process_event(request: Request, event_in: EventIn) -> dict[str, object]:
-        return _run_pipeline(request, event_in)
+    def process_event(
+        request: Request,
+        event_in: EventIn,
+        state: StateSnapshot,
+        background_tasks: BackgroundTasks,
+        deps: Deps,
+    ) -> dict[str, object]:
+        return _run_pipeline(
+            request,
+            deps,
+            event_in,
+            initial_state=state,
+            background_tasks=background_tasks,
+        )
+
+    @app.post("/events/batch")
+    @app.post("/v1/events/batch")
+    def process_event_batch(
+        request: Request,
+        events_in: Annotated[list[EventIn], Body(max_length=_MAX_BATCH_EVENTS)],
+        state: StateSnapshot,
+        background_tasks: BackgroundTasks,
+        deps: Deps,
+    ) -> dict[str, object]:
+        results = _run_pipeline_batch(
+            request,
+            deps,
+            events_in,
+            initial_state=state,
+            background_tasks=background_tasks,
+        )
+        return {"results": results}
 
     @app.get("/v1/os/state", response_model=OSStateOut)
-    def get_v1_os_state(request: Request, limit: int = Query(30, ge=1, le=200)) -> dict[str, Any]:
-        state = request.app.state.sm.load_state()
+    def get_v1_os_state(
+        state: StateSnapshot,
+        deps: Deps,
+        limit: int = Query(30, ge=1, le=200),
+    ) -> dict[str, Any]:
         twin = load_twin(state)
-        cci, _ = request.app.state.cci_metric.from_state_manager(request.app.state.sm)
-        approvals = request.app.state.approval_gate.list_all(state)
-        transcript = read_transcript(state)
+        cci, _ = deps.cci_metric.from_state_manager(deps.sm)
+        approval_counts = deps.approval_gate.approval_counts(state)
+        pending_count = approval_counts.get("pending", 0)
         policy_state = {
-            "pending_count": len([a for a in approvals if a.get("status") == "pending"]),
-            "resolved_count": len([a for a in approvals if a.get("status") != "pending"]),
-            "transcript_cursor": transcript["cursor"],
+            "pending_count": pending_count,
+            "resolved_count": sum(approval_counts.values()) - pending_count,
+            "transcript_cursor": transcript_cursor(state),
         }
         return {
-            "twin_snapshot": twin.model_dump(mode="json"),
-            "os_metrics": _os_metrics(state, cci),
+            "twin_snapshot": RobotTwinStore.json_snapshot(twin),
+            "os_metrics": _os_metrics(state, cci, approval_counts),
             "policy_state": policy_state,
             "last_n_audit_trail": twin.audit_trail[-limit:],
         }
 
     @app.get("/v1/os/approvals")
     @app.get("/os/approvals")
-    def get_os_approvals(request: Request) -> dict[str, object]:
-        state = request.app.state.sm.load_state()
-        approvals = request.app.state.approval_gate.list_all(state)
+    async def get_os_approvals(state: StateSnapshot, deps: Deps) -> dict[str, object]:
+        approvals = deps.approval_gate.list_all(state)
         return {"items": approvals, "pending": [item for item in approvals if item.get("status") == "pending"]}
 
     @app.post("/v1/os/approvals/{approval_id}/approve")
     @app.post("/os/approvals/{approval_id}/approve")
-    def approve_os_request(request: Request, approval_id: str, body: ApprovalDecisionIn) -> dict[str, object]:
-        current_state = request.app.state.sm.load_state()
-        gate = request.app.state.approval_gate
+    def approve_os_request(
+        request: Request,
+        approval_id: str,
+        body: ApprovalDecisionIn,
+        current_state: StateSnapshot,
+        background_tasks: BackgroundTasks,
+        deps: Deps,
+    ) -> dict[str, object]:
+        gate = deps.approval_gate
 
         try:
             approval = gate.get_approval(current_state, approval_id)
@@ -447,132 +732,140 @@ def build_app(state_manager: StateManager | None = None) -> FastAPI:
                 f"(required={required_budget:.2f}, available={available_budget:.2f})"
             )
             record, rejected_state = gate.transition_reject(approval_id, body.actor, summary, current_state)
-            rejected_state, _ = _append_transcript_and_emit(
-                request,
-                rejected_state,
-                kind="approval_updated",
-                payload=record,
-                correlation_id=str(record.get("metadata", {}).get("event_id", record.get("decision_id", ""))),
-                decision_id=str(record.get("decision_id", "")),
-                event_name="os.approval_updated",
-            )
-            request.app.state.sm.save_state(rejected_state)
+            batch: TranscriptBatch = []
+            frames: SSEFrames = []
+            _stage_approval_update(batch, record)
+            rejected_state, _ = _commit_transcript(rejected_state, batch, frames)
+            deps.sm.save_state(rejected_state)
+            _emit_sse(request.app, frames)
             raise HTTPException(status_code=409, detail="insufficient_budget_for_purchase")
 
         try:
             record, updated_state = gate.transition_approve(approval_id, body.actor, body.notes or "", current_state)
-            updated_state, _ = _append_transcript_and_emit(
-                request,
-                updated_state,
-                kind="approval_updated",
-                payload=record,
-                correlation_id=str(record.get("metadata", {}).get("event_id", record.get("decision_id", ""))),
-                decision_id=str(record.get("decision_id", "")),
-                event_name="os.approval_updated",
-            )
+            transcript: TranscriptBatch = []
+            _stage_approval_update(transcript, record)
             event_payload = gate.build_approval_event(record, body.actor, body.notes or "")
         except ValueError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
-        return _run_pipeline(request, EventIn.model_validate(event_payload), initial_state=updated_state)
+        return _run_pipeline(
+            request,
+            deps,
+            _trusted_event_in(event_payload),
+            initial_state=updated_state,
+            background_tasks=background_tasks,
+            transcript=transcript,
+        )
 
     @app.post("/v1/os/approvals/{approval_id}/reject")
     @app.post("/os/approvals/{approval_id}/reject")
-    def reject_os_request(request: Request, approval_id: str, body: ApprovalDecisionIn) -> dict[str, object]:
+    def reject_os_request(
+        request: Request,
+        approval_id: str,
+        body: ApprovalDecisionIn,
+        current_state: StateSnapshot,
+        background_tasks: BackgroundTasks,
+        deps: Deps,
+    ) -> dict[str, object]:
         reason = body.reason or body.notes or "no reason provided"
-        current_state = request.app.state.sm.load_state()
         try:
-            record, updated_state = request.app.state.approval_gate.transition_reject(
+            record, updated_state = deps.approval_gate.transition_reject(
                 approval_id, body.actor, reason, current_state
             )
-            updated_state, _ = _append_transcript_and_emit(
-                request,
-                updated_state,
-                kind="approval_updated",
-                payload=record,
-                correlation_id=str(record.get("metadata", {}).get("event_id", record.get("decision_id", ""))),
-                decision_id=str(record.get("decision_id", "")),
-                event_name="os.approval_updated",
-            )
-            request.app.state.sm.save_state(updated_state)
-            event_payload = request.app.state.approval_gate.build_rejection_event(record, body.actor, reason)
+            transcript: TranscriptBatch = []
+            _stage_approval_update(transcript, record)
+            event_payload = deps.approval_gate.build_rejection_event(record, body.actor, reason)
         except ValueError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
-        return _run_pipeline(request, EventIn.model_validate(event_payload), initial_state=updated_state)
+        return _run_pipeline(
+            request,
+            deps,
+            _trusted_event_in(event_payload),
+            initial_state=updated_state,
+            background_tasks=background_tasks,
+            transcript=transcript,
+        )
 
     @app.post("/v1/os/approvals/{approval_id}/override")
-    def override_os_request(request: Request, approval_id: str, body: ApprovalDecisionIn) -> dict[str, object]:
-        current_state = request.app.state.sm.load_state()
+    def override_os_request(
+        request: Request,
+        approval_id: str,
+        body: ApprovalDecisionIn,
+        current_state: StateSnapshot,
+        deps: Deps,
+    ) -> dict[str, object]:
         notes = body.notes or "override"
         try:
-            record, updated_state = request.app.state.approval_gate.transition_override(
+            record, updated_state = deps.approval_gate.transition_override(
                 approval_id, body.actor, notes, current_state
             )
         except ValueError as exc:
             raise HTTPException(status_code=404, detail=str(exc)) from exc
-        updated_state, _ = _append_transcript_and_emit(
-            request,
-            updated_state,
-            kind="approval_updated",
-            payload=record,
-            correlation_id=str(record.get("metadata", {}).get("event_id", record.get("decision_id", ""))),
-            decision_id=str(record.get("decision_id", "")),
-            event_name="os.approval_updated",
-        )
-        request.app.state.sm.save_state(updated_state)
+        batch: TranscriptBatch = []
+        frames: SSEFrames = []
+        _stage_approval_update(batch, record)
+        updated_state, _ = _commit_transcript(updated_state, batch, frames)
+        deps.sm.save_state(updated_state)
+        _emit_sse(request.app, frames)
         return {"status": "ok", "approval": record}
 
     @app.get("/v1/os/agents/transcript", response_model=TranscriptQueryOut)
-    def get_agents_transcript(request: Request, since: int = Query(0, ge=0)) -> dict[str, Any]:
-        state = request.app.state.sm.load_state()
-        transcript = read_transcript(state)
-        return {"cursor": transcript["cursor"], "items": items_since(state, since)}
+    async def get_agents_transcript(
+        state: StateSnapshot,
+        since: int = Query(0, ge=0),
+    ) -> dict[str, Any]:
+        return {"cursor": transcript_cursor(state), "items": items_since(state, since)}
 
     @app.get("/v1/stream/os")
     async def stream_os(request: Request) -> StreamingResponse:
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=200)
-        request.app.state.os_stream_queues.append(queue)
+        queue: SSEQueue = asyncio.Queue(maxsize=200)
+        request.app.state.os_stream_queues = request.app.state.os_stream_queues | {queue}
 
-        async def event_iterator() -> AsyncIterator[str]:
+        async def event_iterator() -> AsyncIterator[bytes]:
             try:
                 while True:
                     if await request.is_disconnected():
                         break
                     try:
                         msg = await asyncio.wait_for(queue.get(), timeout=15)
-                        yield _sse_format(msg["event"], msg["data"])
                     except TimeoutError:
-                        yield ": keepalive\n\n"
+                        yield b": keepalive\n\n"
+                        continue
+                    batch = [msg]
+                    while True:
+                        try:
+                            batch.append(queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+                    yield b"".join(_sse_format(item["event"], item["data"]) for item in batch)
             finally:
-                if queue in request.app.state.os_stream_queues:
-                    request.app.state.os_stream_queues.remove(queue)
+                request.app.state.os_stream_queues = request.app.state.os_stream_queues - {queue}
 
         return StreamingResponse(event_iterator(), media_type="text/event-stream")
 
     @app.get("/cci")
-    def get_cci(request: Request) -> dict[str, float]:
-        cci, _ = request.app.state.cci_metric.from_state_manager(request.app.state.sm)
+    def get_cci(deps: Deps) -> dict[str, float]:
+        cci, _ = deps.cci_metric.from_state_manager(deps.sm)
         return {"cci": cci}
 
     @app.get("/state")
-    def get_state(request: Request) -> dict[str, object]:
-        return {"state": request.app.state.sm.load_state()}
+    async def get_state(state: StateSnapshot) -> dict[str, object]:
+        return {"state": state}
 
     @app.get("/os/robotics/state")
-    def get_os_robotics_state(request: Request) -> dict[str, object]:
-        twin = load_twin(request.app.state.sm.load_state())
-        return {"robotics_twin": twin.model_dump(mode="json")}
+    async def get_os_robotics_state(state: StateSnapshot) -> dict[str, object]:
+        twin = load_twin(state)
+        return {"robotics_twin": RobotTwinStore.json_snapshot(twin)}
 
     @app.get("/cci/history")
-    def get_cci_history(request: Request) -> dict[str, object]:
-        return {"history": request.app.state.sm.get_cci_history()}
+    def get_cci_history(deps: Deps) -> dict[str, object]:
+        return {"history": deps.sm.get_cci_history()}
 
     @app.post("/agents/rover/control/clear_policy")
-    def clear_rover_policy(request: Request) -> dict[str, object]:
-        defaults = request.app.state.robotics_storage.clear_policy()
-        state = request.app.state.sm.load_state()
+    def clear_rover_policy(state: StateSnapshot, deps: Deps) -> dict[str, object]:
+        defaults = deps.robotics_storage.clear_policy()
         if "robotics" in state:
             state["robotics"] = {}
-            request.app.state.sm.save_state(state)
+            deps.sm.save_state(state)
         return {"status": "cleared", "defaults": defaults}
 
     @app.post("/agents/rover/control/reset_stats")
@@ -581,21 +874,38 @@ def build_app(state_manager: StateManager | None = None) -> FastAPI:
         await rover_runtime.broadcast(rover_runtime._frame_payload({"type": "robot.stop"}))
         return {"status": "stats_reset"}
 
+    @app.get("/agents/assistant/replies/{reply_id}")
+    def get_assistant_reply(reply_id: str, deps: Deps) -> dict[str, object]:
+        reply = deps.assistant_storage.get_reply(reply_id)
+        if reply is None:
+            raise HTTPException(status_code=404, detail="reply_not_found")
+        pending = reply.get("status") == "pending"
+        return {"reply_id": reply_id, "pending": pending, "reply": None if pending else reply}
+
     @app.post("/agents/assistant/control/clear_memory")
-    def clear_assistant_memory(request: Request) -> dict[str, object]:
-        deleted = request.app.state.assistant_storage.clear_all()
-        state = request.app.state.sm.load_state()
+    def clear_assistant_memory(state: StateSnapshot, deps: Deps) -> dict[str, object]:
+        deleted = deps.assistant_storage.clear_all()
         if "assistant" in state:
             state["assistant"] = {}
         if "assistant_learning" in state:
             state["assistant_learning"] = {}
-        request.app.state.sm.save_state(state)
+        deps.sm.save_state(state)
         return {"status": "cleared", "deleted": deleted, "epsilon": 0.6}
 
     app.include_router(rover_router)
     return app
 
 
-app = build_app()
+@cache
+def _default_app() -> FastAPI:
+    return build_app()
+
+
+def __getattr__(name: str) -> Any:
+    """Build the module-level ``app`` on first access, so importing stays side-effect free."""
+    if name == "app":
+        return _default_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["app", "build_app"]
+__all__ = ["build_app"]
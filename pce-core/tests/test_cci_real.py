@@ -50,3 +50,45 @@ def test_state_manager_cci_history_roundtrip(tmp_path: Path) -> None:
     assert len(history) == 1
     assert history[0]["cci"] == 0.77
     assert history[0]["metrics"]["decision_consistency"] == 0.8
+
+
+def test_cci_update_with_action_matches_full_recompute(tmp_path: Path) -> None:
+    db = tmp_path / "incremental-cci.db"
+    sm = StateManager(f"sqlite:///{db}")
+    metric = CCIMetric()
+
+    for index in range(22):
+        sm.remember_action(
+            action_id=str(uuid4()),
+            event_id=f"e-{index}",
+            action_type="execute_strategy",
+            priority=1 + (index % 3),
+            value_score=0.7,
+            expected_impact=0.6,
+            observed_impact=0.5,
+            respected_values=index % 5 != 0,
+            violated_values=[] if index % 5 != 0 else ["safety"],
+        )
+
+    window = metric.load_window(sm)
+    action = {
+        "priority": 4,
+        "expected_impact": 0.9,
+        "observed_impact": 0.2,
+        "respected_values": False,
+        "violated_values": ["safety"],
+    }
+    sm.remember_action(
+        action_id=str(uuid4()),
+        event_id="e-new",
+        action_type="execute_strategy",
+        priority=4,
+        value_score=0.4,
+        expected_impact=0.9,
+        observed_impact=0.2,
+        respected_values=False,
+        violated_values=["safety"],
+    )
+
+    incremental = metric.update_with_action(window, action)
+    assert incremental == metric.from_state_manager(sm)
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from pce.core.ids import random_id, time_ordered_id
+
+
+def test_time_ordered_id_is_uuid7_and_sortable() -> None:
+    ids = [time_ordered_id() for _ in range(50)]
+
+    parsed = UUID(ids[0])
+    assert parsed.version == 7
+    assert str(parsed) == ids[0]
+    assert len(set(ids)) == len(ids)
+    assert [value[:13] for value in ids] == sorted(value[:13] for value in ids)
+
+
+def test_random_id_is_uuid4() -> None:
+    ids = [random_id() for _ in range(50)]
+
+    parsed = UUID(ids[0])
+    assert parsed.version == 4
+    assert str(parsed) == ids[0]
+    assert len(set(ids)) == len(ids)
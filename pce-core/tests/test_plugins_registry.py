@@ -59,3 +59,35 @@ def test_registry_fallback_and_priority() -> None:
         fallback=lambda st, _r: dict(st, adapted=True),
     )
     assert adapted["adapted"] is True
+
+
+class ScopedValuePlugin:
+    name = "scoped.value"
+    domains = frozenset({"robotics"})
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
+        _ = (event, state)
+        self.calls += 1
+        return True
+
+    def evaluate(self, event: PCEEvent, state: dict[str, object]) -> float:
+        _ = (event, state)
+        return 0.9
+
+
+def test_registry_routes_by_declared_domain() -> None:
+    state: dict[str, object] = {}
+    scoped = ScopedValuePlugin()
+    registry = PluginRegistry()
+    registry.register_value_model(scoped)
+
+    other = PCEEvent(event_type="x", source="test", payload={"domain": "general", "tags": []})
+    assert registry.evaluate(other, state, fallback=lambda e, o: 0.1) == 0.1
+    assert scoped.calls == 0
+
+    robotics = PCEEvent(event_type="x", source="test", payload={"domain": "robotics", "tags": []})
+    assert registry.evaluate(robotics, state, fallback=lambda e, o: 0.1) == 0.9
+    assert scoped.calls == 1
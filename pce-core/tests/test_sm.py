@@ -1,17 +1,19 @@
 from pathlib import Path
 from uuid import uuid4
 
+import pytest
 from pce.core.types import PCEEvent
-from pce.sm.manager import StateManager
+from pce.sm.manager import PipelineWrites, StateManager
 
 
 def test_state_manager_persists_state(tmp_path: Path) -> None:
     db = tmp_path / "state.db"
     sm = StateManager(f"sqlite:///{db}")
 
-    sm.save_state({"finance": {"budget": 10}})
+    sm.save_state({"finance": {"budget": 10}, "q_table": {3: {"forward": 0.5}}})
     loaded = sm.load_state()
     assert loaded["finance"]["budget"] == 10
+    assert loaded["q_table"] == {"3": {"forward": 0.5}}
 
     sm.remember_event(
         PCEEvent(
@@ -43,12 +45,39 @@ def test_state_manager_action_methods(tmp_path: Path) -> None:
     recent = sm.get_recent_actions(20)
     assert len(recent) == 1
     assert recent[0]["action_type"] == "stabilize"
+    assert sm.get_recent_action_signals(20) == [(3, 0.6, 0.4, False, True)]
 
     contradictions = sm.calculate_contradictions()
     assert contradictions["total_actions"] == 1
     assert contradictions["contradiction_rate"] == 1.0
 
 
+def test_state_manager_commits_pipeline_writes_together(tmp_path: Path) -> None:
+    db = tmp_path / "batch.db"
+    sm = StateManager(f"sqlite:///{db}")
+
+    writes = PipelineWrites()
+    writes.queue_event(PCEEvent(event_type="x", source="test", payload={"domain": "general"}))
+    writes.queue_action(
+        action_id=str(uuid4()),
+        event_id="event-1",
+        action_type="stabilize",
+        priority=1,
+        value_score=0.7,
+        expected_impact=0.5,
+        observed_impact=0.5,
+        respected_values=True,
+    )
+    writes.queue_cci("cci-1", 0.8, {"decision_consistency": 1.0})
+    writes.state = {"finance": {"budget": 3}}
+    sm.commit_writes(writes)
+
+    assert sm.recent_event_count() == 1
+    assert sm.get_recent_actions(5)[0]["action_type"] == "stabilize"
+    assert sm.get_cci_history()[0]["cci_id"] == "cci-1"
+    assert sm.load_state() == {"finance": {"budget": 3}}
+
+
 def test_state_manager_plugin_kv_methods(tmp_path: Path) -> None:
     db = tmp_path / "plugin.db"
     sm = StateManager(f"sqlite:///{db}")
@@ -68,3 +97,33 @@ def test_state_manager_plugin_kv_methods(tmp_path: Path) -> None:
     deleted = sm.plugin_delete_prefix("robotics", "q:")
     assert deleted == 1
     assert sm.plugin_list_prefix("robotics", "q:") == []
+
+
+def test_state_manager_json_handles_non_finite_floats_and_wide_ints(tmp_path: Path) -> None:
+    sm = StateManager(f"sqlite:///{tmp_path / 'json.db'}")
+
+    sm.plugin_set_json("robotics", "floats", {"nan": float("nan"), "inf": float("-inf")})
+    sm.plugin_set_json("robotics", "wide", {"count": 2**70})
+    sm.save_state({"counter": 2**64})
+
+    assert sm.plugin_get_json("robotics", "floats") == {"nan": None, "inf": None}
+    assert sm.plugin_get_json("robotics", "wide") == {"count": float(2**70)}
+    assert sm.load_state() == {"counter": float(2**64)}
+    with pytest.raises(TypeError):
+        sm.plugin_set_json("robotics", "mixed", {"count": 2**70, "ratio": float("nan")})
+
+
+def test_state_manager_state_cache_returns_fresh_copies(tmp_path: Path) -> None:
+    db = tmp_path / "cached.db"
+    sm = StateManager(f"sqlite:///{db}", cache_state=True)
+
+    sm.save_state({"finance": {"budget": 10}})
+    first = sm.load_state()
+    first["finance"]["budget"] = 99
+    assert sm.load_state() == {"finance": {"budget": 10}}
+
+    writes = PipelineWrites()
+    writes.state = {"finance": {"budget": 11}}
+    sm.commit_writes(writes)
+    assert sm.load_state() == {"finance": {"budget": 11}}
+    assert StateManager(f"sqlite:///{db}").load_state() == {"finance": {"budget": 11}}
@@ -4,7 +4,12 @@ from pce_os.agents.base import Agent, AgentInput, AgentMessage, AgentOutput
 from pce_os.agents.bus import AgentBus
 from pce_os.agents.engineering import EngineeringAgent
 from pce_os.agents.finance import FinanceAgent
-from pce_os.agents.llm import LLMClient, NullLLMClient, OpenRouterLLMClient
+from pce_os.agents.llm import (
+    CachingLLMClient,
+    LLMClient,
+    NullLLMClient,
+    OpenRouterLLMClient,
+)
 from pce_os.agents.procurement import ProcurementAgent
 from pce_os.agents.tests import TestsAgent
 
@@ -14,6 +19,7 @@ __all__ = [
     "AgentInput",
     "AgentMessage",
     "AgentOutput",
+    "CachingLLMClient",
     "EngineeringAgent",
     "FinanceAgent",
     "LLMClient",
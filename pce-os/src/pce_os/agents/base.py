@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 from pce.core.types import PCEEvent
 
+from pce_os.agents.llm import LLMClient, NullLLMClient
 
-@dataclass(slots=True)
+# Shared default client; agents holding a null client skip enrichment without calling it.
+_NULL_LLM = NullLLMClient()
+
+
+@dataclass(slots=True, frozen=True)
 class AgentMessage:
-    """Message exchanged between agents through the controlled bus."""
+    """Message exchanged between agents through the controlled bus (immutable once sent)."""
 
     from_agent: str
     to_agent: str
@@ -26,7 +32,7 @@ class AgentInput:
 
     event: PCEEvent
     twin_snapshot: dict[str, Any]
-    incoming_messages: list[AgentMessage] = field(default_factory=list)
+    incoming_messages: Sequence[AgentMessage] = ()
     correlation_id: str = ""
     decision_id: str = ""
     enable_llm: bool = False
@@ -49,8 +55,34 @@ class Agent(ABC):
     """Common protocol for all orchestrated agents."""
 
     name: str
+    llm_client: LLMClient
+
+    def __init__(self, llm_client: LLMClient | None = None) -> None:
+        self.llm_client = llm_client or _NULL_LLM
 
     @abstractmethod
     def process(self, agent_input: AgentInput) -> AgentOutput:
         """Process one agent turn deterministically."""
 
+    def llm_prompt(self, agent_input: AgentInput, output: AgentOutput) -> str | None:
+        """Prompt used to enrich ``output`` when LLM enrichment is on (None to skip)."""
+        _ = (agent_input, output)
+        return None
+
+    def apply_completion(self, output: AgentOutput, completion: str) -> None:
+        """Fold an LLM completion for :meth:`llm_prompt` into ``output``."""
+        if completion:
+            output.rationale = completion
+
+    def uses_llm(self, agent_input: AgentInput) -> bool:
+        """Whether this turn is enriched: ``enable_llm`` is set and a real client is wired."""
+        return agent_input.enable_llm and not isinstance(self.llm_client, NullLLMClient)
+
+    def enrich(self, agent_input: AgentInput, output: AgentOutput) -> None:
+        """Enrich ``output`` with a single completion when :meth:`uses_llm` holds."""
+        if not self.uses_llm(agent_input):
+            return
+        prompt = self.llm_prompt(agent_input, output)
+        if prompt is not None:
+            self.apply_completion(output, self.llm_client.complete(prompt))
+
@@ -2,44 +2,73 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import threading
+from collections.abc import Hashable
 
 from pce_os.agents.base import AgentMessage
 
 
 class AgentBus:
-    """Queue with turn limit, dedupe, and per-agent ingress rate limiting."""
+    """Queue with turn limit, dedupe, and per-agent ingress rate limiting.
+
+    Safe to enqueue from several threads: one lock guards the inboxes, and a turn is
+    drained by swapping them out so readers never hold the lock.
+    """
 
     def __init__(self, *, max_turns: int = 6, per_agent_limit: int = 4) -> None:
         self.max_turns = max_turns
         self.per_agent_limit = per_agent_limit
-        self._queue: deque[AgentMessage] = deque()
-        self._seen: set[str] = set()
+        # Per-destination inboxes for the next turn, capped at enqueue time.
+        self._inboxes: dict[str, list[AgentMessage]] = {}
+        self._queued = 0
+        self._seen: set[Hashable] = set()
+        self._lock = threading.Lock()
 
     def enqueue(self, message: AgentMessage) -> bool:
-        """Enqueue message once using a deterministic dedupe key."""
+        """Enqueue message once using a deterministic dedupe key.
+
+        Returns ``False`` for duplicates and for messages beyond the destination's
+        per-turn limit; like duplicates, dropped messages are not accepted again.
+        """
         dedupe_key = message.dedupe_key or self._message_key(message)
-        if dedupe_key in self._seen:
-            return False
-        self._seen.add(dedupe_key)
-        self._queue.append(message)
-        return True
+        with self._lock:
+            if dedupe_key in self._seen:
+                return False
+            self._seen.add(dedupe_key)
+            inbox = self._inboxes.get(message.to_agent)
+            if inbox is None:
+                self._inboxes[message.to_agent] = [message]
+            elif len(inbox) < self.per_agent_limit:
+                inbox.append(message)
+            else:
+                return False
+            self._queued += 1
+            return True
 
     def dequeue_for_all(self) -> dict[str, list[AgentMessage]]:
         """Drain one turn and fan-in messages grouped by destination agent."""
-        grouped: dict[str, list[AgentMessage]] = defaultdict(list)
-        while self._queue:
-            message = self._queue.popleft()
-            inbox = grouped[message.to_agent]
-            if len(inbox) >= self.per_agent_limit:
-                continue
-            inbox.append(message)
+        with self._lock:
+            grouped = self._inboxes
+            self._inboxes = {}
+            self._queued = 0
         return grouped
 
     def __len__(self) -> int:
-        return len(self._queue)
+        return self._queued
 
     @staticmethod
-    def _message_key(message: AgentMessage) -> str:
-        content_key = "|".join(f"{k}:{message.content[k]}" for k in sorted(message.content.keys()))
-        return f"{message.from_agent}->{message.to_agent}:{message.kind}:{content_key}"
+    def _message_key(message: AgentMessage) -> Hashable:
+        return (message.from_agent, message.to_agent, message.kind, _freeze(message.content))
+
+
+def _freeze(value: object) -> Hashable:
+    """Convert message content into an equivalent hashable value for dedupe."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
@@ -2,42 +2,48 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import deque
+from typing import Any, ClassVar
 
 from pce_os.agents.base import Agent, AgentInput, AgentMessage, AgentOutput
-from pce_os.agents.llm import LLMClient, NullLLMClient
+
+_PLANNING_EVENTS = frozenset({"project.goal.defined", "budget.updated"})
 
 
 class EngineeringAgent(Agent):
     name = "engineering"
 
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
-        self.llm_client = llm_client or NullLLMClient()
+    # Static parts of proposed actions; ``metadata`` is built fresh per event.
+    _GENERATE_BOM: ClassVar[dict[str, Any]] = {"action_type": "os.generate_bom", "priority": 2}
+    _PLAN_FOLLOW_UP: ClassVar[dict[str, Any]] = {
+        "action_type": "os.update_project_plan",
+        "priority": 3,
+    }
+    _PLAN_DEPENDENCIES: ClassVar[dict[str, Any]] = {
+        "action_type": "os.update_project_plan",
+        "priority": 2,
+    }
+
+    # Last graph analysed, keyed by identity of its (read-only) edges mapping.
+    _graph_memo: ClassVar[tuple[dict[str, list[str]], tuple[bool, frozenset[str]]] | None] = None
 
     def process(self, agent_input: AgentInput) -> AgentOutput:
         event = agent_input.event
         output = AgentOutput(confidence=0.78, rationale="Engineering heuristics applied.")
 
-        if event.event_type in {"project.goal.defined", "budget.updated"}:
+        if event.event_type in _PLANNING_EVENTS:
             output.proposed_actions.extend(
                 [
-                    {
-                        "action_type": "os.generate_bom",
-                        "priority": 2,
-                        "metadata": {"source_agent": self.name},
-                    },
-                    {
-                        "action_type": "os.update_project_plan",
-                        "priority": 3,
-                        "metadata": {"source_agent": self.name},
-                    },
+                    {**self._GENERATE_BOM, "metadata": {"source_agent": self.name}},
+                    {**self._PLAN_FOLLOW_UP, "metadata": {"source_agent": self.name}},
                 ]
             )
 
         if event.event_type == "part.candidate.added":
             graph = agent_input.twin_snapshot.get("dependency_graph", {})
             edges = graph.get("edges", {}) if isinstance(graph, dict) else {}
-            if self._has_cycle(edges):
+            has_cycle, missing = self._cached_graph_analysis(edges)
+            if has_cycle:
                 output.risk_flags.append("dependency_cycle_detected")
                 output.messages.append(
                     AgentMessage(
@@ -47,7 +53,6 @@ class EngineeringAgent(Agent):
                         content={"reason": "cycle_detected"},
                     )
                 )
-            missing = self._missing_dependencies(edges)
             if missing:
                 output.risk_flags.append("missing_dependencies")
                 output.questions.append(f"Missing dependencies for nodes: {','.join(sorted(missing))}")
@@ -61,55 +66,64 @@ class EngineeringAgent(Agent):
                 )
             output.proposed_actions.append(
                 {
-                    "action_type": "os.update_project_plan",
-                    "priority": 2,
+                    **self._PLAN_DEPENDENCIES,
                     "metadata": {"source_agent": self.name, "dependency_issues": len(output.risk_flags)},
                 }
             )
 
-        self._maybe_enrich_with_llm(agent_input, output)
+        self.enrich(agent_input, output)
         return output
 
-    def _maybe_enrich_with_llm(self, agent_input: AgentInput, output: AgentOutput) -> None:
-        if not agent_input.enable_llm:
-            return
-        prompt = (
+    def llm_prompt(self, agent_input: AgentInput, output: AgentOutput) -> str | None:
+        return (
             f"Agent engineering summarize rationale and missing data questions for event={agent_input.event.event_type}. "
             f"Risk flags={output.risk_flags}."
         )
-        completion = self.llm_client.complete(prompt)
-        if completion:
-            output.rationale = completion
 
     @staticmethod
     def _missing_dependencies(edges: dict[str, list[str]]) -> set[str]:
-        known_nodes = set(edges.keys())
-        missing: set[str] = set()
-        for dependencies in edges.values():
-            for dep in dependencies:
-                if dep not in known_nodes:
-                    missing.add(dep)
-        return missing
+        return EngineeringAgent._analyze_graph(edges)[1]
 
     @staticmethod
     def _has_cycle(edges: dict[str, list[str]]) -> bool:
-        visiting: set[str] = set()
-        visited: set[str] = set()
-
-        def dfs(node: str) -> bool:
-            if node in visiting:
-                return True
-            if node in visited:
-                return False
-            visiting.add(node)
-            for neighbor in edges.get(node, []):
-                if dfs(neighbor):
-                    return True
-            visiting.remove(node)
-            visited.add(node)
-            return False
-
-        for node in edges:
-            if dfs(node):
-                return True
-        return False
+        return EngineeringAgent._analyze_graph(edges)[0]
+
+    @staticmethod
+    def _cached_graph_analysis(edges: dict[str, list[str]]) -> tuple[bool, frozenset[str]]:
+        """Reuse the analysis while agents keep receiving the same twin snapshot."""
+        memo = EngineeringAgent._graph_memo
+        if memo is not None and memo[0] is edges:
+            return memo[1]
+        has_cycle, missing = EngineeringAgent._analyze_graph(edges)
+        result = (has_cycle, frozenset(missing))
+        EngineeringAgent._graph_memo = (edges, result)
+        return result
+
+    @staticmethod
+    def _analyze_graph(edges: dict[str, list[str]]) -> tuple[bool, set[str]]:
+        """Return ``(has_cycle, missing_dependencies)`` from one pass over every edge.
+
+        Kahn's algorithm: nodes whose in-degree drops to zero are peeled off a queue,
+        and any node never peeled lies on (or behind) a cycle. Dependencies that are
+        not themselves graph nodes are reported as missing and cannot close a cycle.
+        """
+        indegree = dict.fromkeys(edges, 0)
+        missing: set[str] = set()
+        for neighbors in edges.values():
+            for neighbor in neighbors:
+                if neighbor in indegree:
+                    indegree[neighbor] += 1
+                else:
+                    missing.add(neighbor)
+
+        ready = deque(node for node, degree in indegree.items() if degree == 0)
+        peeled = 0
+        while ready:
+            node = ready.popleft()
+            peeled += 1
+            for neighbor in edges[node]:
+                if neighbor in indegree:
+                    indegree[neighbor] -= 1
+                    if indegree[neighbor] == 0:
+                        ready.append(neighbor)
+        return peeled < len(indegree), missing
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+from typing import Any, ClassVar
+
 from pce_os.agents.base import Agent, AgentInput, AgentMessage, AgentOutput
-from pce_os.agents.llm import LLMClient, NullLLMClient
+
+_BUDGET_CHECK_EVENTS = frozenset({"budget.updated", "purchase.requested"})
 
 
 class FinanceAgent(Agent):
     name = "finance"
 
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
-        self.llm_client = llm_client or NullLLMClient()
+    # Static part of the proposed action; ``metadata`` is built fresh per event.
+    _PLAN_BUDGET_GAP: ClassVar[dict[str, Any]] = {
+        "action_type": "os.update_project_plan",
+        "priority": 1,
+    }
 
     def process(self, agent_input: AgentInput) -> AgentOutput:
         output = AgentOutput(confidence=0.8, rationale="Finance heuristics applied.")
         event = agent_input.event
         payload = event.payload
 
-        if event.event_type in {"budget.updated", "purchase.requested"}:
+        if event.event_type in _BUDGET_CHECK_EVENTS:
             budget_remaining = float(
                 payload.get("budget_remaining", agent_input.twin_snapshot.get("budget_remaining", 0.0))
             )
@@ -26,8 +32,7 @@ class FinanceAgent(Agent):
                 output.risk_flags.append("insufficient_budget")
                 output.proposed_actions.append(
                     {
-                        "action_type": "os.update_project_plan",
-                        "priority": 1,
+                        **self._PLAN_BUDGET_GAP,
                         "metadata": {
                             "reason": "budget_gap",
                             "budget_remaining": budget_remaining,
@@ -45,9 +50,9 @@ class FinanceAgent(Agent):
                     )
                 )
 
-        if agent_input.enable_llm:
-            completion = self.llm_client.complete(f"Finance rationale for {event.event_type}")
-            if completion:
-                output.rationale = completion
-
+        self.enrich(agent_input, output)
         return output
+
+    def llm_prompt(self, agent_input: AgentInput, output: AgentOutput) -> str | None:
+        _ = output
+        return f"Finance rationale for {agent_input.event.event_type}"
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
-import urllib.error
-import urllib.request
+import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
 
 from pce_os.config import load_os_config
 
+_BATCH_SECTION = re.compile(r"^### (\d+)\s*$", re.MULTILINE)
+
 
 class LLMClient(ABC):
     """Simple completion interface for pluggable LLM providers."""
@@ -17,6 +24,17 @@ class LLMClient(ABC):
     def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
         """Return a completion string for the provided prompt."""
 
+    def complete_batch(self, prompts: Sequence[str], *, timeout_s: float = 3.0) -> list[str]:
+        """Return one completion per prompt, in order.
+
+        The default issues the single-prompt calls concurrently; providers that can
+        answer several prompts in one request override this.
+        """
+        if len(prompts) < 2:
+            return [self.complete(prompt, timeout_s=timeout_s) for prompt in prompts]
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            return list(pool.map(lambda p: self.complete(p, timeout_s=timeout_s), prompts))
+
 
 class NullLLMClient(LLMClient):
     """Default no-op adapter to keep behavior deterministic by default."""
@@ -25,9 +43,58 @@ class NullLLMClient(LLMClient):
         _ = (prompt, timeout_s)
         return ""
 
+    def complete_batch(self, prompts: Sequence[str], *, timeout_s: float = 3.0) -> list[str]:
+        _ = timeout_s
+        return [""] * len(prompts)
+
+
+class CachingLLMClient(LLMClient):
+    """LRU cache of completions in front of another client.
+
+    Agent prompts are small templates, so a steady event stream repeats the same few
+    prompts. Entries are keyed by the whole prompt batch and the wrapped client's
+    ``model``: a provider may answer batched prompts together, so one prompt's answer
+    is only reused alongside the same neighbours. Switching models misses, and
+    batches with an empty (failed) completion are not cached.
+    """
+
+    def __init__(self, inner: LLMClient, *, maxsize: int = 1024) -> None:
+        self.inner = inner
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, tuple[str, ...]], list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+        return self.complete_batch([prompt], timeout_s=timeout_s)[0]
+
+    def complete_batch(self, prompts: Sequence[str], *, timeout_s: float = 3.0) -> list[str]:
+        key = (str(getattr(self.inner, "model", "")), tuple(prompts))
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return list(cached)
+        completions = self.inner.complete_batch(prompts, timeout_s=timeout_s)
+        if all(completions):
+            with self._lock:
+                self._entries[key] = list(completions)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return completions
+
+    def clear(self) -> None:
+        """Drop all cached completions."""
+        with self._lock:
+            self._entries.clear()
+
 
 class OpenRouterLLMClient(LLMClient):
-    """Best-effort OpenRouter adapter stub (optional, retries=0)."""
+    """Best-effort OpenRouter adapter stub (optional, retries=0).
+
+    Requests share one lazily created ``httpx.Client`` so keep-alive connections are
+    reused across calls instead of opening a new TCP/TLS session each time.
+    """
 
     def __init__(self) -> None:
         # Centralized OS config keeps runtime deterministic across environments.
@@ -35,29 +102,54 @@ class OpenRouterLLMClient(LLMClient):
         self.api_key = openrouter.api_key
         self.model = openrouter.model
         self.base_url = openrouter.base_url
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._client: httpx.Client | None = None
 
     def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
         if not self.api_key:
             return ""
+        return self._post(prompt, timeout_s)
 
+    def complete_batch(self, prompts: Sequence[str], *, timeout_s: float = 3.0) -> list[str]:
+        """Answer all prompts with one request, falling back to per-prompt calls.
+
+        Prompts are sent as numbered ``### n`` sections and the reply is expected to
+        answer under the same markers; if any section is missing, the base
+        per-prompt behavior is used instead.
+        """
+        if not self.api_key:
+            return [""] * len(prompts)
+        if len(prompts) < 2:
+            return super().complete_batch(prompts, timeout_s=timeout_s)
+        sections = "\n\n".join(f"### {n}\n{prompt}" for n, prompt in enumerate(prompts, 1))
+        combined = (
+            "Answer each numbered request below separately. Start each answer with its "
+            f"'### n' marker on its own line.\n\n{sections}"
+        )
+        answers = self._split_sections(self._post(combined, timeout_s), len(prompts))
+        if answers is None:
+            return super().complete_batch(prompts, timeout_s=timeout_s)
+        return answers
+
+    def _post(self, prompt: str, timeout_s: float) -> str:
         payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0,
         }
-        req = urllib.request.Request(
-            self.base_url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(req, timeout=timeout_s) as response:
-                body = json.loads(response.read().decode("utf-8"))
-        except (TimeoutError, urllib.error.URLError, json.JSONDecodeError, KeyError):
+            response = self._get_client().post(
+                self.base_url,
+                headers=self._headers,
+                content=orjson.dumps(payload),
+                timeout=timeout_s,
+            )
+            response.raise_for_status()
+            body = orjson.loads(response.content)
+        except (httpx.HTTPError, ValueError):
             return ""
 
         choices = body.get("choices")
@@ -68,3 +160,25 @@ class OpenRouterLLMClient(LLMClient):
             return ""
         content = message.get("content", "")
         return content if isinstance(content, str) else ""
+
+    @staticmethod
+    def _split_sections(content: str, count: int) -> list[str] | None:
+        markers = list(_BATCH_SECTION.finditer(content))
+        answers: dict[int, str] = {}
+        for position, marker in enumerate(markers):
+            end = markers[position + 1].start() if position + 1 < len(markers) else len(content)
+            answers[int(marker.group(1))] = content[marker.end() : end].strip()
+        if any(not answers.get(n) for n in range(1, count + 1)):
+            return None
+        return [answers[n] for n in range(1, count + 1)]
+
+    def close(self) -> None:
+        """Close pooled connections; the next call reopens them."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(transport=httpx.HTTPTransport(retries=0))
+        return self._client
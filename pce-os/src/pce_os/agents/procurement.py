@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from typing import Any, ClassVar
+
 from pce_os.agents.base import Agent, AgentInput, AgentOutput
-from pce_os.agents.llm import LLMClient, NullLLMClient
 
 
 class ProcurementAgent(Agent):
     name = "procurement"
 
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
-        self.llm_client = llm_client or NullLLMClient()
+    # Static parts of proposed actions; ``metadata`` is built fresh per event.
+    _REQUEST_QUOTE: ClassVar[dict[str, Any]] = {"action_type": "os.request_quote", "priority": 2}
+    _REQUEST_APPROVAL: ClassVar[dict[str, Any]] = {
+        "action_type": "os.request_purchase_approval",
+        "priority": 1,
+    }
 
     def process(self, agent_input: AgentInput) -> AgentOutput:
         output = AgentOutput(confidence=0.74, rationale="Procurement heuristics applied.")
@@ -23,8 +28,7 @@ class ProcurementAgent(Agent):
             output.proposed_actions.extend(
                 [
                     {
-                        "action_type": "os.request_quote",
-                        "priority": 2,
+                        **self._REQUEST_QUOTE,
                         "metadata": {
                             "projected_cost": projected_cost,
                             "risk_level": risk_level,
@@ -32,8 +36,7 @@ class ProcurementAgent(Agent):
                         },
                     },
                     {
-                        "action_type": "os.request_purchase_approval",
-                        "priority": 1,
+                        **self._REQUEST_APPROVAL,
                         "metadata": {
                             "projected_cost": projected_cost,
                             "risk_level": risk_level,
@@ -44,11 +47,9 @@ class ProcurementAgent(Agent):
                 ]
             )
 
-        if agent_input.enable_llm:
-            completion = self.llm_client.complete(
-                f"Procurement rationale and mitigation notes for {event.event_type}",
-            )
-            if completion:
-                output.rationale = completion
-
+        self.enrich(agent_input, output)
         return output
+
+    def llm_prompt(self, agent_input: AgentInput, output: AgentOutput) -> str | None:
+        _ = output
+        return f"Procurement rationale and mitigation notes for {agent_input.event.event_type}"
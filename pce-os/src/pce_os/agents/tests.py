@@ -2,26 +2,32 @@
 
 from __future__ import annotations
 
+from typing import Any, ClassVar
+
 from pce_os.agents.base import Agent, AgentInput, AgentOutput
-from pce_os.agents.llm import LLMClient, NullLLMClient
+
+_TEST_SCHEDULE_EVENTS = frozenset({"purchase.completed", "part.received"})
 
 
 class TestsAgent(Agent):
     __test__ = False
     name = "tests"
 
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
-        self.llm_client = llm_client or NullLLMClient()
+    # Static parts of proposed actions; ``metadata`` is built fresh per event.
+    _SCHEDULE_TEST: ClassVar[dict[str, Any]] = {"action_type": "os.schedule_test", "priority": 1}
+    _PLAN_TEST_FAILURE: ClassVar[dict[str, Any]] = {
+        "action_type": "os.update_project_plan",
+        "priority": 1,
+    }
 
     def process(self, agent_input: AgentInput) -> AgentOutput:
         output = AgentOutput(confidence=0.76, rationale="Test heuristics applied.")
         event = agent_input.event
 
-        if event.event_type in {"purchase.completed", "part.received"}:
+        if event.event_type in _TEST_SCHEDULE_EVENTS:
             output.proposed_actions.append(
                 {
-                    "action_type": "os.schedule_test",
-                    "priority": 1,
+                    **self._SCHEDULE_TEST,
                     "metadata": {
                         "purchase_id": event.payload.get("purchase_id"),
                         "source_agent": self.name,
@@ -33,15 +39,14 @@ class TestsAgent(Agent):
             output.risk_flags.append("test_failure_detected")
             output.proposed_actions.append(
                 {
-                    "action_type": "os.update_project_plan",
-                    "priority": 1,
+                    **self._PLAN_TEST_FAILURE,
                     "metadata": {"reason": "test_failure", "source_agent": self.name},
                 }
             )
 
-        if agent_input.enable_llm:
-            completion = self.llm_client.complete(f"Testing rationale for {event.event_type}")
-            if completion:
-                output.rationale = completion
-
+        self.enrich(agent_input, output)
         return output
+
+    def llm_prompt(self, agent_input: AgentInput, output: AgentOutput) -> str | None:
+        _ = output
+        return f"Testing rationale for {agent_input.event.event_type}"
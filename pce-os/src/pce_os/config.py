@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -54,9 +55,13 @@ def _read_json(path: Path) -> dict[str, Any]:
     return payload
 
 
+@lru_cache(maxsize=4)
 def load_os_config(config_path: Path | None = None) -> OSConfig:
     """Load PCE-OS settings from the unified JSON file.
 
+    Results are cached per ``config_path`` (the dataclasses are frozen, so sharing is
+    safe); call ``load_os_config.cache_clear()`` to pick up edits to the file.
+
     Args:
         config_path: Optional explicit config path for tests or custom runners.
 
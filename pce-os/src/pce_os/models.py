@@ -1,13 +1,25 @@
-"""PCE-OS robotics digital twin models."""
+"""PCE-OS robotics digital twin models.
+
+Leaf records (suppliers, components, projections, simulation and test results) are
+frozen so twin versions can share them instead of copying; update them with
+``model_copy(update=...)``.
+"""
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Literal validates by membership instead of running a regex per field.
+RiskLevel = Literal["LOW", "MEDIUM", "HIGH"]
 
 
 class Supplier(BaseModel):
     """Supplier profile with lead-time and reliability signals."""
 
+    model_config = ConfigDict(frozen=True)
+
     supplier_id: str
     name: str
     reliability_score: float = Field(default=0.7, ge=0.0, le=1.0)
@@ -17,6 +29,8 @@ class Supplier(BaseModel):
 class Component(BaseModel):
     """BOM component candidate or acquired part."""
 
+    model_config = ConfigDict(frozen=True)
+
     component_id: str
     name: str
     category: str = "general"
@@ -24,7 +38,7 @@ class Component(BaseModel):
     estimated_unit_cost: float = Field(default=0.0, ge=0.0)
     selected_supplier_id: str | None = None
     status: str = "planned"
-    risk_level: str = Field(default="LOW", pattern="^(LOW|MEDIUM|HIGH)$")
+    risk_level: RiskLevel = "LOW"
 
 
 class DependencyGraph(BaseModel):
@@ -36,6 +50,8 @@ class DependencyGraph(BaseModel):
 class CostProjection(BaseModel):
     """Current aggregate projection for cost and procurement risk."""
 
+    model_config = ConfigDict(frozen=True)
+
     projected_total_cost: float = Field(default=0.0, ge=0.0)
     projected_risk_buffer: float = Field(default=0.0, ge=0.0)
     confidence: float = Field(default=0.5, ge=0.0, le=1.0)
@@ -44,16 +60,20 @@ class CostProjection(BaseModel):
 class SimulationResult(BaseModel):
     """Result of one simulation pass used to steer planning."""
 
+    model_config = ConfigDict(frozen=True)
+
     simulation_id: str
     scenario: str
     projected_cost: float = Field(default=0.0, ge=0.0)
-    projected_risk_level: str = Field(default="LOW", pattern="^(LOW|MEDIUM|HIGH)$")
+    projected_risk_level: RiskLevel = "LOW"
     notes: str = ""
 
 
 class TestResult(BaseModel):
     """Structured test execution outcome."""
 
+    model_config = ConfigDict(frozen=True)
+
     test_id: str
     component_id: str
     passed: bool
@@ -70,7 +90,7 @@ class RobotProjectState(BaseModel):
     budget_total: float = Field(default=0.0, ge=0.0)
     budget_remaining: float = Field(default=0.0)
     risks: list[str] = Field(default_factory=list)
-    risk_level: str = Field(default="LOW", pattern="^(LOW|MEDIUM|HIGH)$")
+    risk_level: RiskLevel = "LOW"
     components: list[Component] = Field(default_factory=list)
     suppliers: list[Supplier] = Field(default_factory=list)
     dependency_graph: DependencyGraph = Field(default_factory=DependencyGraph)
@@ -78,4 +98,18 @@ class RobotProjectState(BaseModel):
     simulations: list[SimulationResult] = Field(default_factory=list)
     tests: list[TestResult] = Field(default_factory=list)
     purchase_history: list[dict[str, object]] = Field(default_factory=list)
+    actual_purchase_spend: float = 0.0
     audit_trail: list[dict[str, object]] = Field(default_factory=list)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _backfill_purchase_spend(cls, data: Any) -> Any:
+        """Derive the running spend total once for twins persisted before it existed."""
+        if isinstance(data, dict) and "actual_purchase_spend" not in data:
+            history = data.get("purchase_history")
+            if isinstance(history, list) and history:
+                spend = sum(
+                    float(item.get("total_cost", 0.0)) for item in history if isinstance(item, dict)
+                )
+                return {**data, "actual_purchase_spend": spend}
+        return data
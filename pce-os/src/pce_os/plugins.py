@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from pce.core.plugins import AdaptationPlugin, DecisionPlugin, ValueModelPlugin
 from pce.core.types import ActionPlan, ExecutionResult, PCEEvent
 
@@ -17,17 +20,81 @@ from pce_os.agents import (
     AgentOutput,
     EngineeringAgent,
     FinanceAgent,
-    NullLLMClient,
+    LLMClient,
     ProcurementAgent,
     TestsAgent,
 )
-from pce_os.models import RobotProjectState
+from pce_os.state import with_os_slice
+from pce_os.twin_store import RobotTwinStore, TwinView
 
 logger = logging.getLogger(__name__)
 
+_CANONICAL_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+_OS_DOMAIN = "os.robotics"
+
+# Value model weights, looked up per evaluated event.
+_RISK_PENALTY = {"LOW": 0.0, "MEDIUM": 0.15, "HIGH": 0.35}
+_UNKNOWN_RISK_PENALTY = 0.1
+_PHASE_WEIGHTS = {
+    "planning": 0.1,
+    "procurement": 0.05,
+    "integration": 0.0,
+    "testing": 0.05,
+}
+
+# Event types whose decisions always go through the human approval gate.
+_GATE_REQUIRED_EVENTS = frozenset({"purchase.requested"})
+
+# Plans used when no agent proposal is selected: (action_type, rationale, priority).
+_FALLBACK_PLANS: dict[str, tuple[str, str, int]] = {
+    "project.goal.defined": (
+        "os.generate_bom",
+        "Projeto definido; gerar BOM inicial e baseline de custo/risco.",
+        2,
+    ),
+    "part.candidate.added": (
+        "os.update_project_plan",
+        "Componente candidato adicionado; recalcular projeções.",
+        3,
+    ),
+    "purchase.requested": (
+        "os.request_purchase_approval",
+        "Compra solicitada; aguardando gate humano obrigatório.",
+        1,
+    ),
+    "purchase.completed": (
+        "os.record_purchase",
+        "Compra concluída; registrar execução e atualizar saldo.",
+        1,
+    ),
+    "test.result.recorded": (
+        "os.update_project_plan",
+        "Resultado de teste recebido; atualizar risco e custo projetado.",
+        2,
+    ),
+}
+# Event types whose decision always uses the fallback plan, ignoring agent proposals.
+_FIXED_PLAN_EVENTS = frozenset({"purchase.completed"})
+# Agent proposal preferred per event type: the same action its fallback plan would take.
+_PREFERRED_ACTIONS = {event_type: plan[0] for event_type, plan in _FALLBACK_PLANS.items()}
+_DEFAULT_FALLBACK_PLAN = (
+    "os.update_project_plan",
+    "Evento OS processado com atualização incremental do plano.",
+    4,
+)
+
+
+def _clamp_unit(value: float) -> float:
+    """Clamp to [0, 1] with float comparisons instead of the generic min/max calls."""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
 
 class AgentOrchestrator:
-    """Runs deterministic multi-agent rounds and aggregates proposed actions."""
+    """Runs deterministic multi-agent rounds and aggregates proposed actions.
+
+    Every agent shares ``llm_client`` (the null client when omitted); a live provider,
+    such as a cached :class:`OpenRouterLLMClient`, is only used when passed in.
+    """
 
     def __init__(
         self,
@@ -35,16 +102,24 @@ class AgentOrchestrator:
         enable_llm: bool = False,
         allow_llm_actions: bool = False,
         max_turns: int = 6,
+        max_parallel_agents: int = 4,
+        llm_timeout_s: float = 3.0,
+        llm_client: LLMClient | None = None,
     ) -> None:
-        llm_client = NullLLMClient()
         self.enable_llm = enable_llm
         self.allow_llm_actions = allow_llm_actions
         self.max_turns = max_turns
+        self.max_parallel_agents = max_parallel_agents
+        self.llm_timeout_s = llm_timeout_s
+        # Created on first use so deterministic (LLM-off) orchestrators never start threads.
+        self._executor: ThreadPoolExecutor | None = None
+        # Batches abandoned at a round deadline and still occupying pool workers.
+        self._abandoned: set[Future[list[str]]] = set()
         self.agents: dict[str, Agent] = {
-            "engineering": EngineeringAgent(llm_client=llm_client),
-            "procurement": ProcurementAgent(llm_client=llm_client),
-            "finance": FinanceAgent(llm_client=llm_client),
-            "tests": TestsAgent(llm_client=llm_client),
+            "engineering": EngineeringAgent(llm_client),
+            "procurement": ProcurementAgent(llm_client),
+            "finance": FinanceAgent(llm_client),
+            "tests": TestsAgent(llm_client),
         }
 
     def deliberate(
@@ -60,18 +135,18 @@ class AgentOrchestrator:
         diagnostics: dict[str, dict[str, object]] = defaultdict(dict)
         transcript: list[dict[str, Any]] = []
 
-        for agent in self.agents.values():
-            output = agent.process(
-                AgentInput(
-                    event=event,
-                    twin_snapshot=twin_snapshot,
-                    incoming_messages=[],
-                    correlation_id=correlation_id,
-                    decision_id=decision_id,
-                    enable_llm=self.enable_llm,
-                    allow_llm_actions=self.allow_llm_actions,
-                )
-            )
+        # Agents only read their input, so the first round shares one instance and later
+        # turns copy it with just their incoming messages swapped in.
+        base_input = AgentInput(
+            event=event,
+            twin_snapshot=twin_snapshot,
+            correlation_id=correlation_id,
+            decision_id=decision_id,
+            enable_llm=self.enable_llm,
+            allow_llm_actions=self.allow_llm_actions,
+        )
+        first_round = [(agent, base_input) for agent in self.agents.values()]
+        for agent, output in self._run_agents(first_round):
             self._collect(output, aggregated, diagnostics, agent.name)
             transcript.extend(
                 self._output_transcript_items(
@@ -88,21 +163,12 @@ class AgentOrchestrator:
             grouped = bus.dequeue_for_all()
             if not grouped:
                 break
-            for agent_name, messages in grouped.items():
-                agent = self.agents.get(agent_name)
-                if agent is None:
-                    continue
-                output = agent.process(
-                    AgentInput(
-                        event=event,
-                        twin_snapshot=twin_snapshot,
-                        incoming_messages=messages,
-                        correlation_id=correlation_id,
-                        decision_id=decision_id,
-                        enable_llm=self.enable_llm,
-                        allow_llm_actions=self.allow_llm_actions,
-                    )
-                )
+            turn_inputs = [
+                (self.agents[agent_name], replace(base_input, incoming_messages=messages))
+                for agent_name, messages in grouped.items()
+                if agent_name in self.agents
+            ]
+            for agent, output in self._run_agents(turn_inputs):
                 self._collect(output, aggregated, diagnostics, agent.name)
                 transcript.extend(
                     self._output_transcript_items(
@@ -126,6 +192,81 @@ class AgentOrchestrator:
         unique_actions = self._dedupe_actions(aggregated)
         return {"actions": unique_actions, "diagnostics": diagnostics, "transcript": transcript}
 
+    def _run_agents(
+        self,
+        turn_inputs: list[tuple[Agent, AgentInput]],
+    ) -> list[tuple[Agent, AgentOutput]]:
+        """Process one round of agents, in input order.
+
+        When LLM enrichment is on, agents run their deterministic logic first and the
+        round's prompts are then sent through one ``complete_batch`` call per client.
+        All batches run on the pool under a single ``llm_timeout_s`` deadline; agents
+        whose batch is not done by then keep their heuristic rationale. While batches
+        abandoned by an earlier round are still running, the round is not enriched, so
+        a stalled provider cannot pile work up on the pool.
+        """
+        if not self.enable_llm:
+            return [(agent, agent.process(agent_input)) for agent, agent_input in turn_inputs]
+        results: list[tuple[Agent, AgentOutput]] = []
+        pending: dict[int, list[tuple[Agent, AgentOutput, str]]] = defaultdict(list)
+        for agent, agent_input in turn_inputs:
+            if not agent.uses_llm(agent_input):
+                results.append((agent, agent.process(agent_input)))
+                continue
+            output = agent.process(replace(agent_input, enable_llm=False))
+            results.append((agent, output))
+            prompt = agent.llm_prompt(agent_input, output)
+            if prompt is not None:
+                pending[id(agent.llm_client)].append((agent, output, prompt))
+        if not pending:
+            return results
+        if self._abandoned:
+            logger.warning(
+                "agent_llm_round_skipped abandoned_batches=%s",
+                len(self._abandoned),
+            )
+            return results
+        batches = list(pending.values())
+        futures = [self._pool().submit(self._complete_batch, batch) for batch in batches]
+        # One deadline for the whole round, however many batches or provider retries.
+        done, not_done = wait(futures, timeout=self.llm_timeout_s)
+        if not_done:
+            logger.warning(
+                "agent_llm_batch_timeout timeout_s=%s pending_batches=%s",
+                self.llm_timeout_s,
+                len(not_done),
+            )
+            for future in not_done:
+                self._abandoned.add(future)
+                future.add_done_callback(self._abandoned.discard)
+        for batch, future in zip(batches, futures, strict=True):
+            if future not in done:
+                continue
+            for (agent, output, _), completion in zip(batch, future.result(), strict=False):
+                agent.apply_completion(output, completion)
+        return results
+
+    def _complete_batch(self, batch: list[tuple[Agent, AgentOutput, str]]) -> list[str]:
+        client = batch[0][0].llm_client
+        return client.complete_batch(
+            [prompt for _, _, prompt in batch],
+            timeout_s=self.llm_timeout_s,
+        )
+
+    def close(self) -> None:
+        """Stop the agent pool without waiting for in-flight LLM batches."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_parallel_agents,
+                thread_name_prefix="pce-os-agents",
+            )
+        return self._executor
+
     @staticmethod
     def _output_transcript_items(
         output: AgentOutput,
@@ -139,6 +280,7 @@ class AgentOrchestrator:
             items.append(
                 {
                     "kind": "agent_message",
+                    "event_name": "os.agent_message",
                     "agent": message.from_agent or agent_name,
                     "payload": {
                         "to_agent": message.to_agent,
@@ -153,6 +295,7 @@ class AgentOrchestrator:
             items.append(
                 {
                     "kind": "actions_proposed",
+                    "event_name": "os.actions_proposed",
                     "agent": agent_name,
                     "payload": {"actions": output.proposed_actions},
                     "correlation_id": correlation_id,
@@ -178,15 +321,11 @@ class AgentOrchestrator:
 
     @staticmethod
     def _dedupe_actions(actions: list[dict[str, object]]) -> list[dict[str, object]]:
-        seen: set[str] = set()
+        """Drop exact repeats, comparing actions by their canonical (key-sorted) JSON."""
+        seen: set[bytes] = set()
         deduped: list[dict[str, object]] = []
         for action in actions:
-            action_type = str(action.get("action_type", ""))
-            metadata = action.get("metadata", {})
-            meta_key = ""
-            if isinstance(metadata, dict):
-                meta_key = str(metadata.get("purchase_id", metadata.get("reason", "")))
-            key = f"{action_type}:{meta_key}"
+            key = orjson.dumps(action, default=repr, option=_CANONICAL_JSON)
             if key in seen:
                 continue
             seen.add(key)
@@ -198,47 +337,34 @@ class OSRoboticsValueModelPlugin(ValueModelPlugin):
     """Budget-first value model with risk and project-phase adjustments."""
 
     name = "os.robotics.value"
+    domains = frozenset({_OS_DOMAIN})
 
     def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
         _ = state
-        return str(event.payload.get("domain")) == "os.robotics"
+        return event.payload.get("domain") == _OS_DOMAIN
 
     def evaluate(self, event: PCEEvent, state: dict[str, object]) -> float:
         _ = event
-        twin = self._twin(state)
-        budget_total = float(twin.budget_total or 1.0)
-        budget_remaining = float(twin.budget_remaining)
-        budget_score = max(0.0, min(1.0, budget_remaining / budget_total))
-
-        risk_penalty = {"LOW": 0.0, "MEDIUM": 0.15, "HIGH": 0.35}.get(twin.risk_level, 0.1)
-        phase_weights = {
-            "planning": 0.1,
-            "procurement": 0.05,
-            "integration": 0.0,
-            "testing": 0.05,
-        }
-        phase_bonus = phase_weights.get(twin.phase, 0.0)
-        return max(0.0, min(1.0, 0.65 * budget_score + phase_bonus - risk_penalty + 0.25))
+        twin = RobotTwinStore.view(state)
+        budget_score = _clamp_unit(twin.budget_remaining / (twin.budget_total or 1.0))
 
-    @staticmethod
-    def _twin(state: dict[str, object]) -> RobotProjectState:
-        os_state = state.get("pce_os")
-        if isinstance(os_state, dict) and isinstance(os_state.get("robotics_twin"), dict):
-            return RobotProjectState.model_validate(os_state["robotics_twin"])
-        return RobotProjectState()
+        risk_penalty = _RISK_PENALTY.get(twin.risk_level, _UNKNOWN_RISK_PENALTY)
+        phase_bonus = _PHASE_WEIGHTS.get(twin.phase, 0.0)
+        return _clamp_unit(0.65 * budget_score + phase_bonus - risk_penalty + 0.25)
 
 
 class OSRoboticsDecisionPlugin(DecisionPlugin):
     """Domain workflow planner for PCE-OS robotics lifecycle."""
 
     name = "os.robotics.decision"
+    domains = frozenset({_OS_DOMAIN})
 
     def __init__(self) -> None:
         self.orchestrator = AgentOrchestrator()
 
     def match(self, event: PCEEvent, state: dict[str, object]) -> bool:
         _ = state
-        return str(event.payload.get("domain")) == "os.robotics"
+        return event.payload.get("domain") == _OS_DOMAIN
 
     def deliberate(
         self,
@@ -247,45 +373,55 @@ class OSRoboticsDecisionPlugin(DecisionPlugin):
         value_score: float,
         cci: float,
     ) -> ActionPlan:
-        twin_state = self._twin(state)
+        twin = RobotTwinStore.view(state)
+        twin_snapshot = RobotTwinStore.slice_payload(state)
         decision_id = str(uuid4())
-        orchestration = self.orchestrator.deliberate(
-            event,
-            twin_state.model_dump(mode="json"),
-            correlation_id=event.event_id,
-            decision_id=decision_id,
-        )
+        orchestration: dict[str, object]
+        if event.event_type in _FIXED_PLAN_EVENTS and not self.orchestrator.enable_llm:
+            # The fallback plan is taken regardless of proposals: skip the agent rounds.
+            orchestration = {"actions": [], "diagnostics": {}, "transcript": []}
+        else:
+            orchestration = self.orchestrator.deliberate(
+                event,
+                twin_snapshot,
+                correlation_id=event.event_id,
+                decision_id=decision_id,
+            )
         candidate_actions = orchestration["actions"]
-        projected_cost = self._projected_cost(event, twin_state)
-        projected_risk = str(event.payload.get("risk_level", twin_state.risk_level))
+        projected_cost = self._projected_cost(event, twin)
+        projected_risk = str(event.payload.get("risk_level", twin.risk_level))
 
-        explain = {
+        gate_required = event.event_type in _GATE_REQUIRED_EVENTS
+        explain: dict[str, object] = {
             "value_dimensions": {
                 "value_score": value_score,
                 "cci": cci,
-                "budget_remaining": twin_state.budget_remaining,
+                "budget_remaining": twin.budget_remaining,
             },
-            "risk_level": twin_state.risk_level,
-            "budget_snapshot": {
-                "total": twin_state.budget_total,
-                "remaining": twin_state.budget_remaining,
-            },
-            "event_snapshot": {
-                "event_type": event.event_type,
-                "payload": event.payload,
-            },
-            "twin_snapshot": twin_state.model_dump(mode="json"),
-            "gate_required": event.event_type in {"purchase.requested"},
+            "risk_level": twin.risk_level,
+            "gate_required": gate_required,
             "agent_diagnostics": orchestration["diagnostics"],
             "agent_transcript": orchestration["transcript"],
             "candidate_actions": candidate_actions,
         }
+        if gate_required:
+            # Budget, event and twin snapshots are only kept for gated (human-reviewed) plans.
+            explain["budget_snapshot"] = {
+                "total": twin.budget_total,
+                "remaining": twin.budget_remaining,
+            }
+            explain["event_snapshot"] = {
+                "event_type": event.event_type,
+                "payload": event.payload,
+            }
+            explain["twin_snapshot"] = twin_snapshot
 
         primary = self._select_preferred_action(event.event_type, candidate_actions)
         if primary is None:
             primary = self._select_primary_action(candidate_actions)
-        if primary is not None and event.event_type != "purchase.completed":
-            metadata = dict(primary.get("metadata", {})) if isinstance(primary.get("metadata"), dict) else {}
+        if primary is not None and event.event_type not in _FIXED_PLAN_EVENTS:
+            primary_metadata = primary.get("metadata")
+            metadata = dict(primary_metadata) if isinstance(primary_metadata, dict) else {}
             metadata.update(
                 {
                     "projected_cost": projected_cost,
@@ -307,72 +443,19 @@ class OSRoboticsDecisionPlugin(DecisionPlugin):
                 metadata=metadata,
             )
 
-        if event.event_type == "project.goal.defined":
-            return ActionPlan(
-                action_type="os.generate_bom",
-                rationale="Projeto definido; gerar BOM inicial e baseline de custo/risco.",
-                priority=2,
-                metadata={
-                    "projected_cost": projected_cost,
-                    "risk_level": twin_state.risk_level,
-                    "explain": explain,
-                },
-            )
-        if event.event_type == "part.candidate.added":
-            return ActionPlan(
-                action_type="os.update_project_plan",
-                rationale="Componente candidato adicionado; recalcular projeções.",
-                priority=3,
-                metadata={
-                    "projected_cost": projected_cost,
-                    "risk_level": twin_state.risk_level,
-                    "explain": explain,
-                },
-            )
+        action_type, rationale, priority = _FALLBACK_PLANS.get(
+            event.event_type, _DEFAULT_FALLBACK_PLAN
+        )
+        metadata = {"projected_cost": projected_cost, "risk_level": twin.risk_level}
         if event.event_type == "purchase.requested":
-            return ActionPlan(
-                action_type="os.request_purchase_approval",
-                rationale="Compra solicitada; aguardando gate humano obrigatório.",
-                priority=1,
-                metadata={
-                    "projected_cost": projected_cost,
-                    "risk_level": projected_risk,
-                    "purchase_id": event.payload.get("purchase_id"),
-                    "explain": explain,
-                },
-            )
-        if event.event_type == "purchase.completed":
-            return ActionPlan(
-                action_type="os.record_purchase",
-                rationale="Compra concluída; registrar execução e atualizar saldo.",
-                priority=1,
-                metadata={
-                    "projected_cost": projected_cost,
-                    "risk_level": twin_state.risk_level,
-                    "explain": explain,
-                },
-            )
-        if event.event_type == "test.result.recorded":
-            return ActionPlan(
-                action_type="os.update_project_plan",
-                rationale="Resultado de teste recebido; atualizar risco e custo projetado.",
-                priority=2,
-                metadata={
-                    "projected_cost": projected_cost,
-                    "risk_level": twin_state.risk_level,
-                    "explain": explain,
-                },
-            )
-
+            metadata["risk_level"] = projected_risk
+            metadata["purchase_id"] = event.payload.get("purchase_id")
+        metadata["explain"] = explain
         return ActionPlan(
-            action_type="os.update_project_plan",
-            rationale="Evento OS processado com atualização incremental do plano.",
-            priority=4,
-            metadata={
-                "projected_cost": projected_cost,
-                "risk_level": twin_state.risk_level,
-                "explain": explain,
-            },
+            action_type=action_type,
+            rationale=rationale,
+            priority=priority,
+            metadata=metadata,
         )
 
     @staticmethod
@@ -380,20 +463,10 @@ class OSRoboticsDecisionPlugin(DecisionPlugin):
         event_type: str,
         actions: list[dict[str, object]],
     ) -> dict[str, object] | None:
-        preferred_by_event = {
-            "project.goal.defined": "os.generate_bom",
-            "part.candidate.added": "os.update_project_plan",
-            "purchase.requested": "os.request_purchase_approval",
-            "purchase.completed": "os.record_purchase",
-            "test.result.recorded": "os.update_project_plan",
-        }
-        preferred = preferred_by_event.get(event_type)
+        preferred = _PREFERRED_ACTIONS.get(event_type)
         if preferred is None:
             return None
-        for action in actions:
-            if str(action.get("action_type", "")) == preferred:
-                return action
-        return None
+        return next((action for action in actions if action.get("action_type") == preferred), None)
 
     @staticmethod
     def _select_primary_action(actions: list[dict[str, object]]) -> dict[str, object] | None:
@@ -409,27 +482,21 @@ class OSRoboticsDecisionPlugin(DecisionPlugin):
         return best
 
     @staticmethod
-    def _twin(state: dict[str, object]) -> RobotProjectState:
-        os_state = state.get("pce_os")
-        if isinstance(os_state, dict) and isinstance(os_state.get("robotics_twin"), dict):
-            return RobotProjectState.model_validate(os_state["robotics_twin"])
-        return RobotProjectState()
-
-    @staticmethod
-    def _projected_cost(event: PCEEvent, twin: RobotProjectState) -> float:
+    def _projected_cost(event: PCEEvent, twin: TwinView) -> float:
         if "projected_cost" in event.payload:
             return float(event.payload.get("projected_cost", 0.0))
-        return float(twin.cost_projection.projected_total_cost)
+        return twin.projected_total_cost
 
 
 class OSRoboticsAdaptationPlugin(AdaptationPlugin):
     """Feedback adaptation with bounded changes on risk/cost projections."""
 
     name = "os.robotics.adaptation"
+    domains = frozenset({_OS_DOMAIN})
 
     def match(self, event: PCEEvent, state: dict[str, object], result: ExecutionResult) -> bool:
         _ = (state, result)
-        return str(event.payload.get("domain")) == "os.robotics"
+        return event.payload.get("domain") == _OS_DOMAIN
 
     def adapt(
         self,
@@ -438,31 +505,28 @@ class OSRoboticsAdaptationPlugin(AdaptationPlugin):
         result: ExecutionResult,
     ) -> dict[str, object]:
         _ = result
-        os_state = state.get("pce_os")
-        if not isinstance(os_state, dict):
-            os_state = {}
-
-        twin_payload = os_state.get("robotics_twin")
-        if isinstance(twin_payload, dict):
-            twin = RobotProjectState.model_validate(twin_payload)
-        else:
-            twin = RobotProjectState()
-
-        if event.event_type == "test.result.recorded":
-            outcome = bool(event.payload.get("passed", False))
-            risk_shift = -0.05 if outcome else 0.08
-            cost_shift = -0.02 if outcome else 0.04
-            current_conf = twin.cost_projection.confidence
-            next_conf = max(0.1, min(0.95, current_conf + risk_shift))
-            next_cost = max(0.0, twin.cost_projection.projected_total_cost * (1 + cost_shift))
-            twin.cost_projection = twin.cost_projection.model_copy(
-                update={
-                    "projected_total_cost": round(next_cost, 2),
-                    "confidence": round(next_conf, 2),
-                }
-            )
-            twin.risk_level = "LOW" if outcome else "MEDIUM"
-
-        os_state["robotics_twin"] = twin.model_dump(mode="json")
-        state["pce_os"] = os_state
-        return state
+        if event.event_type != "test.result.recorded":
+            return state
+
+        twin = RobotTwinStore.view(state)
+        outcome = bool(event.payload.get("passed", False))
+        risk_shift = -0.05 if outcome else 0.08
+        cost_shift = -0.02 if outcome else 0.04
+        next_conf = max(0.1, min(0.95, twin.cost_confidence + risk_shift))
+        next_cost = max(0.0, twin.projected_total_cost * (1 + cost_shift))
+
+        twin_payload = RobotTwinStore.slice_payload(state)
+        cost_projection = twin_payload.get("cost_projection")
+        if not isinstance(cost_projection, dict):
+            cost_projection = {}
+        # The slice may back a cached twin: write a new payload instead of mutating it.
+        next_payload = {
+            **twin_payload,
+            "cost_projection": {
+                **cost_projection,
+                "projected_total_cost": round(next_cost, 2),
+                "confidence": round(next_conf, 2),
+            },
+            "risk_level": "LOW" if outcome else "MEDIUM",
+        }
+        return with_os_slice(state, robotics_twin=next_payload)
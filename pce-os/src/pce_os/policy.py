@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from copy import deepcopy
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
+import orjson
 from pce.core.types import ActionPlan
 
-_PENDING_APPROVALS_SLICE = "pending_approvals"
+from pce_os.state import OS_SLICE, os_slice, with_os_slice
+
 logger = logging.getLogger(__name__)
 
+# Action types that always require approval, regardless of cost or risk.
+_MANDATORY_GATE_ACTION_TYPES = frozenset({"os.request_purchase_approval"})
+_MANDATORY_GATE_ACTION_PREFIXES = ("purchase.",)
+_SNAPSHOT_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+# Bookkeeping slices left out of approval snapshots: they change with every approval
+# (or hold the snapshots themselves), so keeping them would defeat content addressing.
+_SNAPSHOT_EXCLUDED_KEYS = frozenset(
+    {"approval_snapshots", "approval_counts", "approvals_index", "pending_approvals", "transcript"}
+)
+
 
 class ApprovalGate:
     """Approve-to-execute policy manager operating on state snapshots."""
@@ -24,7 +36,9 @@ class ApprovalGate:
     ) -> tuple[bool, str]:
         """Decide whether a plan must enter pending approvals."""
         action_type = plan.action_type
-        if action_type.startswith("purchase.") or action_type == "os.request_purchase_approval":
+        if action_type in _MANDATORY_GATE_ACTION_TYPES or action_type.startswith(
+            _MANDATORY_GATE_ACTION_PREFIXES
+        ):
             return True, "purchase_flow_mandatory_gate"
 
         metadata = plan.metadata
@@ -48,9 +62,15 @@ class ApprovalGate:
         state: dict[str, object],
         metadata: dict[str, Any] | None = None,
     ) -> tuple[dict[str, Any], dict[str, object]]:
-        """Return created pending record and updated state (without persistence)."""
+        """Return created pending record and updated state (without persistence).
+
+        ``snapshot_state`` is stored once per distinct content in the
+        ``approval_snapshots`` slice, without the approval and transcript bookkeeping of
+        ``pce_os``; the record keeps its ``snapshot_ref``.
+        """
         approvals = self._list_all_approvals(state)
         approval_id = str(uuid4())
+        snapshots, snapshot_ref = self._store_snapshot(state, snapshot_state)
         record: dict[str, Any] = {
             "approval_id": approval_id,
             "decision_id": decision_id,
@@ -62,7 +82,7 @@ class ApprovalGate:
             "projected_cost": float(plan.metadata.get("projected_cost", 0.0)),
             "risk": str(plan.metadata.get("risk_level", "LOW")),
             "metadata": metadata or {},
-            "snapshot_state": snapshot_state,
+            "snapshot_ref": snapshot_ref,
             "plan": {
                 "action_type": plan.action_type,
                 "rationale": plan.rationale,
@@ -71,7 +91,11 @@ class ApprovalGate:
             },
         }
         approvals.append(record)
-        return record, self._write_approvals(state, approvals)
+        counts = self.approval_counts(state)
+        counts["pending"] = counts.get("pending", 0) + 1
+        index = dict(self._approvals_index(state))
+        index[approval_id] = len(approvals) - 1
+        return record, self._write_approvals(state, approvals, counts, index, snapshots)
 
     def transition_approve(
         self,
@@ -102,19 +126,25 @@ class ApprovalGate:
     ) -> tuple[dict[str, Any], dict[str, object]]:
         """Force resolve one pending request as overridden."""
         approvals = self._list_all_approvals(state)
-        for item in approvals:
-            if isinstance(item, dict) and item.get("approval_id") == approval_id:
-                item["status"] = "overridden"
-                item["resolved_at"] = datetime.now(UTC).isoformat()
-                item["actor"] = actor
-                item["summary"] = notes
-                metadata = item.get("metadata")
-                if not isinstance(metadata, dict):
-                    metadata = {}
-                metadata["override"] = True
-                item["metadata"] = metadata
-                return item, self._write_approvals(state, approvals)
-        raise ValueError(f"Approval '{approval_id}' not found")
+        index = self._approvals_index(state)
+        position = self._find_approval(approvals, index, approval_id)
+        if position is None:
+            raise ValueError(f"Approval '{approval_id}' not found")
+        item = approvals[position]
+        counts = self._shift_count(state, str(item.get("status", "")), "overridden")
+        metadata = item.get("metadata")
+        updated = {
+            **item,
+            "status": "overridden",
+            "resolved_at": datetime.now(UTC).isoformat(),
+            "actor": actor,
+            "summary": notes,
+            "metadata": {**metadata, "override": True}
+            if isinstance(metadata, dict)
+            else {"override": True},
+        }
+        approvals[position] = updated
+        return updated, self._write_approvals(state, approvals, counts, index)
 
     def build_approval_event(
         self,
@@ -171,11 +201,25 @@ class ApprovalGate:
 
     def get_approval(self, state: dict[str, object], approval_id: str) -> dict[str, Any]:
         """Return one approval record by id."""
-        for item in self._list_all_approvals(state):
-            if item.get("approval_id") == approval_id:
-                return item
+        approvals = os_slice(state).get("pending_approvals")
+        if isinstance(approvals, list):
+            position = self._find_approval(approvals, self._approvals_index(state), approval_id)
+            if position is not None:
+                return approvals[position]
         raise ValueError(f"Approval '{approval_id}' not found")
 
+    def get_snapshot(self, state: dict[str, object], approval_id: str) -> dict[str, Any]:
+        """Return the state snapshot captured when ``approval_id`` was enqueued."""
+        record = self.get_approval(state, approval_id)
+        legacy = record.get("snapshot_state")
+        if isinstance(legacy, dict):
+            return legacy
+        snapshots = os_slice(state).get("approval_snapshots", {})
+        snapshot = snapshots.get(str(record.get("snapshot_ref", "")))
+        if not isinstance(snapshot, dict):
+            raise ValueError(f"Snapshot for approval '{approval_id}' not found")
+        return snapshot
+
     def list_pending(self, state: dict[str, object]) -> list[dict[str, Any]]:
         """List pending approvals from an in-memory state snapshot."""
         return [
@@ -188,6 +232,21 @@ class ApprovalGate:
         """List all approvals, including resolved entries."""
         return self._list_all_approvals(state)
 
+    def approval_counts(self, state: dict[str, object]) -> dict[str, int]:
+        """Return approval totals by status, maintained on every gate transition.
+
+        States persisted before counters existed are counted once from the record list;
+        the result is written back on the next gate transition.
+        """
+        counts = os_slice(state).get("approval_counts")
+        if isinstance(counts, dict):
+            return {str(status): int(total) for status, total in counts.items()}
+        derived: dict[str, int] = {}
+        for item in self._list_all_approvals(state):
+            status = str(item.get("status", ""))
+            derived[status] = derived.get(status, 0) + 1
+        return derived
+
     def _transition(
         self,
         approval_id: str,
@@ -197,52 +256,134 @@ class ApprovalGate:
         state: dict[str, object],
     ) -> tuple[dict[str, Any], dict[str, object]]:
         approvals = self._list_all_approvals(state)
+        index = self._approvals_index(state)
+        position = self._find_approval(approvals, index, approval_id)
+        if position is None:
+            raise ValueError(f"Approval '{approval_id}' not found")
 
-        for item in approvals:
-            if isinstance(item, dict) and item.get("approval_id") == approval_id:
-                item["status"] = "approved" if approved else "rejected"
-                item["resolved_at"] = datetime.now(UTC).isoformat()
-                item["actor"] = actor
-                item["summary"] = summary
-                next_state = self._write_approvals(state, approvals)
-                logger.info(
-                    "approval_resolved approval_id=%s decision_id=%s status=%s",
-                    approval_id,
-                    item.get("decision_id"),
-                    item["status"],
-                )
-                return item, next_state
-        raise ValueError(f"Approval '{approval_id}' not found")
+        item = approvals[position]
+        status = "approved" if approved else "rejected"
+        counts = self._shift_count(state, str(item.get("status", "")), status)
+        # Records are shared with ``state``: replace the entry rather than mutating it.
+        item = {
+            **item,
+            "status": status,
+            "resolved_at": datetime.now(UTC).isoformat(),
+            "actor": actor,
+            "summary": summary,
+        }
+        approvals[position] = item
+        next_state = self._write_approvals(state, approvals, counts, index)
+        logger.info(
+            "approval_resolved approval_id=%s decision_id=%s status=%s",
+            approval_id,
+            item.get("decision_id"),
+            item["status"],
+        )
+        return item, next_state
 
     @staticmethod
     def _list_all_approvals(state: dict[str, object]) -> list[dict[str, Any]]:
-        os_state = state.get("pce_os")
-        if not isinstance(os_state, dict):
-            return []
-        pending = os_state.get(_PENDING_APPROVALS_SLICE)
+        pending = os_slice(state).get("pending_approvals")
         if not isinstance(pending, list):
             return []
         return [item for item in pending if isinstance(item, dict)]
 
+    @staticmethod
+    def _approvals_index(state: dict[str, object]) -> dict[str, int]:
+        """Return approval positions by id, derived from the record list for older states."""
+        index = os_slice(state).get("approvals_index")
+        if isinstance(index, dict):
+            return index
+        pending = os_slice(state).get("pending_approvals")
+        if not isinstance(pending, list):
+            return {}
+        return {
+            str(item.get("approval_id")): position
+            for position, item in enumerate(pending)
+            if isinstance(item, dict)
+        }
+
+    @staticmethod
+    def _find_approval(
+        approvals: list[Any],
+        index: dict[str, int],
+        approval_id: str,
+    ) -> int | None:
+        """Return the position of ``approval_id`` in ``approvals``, or None."""
+        position = index.get(approval_id)
+        if position is not None and 0 <= position < len(approvals):
+            item = approvals[position]
+            if isinstance(item, dict) and item.get("approval_id") == approval_id:
+                return position
+        if position is None and len(index) == len(approvals):
+            return None
+        # Index out of step with the list (e.g. malformed entries were dropped): scan.
+        for scanned, item in enumerate(approvals):
+            if isinstance(item, dict) and item.get("approval_id") == approval_id:
+                return scanned
+        return None
+
+    def _shift_count(
+        self,
+        state: dict[str, object],
+        from_status: str,
+        to_status: str,
+    ) -> dict[str, int]:
+        counts = self.approval_counts(state)
+        if counts.get(from_status, 0) > 0:
+            counts[from_status] -= 1
+        counts[to_status] = counts.get(to_status, 0) + 1
+        return counts
+
+    @staticmethod
+    def _store_snapshot(
+        state: dict[str, object],
+        snapshot_state: dict[str, object],
+    ) -> tuple[dict[str, dict[str, Any]], str]:
+        """Add ``snapshot_state`` to the content-addressed store; return store and ref.
+
+        Approval and transcript bookkeeping (including the store itself) is left out of
+        the snapshot, so equal twin and business state shares one entry.
+        """
+        snapshot = dict(snapshot_state)
+        snapshot_os = snapshot.get(OS_SLICE)
+        if isinstance(snapshot_os, dict) and not _SNAPSHOT_EXCLUDED_KEYS.isdisjoint(snapshot_os):
+            snapshot[OS_SLICE] = {
+                key: value
+                for key, value in snapshot_os.items()
+                if key not in _SNAPSHOT_EXCLUDED_KEYS
+            }
+        digest = hashlib.blake2b(orjson.dumps(snapshot, option=_SNAPSHOT_JSON), digest_size=16)
+        snapshot_ref = digest.hexdigest()
+        snapshots = os_slice(state).get("approval_snapshots")
+        if not isinstance(snapshots, dict):
+            snapshots = {}
+        if snapshot_ref not in snapshots:
+            snapshots = {**snapshots, snapshot_ref: snapshot}
+        return snapshots, snapshot_ref
+
     @staticmethod
     def _write_approvals(
         state: dict[str, object],
         approvals: list[dict[str, Any]],
+        counts: dict[str, int],
+        index: dict[str, int],
+        snapshots: dict[str, dict[str, Any]] | None = None,
     ) -> dict[str, object]:
-        next_state = deepcopy(state)
-        os_state = next_state.get("pce_os")
-        if not isinstance(os_state, dict):
-            os_state = {}
-        os_state[_PENDING_APPROVALS_SLICE] = approvals
-        next_state["pce_os"] = os_state
-        return next_state
+        if len(index) != len(approvals):
+            index = {str(item.get("approval_id")): pos for pos, item in enumerate(approvals)}
+        updates: dict[str, object] = {
+            "pending_approvals": approvals,
+            "approval_counts": counts,
+            "approvals_index": index,
+        }
+        if snapshots is not None:
+            updates["approval_snapshots"] = snapshots
+        # Only the pce_os slice changes: share everything else (twin, snapshots) with state.
+        return with_os_slice(state, **updates)
 
     @staticmethod
     def _read_twin(state: dict[str, object]) -> dict[str, Any]:
-        os_state = state.get("pce_os")
-        if not isinstance(os_state, dict):
-            return {}
-        twin = os_state.get("robotics_twin")
-        if not isinstance(twin, dict):
-            return {}
-        return twin
+        twin = os_slice(state).get("robotics_twin")
+        return twin if isinstance(twin, dict) else {}
@@ -0,0 +1,48 @@
+"""Typed views over the ``pce_os`` slice of the global PCE state."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, TypedDict, cast
+
+OS_SLICE = "pce_os"
+
+
+class TranscriptSlice(TypedDict, total=False):
+    """Persisted transcript ring buffer."""
+
+    cursor: int
+    items: list[dict[str, Any]]
+
+
+class PceOsState(TypedDict, total=False):
+    """Known keys of the ``pce_os`` state slice."""
+
+    robotics_twin: dict[str, Any]
+    pending_approvals: list[dict[str, Any]]
+    approval_counts: dict[str, int]
+    approvals_index: dict[str, int]
+    approval_snapshots: dict[str, dict[str, Any]]
+    transcript: TranscriptSlice
+
+
+def os_slice(state: Mapping[str, object]) -> PceOsState:
+    """Return the ``pce_os`` slice, or an empty read-only view when absent or malformed."""
+    os_state = state.get(OS_SLICE)
+    if isinstance(os_state, dict):
+        return cast(PceOsState, os_state)
+    return {}
+
+
+def with_os_slice(state: Mapping[str, object], **updates: object) -> dict[str, object]:
+    """Return a copy of ``state`` whose ``pce_os`` slice has ``updates`` applied.
+
+    Only the top-level mapping and the ``pce_os`` slice are copied; every other value
+    is shared with ``state``, which is left untouched.
+    """
+    next_state = dict(state)
+    os_state = state.get(OS_SLICE)
+    next_os_state = dict(os_state) if isinstance(os_state, dict) else {}
+    next_os_state.update(updates)
+    next_state[OS_SLICE] = next_os_state
+    return next_state
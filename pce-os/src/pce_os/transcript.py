@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from datetime import UTC, datetime
 from typing import Any
 
-_TRANSCRIPT_KEY = "transcript"
+from pce_os.state import TranscriptSlice, os_slice, with_os_slice
+
 _MAX_ITEMS = 500
 
 
+def _transcript_slice(state: dict[str, object]) -> TranscriptSlice:
+    transcript = os_slice(state).get("transcript")
+    return transcript if isinstance(transcript, dict) else {}
+
+
 def read_transcript(state: dict[str, object]) -> dict[str, Any]:
     """Return normalized transcript payload from state."""
-    os_state = state.get("pce_os")
-    if not isinstance(os_state, dict):
-        return {"cursor": 0, "items": []}
-
-    transcript = os_state.get(_TRANSCRIPT_KEY)
-    if not isinstance(transcript, dict):
+    transcript = _transcript_slice(state)
+    if not transcript:
         return {"cursor": 0, "items": []}
 
     cursor = int(transcript.get("cursor", 0))
@@ -26,6 +27,11 @@ def read_transcript(state: dict[str, object]) -> dict[str, Any]:
     return {"cursor": cursor, "items": items}
 
 
+def transcript_cursor(state: dict[str, object]) -> int:
+    """Return the latest transcript cursor without normalizing the item list."""
+    return int(_transcript_slice(state).get("cursor", 0))
+
+
 def append_transcript_item(
     state: dict[str, object],
     *,
@@ -37,32 +43,76 @@ def append_transcript_item(
     ts: str | None = None,
 ) -> tuple[dict[str, object], dict[str, Any]]:
     """Append one transcript record, preserving max ring size."""
-    next_state = deepcopy(state)
-    os_state = next_state.get("pce_os")
-    if not isinstance(os_state, dict):
-        os_state = {}
-
-    transcript = read_transcript(next_state)
-    next_cursor = int(transcript["cursor"]) + 1
-    item = {
-        "cursor": next_cursor,
-        "ts": ts or datetime.now(UTC).isoformat(),
-        "kind": kind,
-        "agent": agent,
-        "payload": payload,
-        "correlation_id": correlation_id,
-        "decision_id": decision_id,
-    }
-    items = [*transcript["items"], item]
-    if len(items) > _MAX_ITEMS:
-        items = items[-_MAX_ITEMS:]
-
-    os_state[_TRANSCRIPT_KEY] = {"cursor": next_cursor, "items": items}
-    next_state["pce_os"] = os_state
-    return next_state, item
+    next_state, items = append_transcript_items(
+        state,
+        [
+            {
+                "kind": kind,
+                "agent": agent,
+                "payload": payload,
+                "correlation_id": correlation_id,
+                "decision_id": decision_id,
+            }
+        ],
+        ts=ts,
+    )
+    return next_state, items[0]
 
 
-def items_since(state: dict[str, object], cursor: int) -> list[dict[str, Any]]:
-    """Return transcript items newer than cursor."""
+def append_transcript_items(
+    state: dict[str, object],
+    records: list[dict[str, Any]],
+    *,
+    ts: str | None = None,
+) -> tuple[dict[str, object], list[dict[str, Any]]]:
+    """Append several transcript records with a single state copy.
+
+    Each record provides ``kind``, ``payload`` and ``correlation_id`` plus optional
+    ``decision_id``/``agent``; cursors are assigned in order. Only the ``pce_os`` slice
+    shell and the item list are copied: stored items and payloads are shared with
+    ``state`` and the caller, and must not be mutated afterwards.
+    """
     transcript = read_transcript(state)
-    return [item for item in transcript["items"] if int(item.get("cursor", 0)) > cursor]
+    cursor = int(transcript["cursor"])
+    stamp = ts or datetime.now(UTC).isoformat()
+    appended: list[dict[str, Any]] = []
+    for record in records:
+        cursor += 1
+        appended.append(
+            {
+                "cursor": cursor,
+                "ts": stamp,
+                "kind": record["kind"],
+                "agent": record.get("agent", ""),
+                "payload": record["payload"],
+                "correlation_id": record["correlation_id"],
+                "decision_id": record.get("decision_id", ""),
+            }
+        )
+    # read_transcript returns a fresh list, so it can be extended and trimmed in place.
+    items = transcript["items"]
+    items.extend(appended)
+    del items[:-_MAX_ITEMS]
+
+    next_state = with_os_slice(state, transcript={"cursor": cursor, "items": items})
+    return next_state, appended
+
+
+def items_since(state: dict[str, object], cursor: int) -> list[dict[str, Any]]:
+    """Return transcript items newer than cursor.
+
+    Retained items carry contiguous cursors, so the start offset is derived from the
+    oldest retained item and only the returned tail is scanned.
+    """
+    raw_items = _transcript_slice(state).get("items", [])
+    if not isinstance(raw_items, list) or not raw_items:
+        return []
+    oldest = raw_items[0]
+    start = 0
+    if isinstance(oldest, dict):
+        start = max(0, cursor - int(oldest.get("cursor", 0)) + 1)
+    return [
+        item
+        for item in raw_items[start:]
+        if isinstance(item, dict) and int(item.get("cursor", 0)) > cursor
+    ]
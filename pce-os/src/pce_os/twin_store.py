@@ -2,27 +2,74 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, ClassVar
 
 from pce.sm.manager import StateManager
+from pydantic import TypeAdapter
 
 from pce_os.models import (
     Component,
     CostProjection,
+    RiskLevel,
     RobotProjectState,
     SimulationResult,
     TestResult,
 )
+from pce_os.state import os_slice, with_os_slice
 
-_OS_SLICE = "pce_os"
-_TWIN_SLICE = "robotics_twin"
 _UNKNOWN_EVENT_AT = "unknown"
+_RISK_LEVELS: dict[str, RiskLevel] = {"LOW": "LOW", "MEDIUM": "MEDIUM", "HIGH": "HIGH"}
+# Twin lists that events only append to; their JSON dump is extended, not rebuilt.
+_APPEND_ONLY_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "risks": TypeAdapter(list[str]),
+    "simulations": TypeAdapter(list[SimulationResult]),
+    "tests": TypeAdapter(list[TestResult]),
+    "purchase_history": TypeAdapter(list[dict[str, object]]),
+    "audit_trail": TypeAdapter(list[dict[str, object]]),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class TwinView:
+    """Scalar twin fields read straight from the persisted slice, without validation.
+
+    The slice is always written from a validated :class:`RobotProjectState`, so plugins
+    that only need these fields can skip rebuilding the model; defaults match it.
+    """
+
+    phase: str = "planning"
+    budget_total: float = 0.0
+    budget_remaining: float = 0.0
+    risk_level: str = "LOW"
+    projected_total_cost: float = 0.0
+    cost_confidence: float = 0.5
+
+    @classmethod
+    def from_payload(cls, twin_payload: dict[str, Any] | None) -> TwinView:
+        if not twin_payload:
+            return cls()
+        cost_projection = twin_payload.get("cost_projection")
+        if not isinstance(cost_projection, dict):
+            cost_projection = {}
+        return cls(
+            phase=str(twin_payload.get("phase", "planning")),
+            budget_total=float(twin_payload.get("budget_total", 0.0)),
+            budget_remaining=float(twin_payload.get("budget_remaining", 0.0)),
+            risk_level=str(twin_payload.get("risk_level", "LOW")),
+            projected_total_cost=float(cost_projection.get("projected_total_cost", 0.0)),
+            cost_confidence=float(cost_projection.get("confidence", 0.5)),
+        )
 
 
 class RobotTwinStore:
     """Stateless helpers for reading/writing and evolving robotics twin state."""
 
+    # Last twin parsed from (or dumped into) a state slice, keyed by slice identity.
+    _memo: ClassVar[tuple[dict[str, Any], RobotProjectState] | None] = None
+    # Last JSON dump produced for a twin, keyed by model identity.
+    _dump_memo: ClassVar[tuple[RobotProjectState, dict[str, Any]] | None] = None
+
     @staticmethod
     def load(sm: StateManager) -> RobotProjectState:
         """Load twin state from persistent state manager."""
@@ -31,27 +78,83 @@ class RobotTwinStore:
     @staticmethod
     def from_state(state: dict[str, object]) -> RobotProjectState:
         """Load twin state from an in-memory state snapshot."""
-        os_payload = state.get(_OS_SLICE)
-        if not isinstance(os_payload, dict):
-            return RobotProjectState()
-        twin_payload = os_payload.get(_TWIN_SLICE)
-        if not isinstance(twin_payload, dict):
+        twin_payload = RobotTwinStore._twin_payload(state)
+        if twin_payload is None:
             return RobotProjectState()
         return RobotProjectState.model_validate(twin_payload)
 
+    @staticmethod
+    def view(state: dict[str, object]) -> TwinView:
+        """Read the scalar twin fields from ``state`` without Pydantic validation."""
+        return TwinView.from_payload(RobotTwinStore._twin_payload(state))
+
+    @staticmethod
+    def slice_payload(state: dict[str, object]) -> dict[str, Any]:
+        """Return the persisted twin slice as-is: already JSON-ready, shared and read-only.
+
+        A default twin is dumped when the slice is absent.
+        """
+        twin_payload = RobotTwinStore._twin_payload(state)
+        if twin_payload is None:
+            return RobotProjectState().model_dump(mode="json")
+        return twin_payload
+
+    @staticmethod
+    def get_cached(state: dict[str, object]) -> RobotProjectState:
+        """Like :meth:`from_state`, reusing the twin already built for the same slice object.
+
+        The returned model may be shared with other readers and must not be mutated.
+        """
+        twin_payload = RobotTwinStore._twin_payload(state)
+        if twin_payload is None:
+            return RobotProjectState()
+        memo = RobotTwinStore._memo
+        if memo is not None and memo[0] is twin_payload:
+            return memo[1]
+        twin = RobotProjectState.model_validate(twin_payload)
+        RobotTwinStore._memo = (twin_payload, twin)
+        return twin
+
+    @staticmethod
+    def dump_cached(twin: RobotProjectState) -> dict[str, Any]:
+        """Serialize ``twin`` for the state slice and remember it for :meth:`get_cached`.
+
+        Callers hand over ``twin``: it must not be mutated after this call. When ``twin``
+        extends the last memoized twin, append-only lists reuse that twin's dump and only
+        the new tail is serialized.
+        """
+        memo = RobotTwinStore._memo
+        if memo is None:
+            twin_payload = twin.model_dump(mode="json")
+        else:
+            twin_payload = RobotTwinStore._dump_extending(twin, *memo)
+        RobotTwinStore._memo = (twin_payload, twin)
+        RobotTwinStore._dump_memo = (twin, twin_payload)
+        return twin_payload
+
+    @staticmethod
+    def json_snapshot(twin: RobotProjectState) -> dict[str, Any]:
+        """Return ``twin.model_dump(mode="json")``, reused while the same twin is served.
+
+        Intended for twins from :meth:`get_cached`; the result is shared and read-only.
+        """
+        memo = RobotTwinStore._dump_memo
+        if memo is not None and memo[0] is twin:
+            return memo[1]
+        twin_payload = twin.model_dump(mode="json")
+        RobotTwinStore._dump_memo = (twin, twin_payload)
+        return twin_payload
+
     @staticmethod
     def write_into_state_slice(
         state: dict[str, object],
         twin: RobotProjectState,
     ) -> dict[str, object]:
-        """Return a copy of ``state`` with the robotics twin persisted into ``pce_os``."""
-        next_state = deepcopy(state)
-        os_payload = next_state.get(_OS_SLICE)
-        if not isinstance(os_payload, dict):
-            os_payload = {}
-        os_payload[_TWIN_SLICE] = twin.model_dump(mode="json")
-        next_state[_OS_SLICE] = os_payload
-        return next_state
+        """Return a copy of ``state`` with the robotics twin persisted into ``pce_os``.
+
+        Slices other than ``pce_os`` are shared with ``state`` rather than deep-copied.
+        """
+        return with_os_slice(state, robotics_twin=RobotTwinStore.dump_cached(twin))
 
     @staticmethod
     def apply_event(
@@ -60,60 +163,103 @@ class RobotTwinStore:
         payload: dict[str, Any],
         metadata: dict[str, Any] | None = None,
     ) -> RobotProjectState:
-        """Apply one domain event deterministically and return updated twin state."""
+        """Apply one domain event deterministically and return updated twin state.
+
+        ``twin`` is left untouched; the returned twin shares every field the event does
+        not change with it, and only the lists that grow are copied. ``payload`` and
+        ``metadata`` are copied one level deep: nested values are shared with the audit
+        trail, so callers must not mutate them after the event is applied.
+        """
         metadata = metadata or {}
-        next_state = twin.model_copy(deep=True)
+        updates: dict[str, Any] = {}
 
         event_record: dict[str, object] = {
             "event_type": event_type,
-            "payload": deepcopy(payload),
-            "metadata": deepcopy(metadata),
+            "payload": dict(payload),
+            "metadata": dict(metadata),
             "at": RobotTwinStore._resolve_event_at(metadata),
         }
 
         if event_type == "project.goal.defined":
-            next_state.phase = str(payload.get("phase", "planning"))
+            updates["phase"] = str(payload.get("phase", "planning"))
         elif event_type == "budget.updated":
-            budget_total = float(payload.get("budget_total", next_state.budget_total))
-            next_state.budget_total = budget_total
-            next_state.budget_remaining = float(payload.get("budget_remaining", budget_total))
+            budget_total = float(payload.get("budget_total", twin.budget_total))
+            updates["budget_total"] = budget_total
+            updates["budget_remaining"] = float(payload.get("budget_remaining", budget_total))
         elif event_type == "part.candidate.added":
             component = Component.model_validate(payload)
-            next_state.components = [
-                comp
-                for comp in next_state.components
-                if comp.component_id != component.component_id
-            ] + [component]
-            next_state.cost_projection = RobotTwinStore._project_cost(next_state)
+            components = [
+                comp for comp in twin.components if comp.component_id != component.component_id
+            ]
+            components.append(component)
+            updates["components"] = components
+            updates["cost_projection"] = RobotTwinStore._project_cost(components)
         elif event_type == "purchase.completed":
             spent = float(payload.get("total_cost", 0.0))
-            next_state.budget_remaining -= spent
-            next_state.purchase_history.append({"status": "completed", **deepcopy(payload)})
-            next_state.cost_projection = RobotTwinStore._project_cost(next_state)
+            updates["budget_remaining"] = twin.budget_remaining - spent
+            updates["actual_purchase_spend"] = twin.actual_purchase_spend + spent
+            updates["purchase_history"] = [
+                *twin.purchase_history,
+                {"status": "completed", **payload},
+            ]
+            updates["cost_projection"] = RobotTwinStore._project_cost(twin.components)
         elif event_type == "part.received":
             component_id = str(payload.get("component_id", ""))
-            next_state.components = [
+            updates["components"] = [
                 (
                     comp.model_copy(update={"status": "received"})
                     if comp.component_id == component_id
                     else comp
                 )
-                for comp in next_state.components
+                for comp in twin.components
             ]
         elif event_type == "test.result.recorded":
             test_result = TestResult.model_validate(payload)
-            next_state.tests.append(test_result)
+            updates["tests"] = [*twin.tests, test_result]
         elif event_type == "test.executed":
             simulation = SimulationResult.model_validate(payload)
-            next_state.simulations.append(simulation)
-            next_state.risk_level = simulation.projected_risk_level
+            updates["simulations"] = [*twin.simulations, simulation]
+            updates["risk_level"] = simulation.projected_risk_level
         elif event_type == "risk.detected":
-            risk = str(payload.get("description", "unknown risk"))
-            next_state.risks.append(risk)
-            next_state.risk_level = str(payload.get("risk_level", "HIGH"))
+            updates["risks"] = [*twin.risks, str(payload.get("description", "unknown risk"))]
+            # Unknown levels would not survive re-validation of the persisted twin.
+            updates["risk_level"] = _RISK_LEVELS.get(str(payload.get("risk_level")), "HIGH")
+
+        updates["audit_trail"] = [*twin.audit_trail, event_record]
+        return twin.model_copy(update=updates)
+
+    @staticmethod
+    def _dump_extending(
+        twin: RobotProjectState,
+        previous_payload: dict[str, Any],
+        previous: RobotProjectState,
+    ) -> dict[str, Any]:
+        extended: dict[str, list[Any]] = {}
+        for name, adapter in _APPEND_ONLY_ADAPTERS.items():
+            old_items: list[Any] = getattr(previous, name)
+            new_items: list[Any] = getattr(twin, name)
+            old_dump = previous_payload.get(name)
+            # Items are frozen models or records never mutated after apply_event, so an
+            # identical prefix is already dumped.
+            if (
+                isinstance(old_dump, list)
+                and len(old_dump) == len(old_items) <= len(new_items)
+                and all(old is new for old, new in zip(old_items, new_items, strict=False))
+            ):
+                tail = adapter.dump_python(new_items[len(old_items) :], mode="json")
+                extended[name] = [*old_dump, *tail]
+        if not extended:
+            return twin.model_dump(mode="json")
+        fresh = twin.model_dump(mode="json", exclude=set(extended))
+        return {
+            name: extended[name] if name in extended else fresh[name]
+            for name in RobotProjectState.model_fields
+        }
 
-        next_state.audit_trail.append(event_record)
-        return next_state
+    @staticmethod
+    def _twin_payload(state: dict[str, object]) -> dict[str, Any] | None:
+        twin_payload = os_slice(state).get("robotics_twin")
+        return twin_payload if isinstance(twin_payload, dict) else None
 
     @staticmethod
     def _resolve_event_at(metadata: dict[str, Any]) -> str:
@@ -121,11 +267,11 @@ class RobotTwinStore:
         return str(event_at) if event_at is not None else _UNKNOWN_EVENT_AT
 
     @staticmethod
-    def _project_cost(state: RobotProjectState) -> CostProjection:
-        total = sum(comp.estimated_unit_cost * comp.quantity for comp in state.components)
-        high_risk_parts = sum(1 for comp in state.components if comp.risk_level == "HIGH")
+    def _project_cost(components: list[Component]) -> CostProjection:
+        total = sum(comp.estimated_unit_cost * comp.quantity for comp in components)
+        high_risk_parts = sum(1 for comp in components if comp.risk_level == "HIGH")
         return CostProjection(
             projected_total_cost=round(total, 2),
             projected_risk_buffer=round(total * 0.1 + high_risk_parts * 50, 2),
-            confidence=0.55 if state.components else 0.5,
+            confidence=0.55 if components else 0.5,
         )
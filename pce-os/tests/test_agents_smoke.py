@@ -33,3 +33,43 @@ def test_agents_smoke_outputs_shape() -> None:
         assert isinstance(output.questions, list)
         assert isinstance(output.confidence, float)
         assert isinstance(output.rationale, str)
+
+
+def test_engineering_cycle_detection_handles_deep_graphs() -> None:
+    chain = {f"n{i}": [f"n{i + 1}"] for i in range(5000)}
+    chain["n5000"] = []
+    assert not EngineeringAgent._has_cycle(chain)
+
+    chain["n5000"] = ["n0"]
+    assert EngineeringAgent._has_cycle(chain)
+    assert EngineeringAgent._has_cycle({"a": ["a"]})
+    assert not EngineeringAgent._has_cycle({"a": ["b", "c"], "b": ["c"], "c": []})
+
+
+def test_engineering_graph_analysis_reports_cycle_and_missing_together() -> None:
+    edges = {"a": ["b", "x"], "b": ["a", "y"], "c": ["x"]}
+
+    assert EngineeringAgent._analyze_graph(edges) == (True, {"x", "y"})
+    assert EngineeringAgent._analyze_graph({"a": []}) == (False, set())
+
+
+def test_engineering_graph_analysis_is_reused_for_the_same_snapshot() -> None:
+    edges = {"a": ["z"]}
+
+    first = EngineeringAgent._cached_graph_analysis(edges)
+    assert first == (False, frozenset({"z"}))
+    assert EngineeringAgent._cached_graph_analysis(edges) is first
+    assert EngineeringAgent._cached_graph_analysis({"a": ["z"]}) is not first
+
+
+def test_null_llm_client_is_never_called_when_llm_enabled() -> None:
+    class _ExplodingNullClient(NullLLMClient):
+        def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+            raise AssertionError("null client must be skipped")
+
+    event = PCEEvent(event_type="budget.updated", source="test", payload={"domain": "os.robotics"})
+    agent_input = AgentInput(event=event, twin_snapshot={}, enable_llm=True)
+
+    assert FinanceAgent().uses_llm(agent_input) is False
+    output = FinanceAgent(_ExplodingNullClient()).process(agent_input)
+    assert output.rationale == "Finance heuristics applied."
@@ -1,5 +1,7 @@
+import pytest
 from pce.core.types import ActionPlan
 from pce_os.policy import ApprovalGate
+from pce_os.transcript import append_transcript_item
 
 
 def test_approval_gate_enqueue_and_approve_flow() -> None:
@@ -34,3 +36,68 @@ def test_approval_gate_enqueue_and_approve_flow() -> None:
     assert approved_event["event_type"] == "purchase.completed"
     assert approved_event["payload"]["purchase_id"] == "po-1"
     assert gate.list_pending(approved_state) == []
+    assert gate.approval_counts(with_pending) == {"pending": 1}
+    assert gate.approval_counts(approved_state) == {"pending": 0, "approved": 1}
+
+
+def test_get_approval_uses_index_and_rebuilds_it_for_legacy_state() -> None:
+    gate = ApprovalGate()
+    state: dict[str, object] = {"pce_os": {"robotics_twin": {"budget_remaining": 0.0}}}
+    plan = ActionPlan(action_type="purchase.request", rationale="r", priority=1, metadata={})
+
+    ids = []
+    for n in range(3):
+        record, state = gate.enqueue_pending_approval(f"decision-{n}", plan, {}, state)
+        ids.append(record["approval_id"])
+
+    os_state = state["pce_os"]
+    assert isinstance(os_state, dict)
+    assert os_state["approvals_index"] == {approval_id: pos for pos, approval_id in enumerate(ids)}
+    assert gate.get_approval(state, ids[1])["decision_id"] == "decision-1"
+
+    del os_state["approvals_index"]
+    _, rejected_state = gate.transition_reject(ids[2], "bob", "no", state)
+    assert gate.get_approval(rejected_state, ids[2])["status"] == "rejected"
+
+    with pytest.raises(ValueError, match="not found"):
+        gate.get_approval(rejected_state, "missing")
+
+
+def test_approval_transitions_leave_previous_state_untouched() -> None:
+    gate = ApprovalGate()
+    twin = {"budget_remaining": 100.0}
+    state: dict[str, object] = {"pce_os": {"robotics_twin": twin}, "other": {"k": 1}}
+    plan = ActionPlan(action_type="os.request_purchase_approval", rationale="r", priority=1)
+    pending, with_pending = gate.enqueue_pending_approval("decision-1", plan, state, state)
+
+    _, overridden = gate.transition_override(pending["approval_id"], "alice", "n", with_pending)
+
+    assert gate.get_approval(with_pending, pending["approval_id"])["status"] == "pending"
+    assert "override" not in pending["metadata"]
+    assert gate.get_approval(overridden, pending["approval_id"])["metadata"]["override"] is True
+    assert overridden["other"] is state["other"]
+    assert overridden["pce_os"]["robotics_twin"] is twin
+
+
+def test_approval_snapshots_are_stored_once_by_reference() -> None:
+    gate = ApprovalGate()
+    state: dict[str, object] = {"pce_os": {"robotics_twin": {"budget_remaining": 5.0}}}
+    plan = ActionPlan(action_type="os.request_purchase_approval", rationale="r", priority=1)
+
+    first, state = gate.enqueue_pending_approval("d1", plan, state, state)
+    state, _ = append_transcript_item(state, kind="note", payload={}, correlation_id="c")
+    second, state = gate.enqueue_pending_approval("d2", plan, state, state)
+
+    assert "snapshot_state" not in first
+    # Approval and transcript bookkeeping differ, but the twin does not: one shared entry.
+    assert second["snapshot_ref"] == first["snapshot_ref"]
+    snapshots = state["pce_os"]["approval_snapshots"]
+    assert len(snapshots) == 1
+    assert gate.get_snapshot(state, second["approval_id"]) == {
+        "pce_os": {"robotics_twin": {"budget_remaining": 5.0}}
+    }
+
+    changed = {"pce_os": {**state["pce_os"], "robotics_twin": {"budget_remaining": 1.0}}}
+    third, state = gate.enqueue_pending_approval("d3", plan, changed, changed)
+    assert third["snapshot_ref"] != first["snapshot_ref"]
+    assert len(state["pce_os"]["approval_snapshots"]) == 2
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from pce_os.agents.base import AgentMessage
 from pce_os.agents.bus import AgentBus
 
@@ -10,8 +12,33 @@ def test_agent_bus_dedupe_and_rate_limit() -> None:
     assert not bus.enqueue(m1)
 
     assert bus.enqueue(AgentMessage("finance", "tests", "alert", {"n": 1}))
-    assert bus.enqueue(AgentMessage("procurement", "tests", "alert", {"n": 2}))
+    assert not bus.enqueue(AgentMessage("procurement", "tests", "alert", {"n": 2}))
+    assert len(bus) == 2
 
     grouped = bus.dequeue_for_all()
     assert "tests" in grouped
     assert len(grouped["tests"]) == 2
+    assert [message.from_agent for message in grouped["tests"]] == ["engineering", "finance"]
+    assert len(bus) == 0 and bus.dequeue_for_all() == {}
+
+
+def test_agent_bus_dedupes_nested_content_structurally() -> None:
+    bus = AgentBus()
+
+    content = {"graph": {"edges": {"a": ["b"]}}, "ids": ["x", "y"]}
+    assert bus.enqueue(AgentMessage("engineering", "tests", "check", content))
+    reordered = {"ids": ["x", "y"], "graph": {"edges": {"a": ["b"]}}}
+    assert not bus.enqueue(AgentMessage("engineering", "tests", "check", reordered))
+    assert bus.enqueue(AgentMessage("engineering", "tests", "check", {"ids": ["y", "x"]}))
+
+
+def test_agent_bus_accepts_concurrent_enqueues_once() -> None:
+    bus = AgentBus(per_agent_limit=1000)
+    messages = [AgentMessage("finance", "tests", "alert", {"n": n % 100}) for n in range(400)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        accepted = sum(pool.map(bus.enqueue, messages))
+
+    assert accepted == 100
+    assert len(bus) == 100
+    assert len(bus.dequeue_for_all()["tests"]) == 100
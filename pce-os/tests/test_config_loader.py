@@ -22,3 +22,15 @@ def test_load_os_config_rejects_invalid_types(tmp_path: Path) -> None:
 
     with pytest.raises(RuntimeError, match="Invalid OpenRouter config values"):
         load_os_config(config_path)
+
+
+def test_load_os_config_is_cached_per_path(tmp_path: Path) -> None:
+    config_path = tmp_path / "os_config.json"
+    config_path.write_text('{"openrouter": {"model": "a/b"}}', encoding="utf-8")
+
+    first = load_os_config(config_path)
+    config_path.write_text('{"openrouter": {"model": "c/d"}}', encoding="utf-8")
+    assert load_os_config(config_path) is first
+
+    load_os_config.cache_clear()
+    assert load_os_config(config_path).openrouter.model == "c/d"
@@ -0,0 +1,90 @@
+import json
+
+import httpx
+from pce_os.agents.llm import CachingLLMClient, LLMClient, OpenRouterLLMClient
+
+
+def test_openrouter_llm_client_reuses_pooled_client() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    client = OpenRouterLLMClient()
+    client.api_key = "test-key"
+    client._headers = {"Authorization": "Bearer test-key"}
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    pooled = client._get_client()
+
+    assert client.complete("a") == "ok"
+    assert client.complete("b") == "ok"
+    assert client._get_client() is pooled
+    assert calls == ["Bearer test-key", "Bearer test-key"]
+
+
+def test_openrouter_llm_client_returns_empty_on_http_error() -> None:
+    client = OpenRouterLLMClient()
+    client.api_key = "test-key"
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(lambda _request: httpx.Response(503, text="down"))
+    )
+
+    assert client.complete("a") == ""
+
+
+def test_openrouter_llm_client_batches_prompts_into_one_request() -> None:
+    bodies: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = json.loads(request.content)["messages"][0]["content"]
+        bodies.append(content)
+        if content.startswith("Answer each numbered request"):
+            return httpx.Response(
+                200, json={"choices": [{"message": {"content": "### 1\nfirst\n### 2\nsecond"}}]}
+            )
+        return httpx.Response(200, json={"choices": [{"message": {"content": "single"}}]})
+
+    client = OpenRouterLLMClient()
+    client.api_key = "test-key"
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.complete_batch(["a", "b"]) == ["first", "second"]
+    assert len(bodies) == 1
+
+    # A reply missing a section falls back to one request per prompt.
+    assert client.complete_batch(["a", "b", "c"]) == ["single", "single", "single"]
+    assert len(bodies) == 5
+
+
+def test_caching_llm_client_reuses_completions_per_model_and_batch() -> None:
+    class _CountingClient(LLMClient):
+        def __init__(self) -> None:
+            self.model = "m1"
+            self.prompts: list[str] = []
+
+        def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+            self.prompts.append(prompt)
+            return "" if prompt == "fail" else f"{self.model}:{prompt}"
+
+    inner = _CountingClient()
+    client = CachingLLMClient(inner, maxsize=2)
+
+    assert client.complete("a") == "m1:a"
+    assert client.complete("a") == "m1:a"
+    assert inner.prompts == ["a"]
+    # Batched answers may depend on each other, so a batch only reuses its own entry.
+    assert client.complete_batch(["a", "b"]) == ["m1:a", "m1:b"]
+    assert client.complete_batch(["a", "b"]) == ["m1:a", "m1:b"]
+    assert sorted(inner.prompts) == ["a", "a", "b"]
+
+    assert client.complete_batch(["b", "fail"]) == ["m1:b", ""]
+    assert client.complete("fail") == ""
+    assert inner.prompts.count("fail") == 2
+
+    inner.model = "m2"
+    assert client.complete("a") == "m2:a"
+    # maxsize=2 evicted the least recently used entry ("m1", ("a",)).
+    inner.model = "m1"
+    assert client.complete("a") == "m1:a"
+    assert inner.prompts[-1] == "a"
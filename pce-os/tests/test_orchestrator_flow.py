@@ -1,5 +1,10 @@
+import threading
+import time
+from concurrent.futures import wait
+
 from pce.core.types import PCEEvent
-from pce_os.plugins import AgentOrchestrator
+from pce_os.agents import CachingLLMClient, LLMClient, NullLLMClient, OpenRouterLLMClient
+from pce_os.plugins import AgentOrchestrator, OSRoboticsDecisionPlugin
 
 
 def test_orchestrator_purchase_completed_schedules_test() -> None:
@@ -19,3 +24,175 @@ def test_orchestrator_purchase_completed_schedules_test() -> None:
     action_types = [action["action_type"] for action in result["actions"]]
 
     assert "os.schedule_test" in action_types
+
+
+class BarrierLLMClient(LLMClient):
+    def __init__(self, barrier: threading.Barrier) -> None:
+        self.barrier = barrier
+
+    def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+        _ = timeout_s
+        self.barrier.wait()
+        return f"llm: {prompt}"
+
+
+def test_orchestrator_runs_llm_enrichment_concurrently() -> None:
+    orchestrator = AgentOrchestrator(enable_llm=True, max_turns=0)
+    # Every first-round agent must be inside complete() at once to pass the barrier.
+    client = BarrierLLMClient(threading.Barrier(len(orchestrator.agents), timeout=5))
+    for agent in orchestrator.agents.values():
+        agent.llm_client = client  # type: ignore[attr-defined]
+    event = PCEEvent(
+        event_type="budget.updated",
+        source="test",
+        payload={"domain": "os.robotics", "budget_remaining": 10.0},
+    )
+
+    result = orchestrator.deliberate(
+        event,
+        twin_snapshot={"budget_remaining": 10.0},
+        correlation_id="corr-3",
+        decision_id="dec-3",
+    )
+
+    assert list(result["diagnostics"]) == list(orchestrator.agents)
+    finance = result["diagnostics"]["finance"]
+    assert finance["rationale"] == "llm: Finance rationale for budget.updated"
+
+
+def test_decision_explain_keeps_snapshots_only_for_gated_events() -> None:
+    plugin = OSRoboticsDecisionPlugin()
+
+    def explain_for(event_type: str) -> dict[str, object]:
+        event = PCEEvent(
+            event_type=event_type,
+            source="test",
+            payload={"domain": "os.robotics", "projected_cost": 10.0},
+        )
+        plan = plugin.deliberate(event, {}, value_score=0.5, cci=0.5)
+        return plan.metadata["explain"]
+
+    gated = explain_for("purchase.requested")
+    assert gated["gate_required"] is True
+    assert {"budget_snapshot", "event_snapshot", "twin_snapshot"} <= gated.keys()
+
+    ungated = explain_for("project.goal.defined")
+    assert ungated["gate_required"] is False
+    assert "twin_snapshot" not in ungated
+    assert "agent_transcript" in ungated
+
+
+def test_orchestrator_llm_batch_timeout_keeps_heuristic_rationale() -> None:
+    release = threading.Event()
+
+    class StuckLLMClient(LLMClient):
+        def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+            release.wait(5)
+            return "too late"
+
+    class EchoLLMClient(LLMClient):
+        def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+            return f"llm: {prompt}"
+
+    orchestrator = AgentOrchestrator(enable_llm=True, max_turns=0, llm_timeout_s=0.2)
+    orchestrator.agents["finance"].llm_client = StuckLLMClient()
+    orchestrator.agents["tests"].llm_client = EchoLLMClient()
+    event = PCEEvent(event_type="budget.updated", source="test", payload={"domain": "os.robotics"})
+
+    def rationales() -> tuple[object, object]:
+        diagnostics = orchestrator.deliberate(
+            event,
+            twin_snapshot={"budget_remaining": 10.0},
+            correlation_id="corr-4",
+            decision_id="dec-4",
+        )["diagnostics"]
+        return diagnostics["finance"]["rationale"], diagnostics["tests"]["rationale"]
+
+    try:
+        timed_out = rationales()
+        # The stuck batch still holds a worker, so the next round is not enriched.
+        skipped = rationales()
+    finally:
+        release.set()
+    wait(orchestrator._abandoned, timeout=5)
+    orchestrator.agents["finance"].llm_client = EchoLLMClient()
+    recovered = rationales()
+    orchestrator.close()
+
+    assert timed_out == (
+        "Finance heuristics applied.",
+        "llm: Testing rationale for budget.updated",
+    )
+    assert skipped == ("Finance heuristics applied.", "Test heuristics applied.")
+    assert recovered[0].startswith("llm: ")
+    assert orchestrator._executor is None
+
+
+def test_orchestrator_dedupes_only_identical_actions() -> None:
+    plan = {"action_type": "os.update_project_plan", "priority": 1}
+    actions: list[dict[str, object]] = [
+        {**plan, "metadata": {"reason": "budget_gap", "source_agent": "finance"}},
+        {"metadata": {"source_agent": "finance", "reason": "budget_gap"}, **plan},
+        {**plan, "metadata": {"reason": "budget_gap", "source_agent": "tests"}},
+    ]
+
+    deduped = AgentOrchestrator._dedupe_actions(actions)
+
+    assert deduped == [actions[0], actions[2]]
+
+
+def test_decision_skips_agents_for_fixed_plan_events() -> None:
+    plugin = OSRoboticsDecisionPlugin()
+
+    def fail(*args: object, **kwargs: object) -> dict[str, object]:
+        raise AssertionError("orchestrator must not run")
+
+    plugin.orchestrator.deliberate = fail  # type: ignore[method-assign]
+    event = PCEEvent(
+        event_type="purchase.completed",
+        source="test",
+        payload={"domain": "os.robotics"},
+    )
+
+    plan = plugin.deliberate(event, {}, value_score=0.5, cci=0.5)
+
+    assert plan.action_type == "os.record_purchase"
+    assert plan.metadata["explain"]["candidate_actions"] == []
+
+
+def test_orchestrator_uses_live_llm_client_only_when_passed_in() -> None:
+    implicit = AgentOrchestrator(enable_llm=True)
+    assert all(isinstance(agent.llm_client, NullLLMClient) for agent in implicit.agents.values())
+
+    client = CachingLLMClient(OpenRouterLLMClient())
+    explicit = AgentOrchestrator(enable_llm=True, llm_client=client)
+    assert all(agent.llm_client is client for agent in explicit.agents.values())
+
+
+def test_orchestrator_llm_round_returns_within_one_deadline() -> None:
+    release = threading.Event()
+
+    class SleepingLLMClient(LLMClient):
+        def complete(self, prompt: str, *, timeout_s: float = 3.0) -> str:
+            release.wait(5)
+            return "too late"
+
+    orchestrator = AgentOrchestrator(
+        enable_llm=True, max_turns=0, llm_timeout_s=0.2, llm_client=SleepingLLMClient()
+    )
+    event = PCEEvent(event_type="budget.updated", source="test", payload={"domain": "os.robotics"})
+
+    started = time.perf_counter()
+    try:
+        result = orchestrator.deliberate(
+            event,
+            twin_snapshot={"budget_remaining": 10.0},
+            correlation_id="corr-6",
+            decision_id="dec-6",
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        release.set()
+
+    assert elapsed < 1.0
+    assert result["diagnostics"]["finance"]["rationale"] == "Finance heuristics applied."
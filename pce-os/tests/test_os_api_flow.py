@@ -1,4 +1,7 @@
+import asyncio
+
 import pce_api.main as api_main
+import pytest
 from fastapi.testclient import TestClient
 from pce.sm.manager import StateManager
 
@@ -92,3 +95,167 @@ def test_purchase_request_approve_without_budget_returns_conflict(tmp_path) -> N
     twin_after = client.get("/os/robotics/state").json()["robotics_twin"]
     assert twin_after["budget_remaining"] == 0.0
     assert twin_after["purchase_history"] == []
+
+
+def test_event_batch_folds_events_and_commits_once(tmp_path) -> None:
+    db = tmp_path / "state.db"
+    state_manager = StateManager(f"sqlite:///{db}")
+    state_manager.save_state({})
+
+    app = api_main.build_app(state_manager=state_manager)
+    client = TestClient(app)
+
+    response = client.post(
+        "/v1/events/batch",
+        json=[
+            {
+                "event_type": "budget.updated",
+                "source": "os-test",
+                "payload": {
+                    "domain": "os.robotics",
+                    "tags": ["budget"],
+                    "budget_total": 500.0,
+                    "budget_remaining": 500.0,
+                },
+            },
+            {
+                "event_type": "purchase.requested",
+                "source": "os-test",
+                "payload": {
+                    "domain": "os.robotics",
+                    "tags": ["purchase"],
+                    "projected_cost": 123.0,
+                    "risk_level": "MEDIUM",
+                },
+            },
+        ],
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 2
+    assert results[1]["cursor"] > results[0]["cursor"]
+    assert len(client.get("/os/approvals").json()["pending"]) == 1
+    assert client.get("/os/robotics/state").json()["robotics_twin"]["budget_total"] == 500.0
+    assert len(state_manager.get_recent_actions(10)) == 2
+    assert len(state_manager.get_cci_history()) == 2
+
+
+def test_event_batch_rejection_discards_deferred_assistant_replies(tmp_path) -> None:
+    state_manager = StateManager(f"sqlite:///{tmp_path / 'state.db'}")
+    state_manager.save_state({})
+    app = api_main.build_app(state_manager=state_manager)
+    decision = app.state.assistant_decision
+    decision._defer_replies = True
+    client = TestClient(app)
+
+    response = client.post(
+        "/v1/events/batch",
+        json=[
+            {
+                "event_type": "observation.assistant.v1",
+                "source": "assistant-ui",
+                "payload": {
+                    "domain": "assistant",
+                    "session_id": "s1",
+                    "text": "oi",
+                    "tags": ["observation", "assistant"],
+                },
+            },
+            {"event_type": "not.a.known.event", "source": "os-test", "payload": {}},
+        ],
+    )
+
+    assert response.status_code == 422
+    assert decision._deferred == {}
+
+
+def test_event_batch_validates_every_event_before_processing(tmp_path) -> None:
+    state_manager = StateManager(f"sqlite:///{tmp_path / 'state.db'}")
+    state_manager.save_state({})
+    app = api_main.build_app(state_manager=state_manager)
+    queue: asyncio.Queue[dict[str, object]] = asyncio.Queue()
+    app.state.os_stream_queues = frozenset({queue})
+    client = TestClient(app)
+    budget_event = {
+        "event_type": "budget.updated",
+        "source": "os-test",
+        "payload": {"domain": "os.robotics", "tags": ["budget"], "budget_total": 500.0},
+    }
+
+    rejected = client.post(
+        "/v1/events/batch",
+        json=[
+            budget_event,
+            {"event_type": "not.a.known.event", "source": "os-test", "payload": {}},
+        ],
+    )
+    assert rejected.status_code == 422
+    assert queue.empty()
+    assert state_manager.get_recent_actions(10) == []
+
+    too_many = client.post("/v1/events/batch", json=[budget_event] * 101)
+    assert too_many.status_code == 422
+
+    accepted = client.post("/v1/events/batch", json=[budget_event])
+    assert accepted.status_code == 200
+    assert queue.get_nowait()["event"] == "os.event_ingested"
+
+
+def test_reject_emits_approval_update_only_after_commit(tmp_path) -> None:
+    state_manager = StateManager(f"sqlite:///{tmp_path / 'state.db'}")
+    state_manager.save_state({})
+    app = api_main.build_app(state_manager=state_manager)
+    client = TestClient(app)
+    client.post(
+        "/events",
+        json={
+            "event_type": "purchase.requested",
+            "source": "os-test",
+            "payload": {"domain": "os.robotics", "tags": ["purchase"], "projected_cost": 123.0},
+        },
+    )
+    approval_id = client.get("/os/approvals").json()["pending"][0]["approval_id"]
+    queue: asyncio.Queue[dict[str, object]] = asyncio.Queue()
+    app.state.os_stream_queues = frozenset({queue})
+
+    def failing_commit(writes: object) -> None:
+        raise RuntimeError("commit failed")
+
+    state_manager.commit_writes = failing_commit  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError):
+        client.post(f"/os/approvals/{approval_id}/reject", json={"actor": "tester"})
+    assert queue.empty()
+
+    del state_manager.commit_writes
+    rejected = client.post(f"/os/approvals/{approval_id}/reject", json={"actor": "tester"})
+    assert rejected.status_code == 200
+    assert queue.get_nowait()["event"] == "os.approval_updated"
+
+
+def test_assistant_reply_lookup_returns_404_for_unknown_ids(tmp_path) -> None:
+    state_manager = StateManager(f"sqlite:///{tmp_path / 'state.db'}")
+    state_manager.save_state({})
+    app = api_main.build_app(state_manager=state_manager)
+    app.state.assistant_decision._defer_replies = True
+    client = TestClient(app)
+
+    assert client.get("/agents/assistant/replies/unknown").status_code == 404
+
+    response = client.post(
+        "/events",
+        json={
+            "event_type": "observation.assistant.v1",
+            "source": "assistant-ui",
+            "payload": {
+                "domain": "assistant",
+                "session_id": "s1",
+                "text": "oi",
+                "tags": ["observation", "assistant"],
+            },
+        },
+    )
+    reply_id = response.json()["metadata"]["reply_id"]
+    lookup = client.get(f"/agents/assistant/replies/{reply_id}")
+    assert lookup.status_code == 200
+    assert lookup.json()["pending"] is False
+    assert lookup.json()["reply"]["status"] == "completed"
@@ -0,0 +1,27 @@
+from pce_os.transcript import append_transcript_item, items_since, transcript_cursor
+
+
+def test_items_since_slices_after_ring_eviction() -> None:
+    state: dict[str, object] = {}
+    for index in range(510):
+        state, _ = append_transcript_item(
+            state,
+            kind="agent_message",
+            payload={"n": index},
+            correlation_id="c1",
+            ts="2026-01-01T00:00:00+00:00",
+        )
+
+    assert transcript_cursor(state) == 510
+    assert [item["cursor"] for item in items_since(state, 507)] == [508, 509, 510]
+    assert len(items_since(state, 0)) == 500
+    assert items_since(state, 510) == []
+
+
+def test_append_leaves_previous_state_untouched() -> None:
+    state, _ = append_transcript_item(state={}, kind="note", payload={}, correlation_id="c1")
+    next_state, _ = append_transcript_item(state, kind="note", payload={}, correlation_id="c2")
+
+    assert transcript_cursor(state) == 1
+    assert len(items_since(state, 0)) == 1
+    assert [item["correlation_id"] for item in items_since(next_state, 0)] == ["c1", "c2"]
@@ -1,5 +1,9 @@
-from pce_os.models import RobotProjectState
+import pytest
+from pce.core.types import ExecutionResult, PCEEvent
+from pce_os.models import Component, RobotProjectState
+from pce_os.plugins import OSRoboticsAdaptationPlugin
 from pce_os.twin_store import RobotTwinStore
+from pydantic import ValidationError
 
 
 def test_apply_event_is_deterministic_for_same_sequence() -> None:
@@ -46,6 +50,7 @@ def test_apply_event_is_deterministic_for_same_sequence() -> None:
     assert state_a.model_dump(mode="json") == state_b.model_dump(mode="json")
     assert state_a.budget_remaining == 760.0
     assert state_a.cost_projection.projected_total_cost == 240.0
+    assert state_a.actual_purchase_spend == 240.0
 
 
 def test_apply_event_without_metadata_uses_stable_unknown_timestamp() -> None:
@@ -55,3 +60,123 @@ def test_apply_event_without_metadata_uses_stable_unknown_timestamp() -> None:
         {"domain": "os.robotics"},
     )
     assert state.audit_trail[-1]["at"] == "unknown"
+
+
+def test_get_cached_reuses_twin_for_same_slice_object() -> None:
+    twin = RobotProjectState(budget_total=500, budget_remaining=300)
+    state: dict[str, object] = {"pce_os": {"robotics_twin": RobotTwinStore.dump_cached(twin)}}
+
+    assert RobotTwinStore.get_cached(state) is twin
+
+    copied = {"pce_os": {"robotics_twin": dict(state["pce_os"]["robotics_twin"])}}  # type: ignore[index]
+    reloaded = RobotTwinStore.get_cached(copied)
+    assert reloaded is not twin
+    assert reloaded.budget_remaining == 300
+
+
+def test_json_snapshot_reuses_dump_for_same_twin() -> None:
+    twin = RobotTwinStore.get_cached({"pce_os": {"robotics_twin": {"budget_total": 10.0}}})
+
+    snapshot = RobotTwinStore.json_snapshot(twin)
+    assert snapshot == twin.model_dump(mode="json")
+    assert RobotTwinStore.json_snapshot(twin) is snapshot
+    assert RobotTwinStore.json_snapshot(RobotProjectState()) is not snapshot
+
+
+def test_purchase_spend_is_backfilled_for_legacy_twins() -> None:
+    legacy = {
+        "purchase_history": [{"status": "completed", "total_cost": 40.0}, {"total_cost": 2.5}]
+    }
+    assert RobotProjectState.model_validate(legacy).actual_purchase_spend == 42.5
+
+
+def test_adaptation_does_not_mutate_shared_cached_twin() -> None:
+    twin_payload = RobotProjectState(budget_total=100, budget_remaining=100).model_dump(
+        mode="json"
+    )
+    state: dict[str, object] = {"pce_os": {"robotics_twin": twin_payload}}
+    cached = RobotTwinStore.get_cached(state)
+    event = PCEEvent(
+        event_type="test.result.recorded",
+        source="test",
+        payload={"domain": "os.robotics", "tags": [], "passed": False},
+    )
+
+    adapted = OSRoboticsAdaptationPlugin().adapt(
+        state, event, ExecutionResult(action_type="x", success=True, observed_impact=0.0)
+    )
+
+    assert cached.risk_level == "LOW"
+    assert RobotTwinStore.get_cached(adapted).risk_level == "MEDIUM"
+
+
+def test_write_into_state_slice_shares_other_slices() -> None:
+    assistant = {"history": [1, 2, 3]}
+    state: dict[str, object] = {"assistant": assistant, "pce_os": {"transcript": {"cursor": 2}}}
+
+    next_state = RobotTwinStore.write_into_state_slice(state, RobotProjectState(budget_total=5))
+
+    assert next_state["assistant"] is assistant
+    assert "robotics_twin" not in state["pce_os"]
+    assert next_state["pce_os"]["transcript"] == {"cursor": 2}
+    assert next_state["pce_os"]["robotics_twin"]["budget_total"] == 5
+
+
+def test_view_matches_validated_twin_fields() -> None:
+    twin = RobotProjectState(budget_total=300, budget_remaining=120, risk_level="HIGH")
+    state: dict[str, object] = {"pce_os": {"robotics_twin": twin.model_dump(mode="json")}}
+
+    view = RobotTwinStore.view(state)
+
+    assert (view.budget_total, view.budget_remaining, view.risk_level) == (300.0, 120.0, "HIGH")
+    assert view.cost_confidence == twin.cost_projection.confidence
+    assert RobotTwinStore.view({}).phase == RobotProjectState().phase
+
+
+def test_twin_leaf_records_are_frozen() -> None:
+    component = Component(component_id="c1", name="motor")
+
+    with pytest.raises(ValidationError):
+        component.status = "received"  # type: ignore[misc]
+    assert component.model_copy(update={"status": "received"}).status == "received"
+
+
+def test_risk_detected_keeps_twin_risk_level_valid() -> None:
+    twin = RobotTwinStore.apply_event(
+        RobotProjectState(), "risk.detected", {"description": "x", "risk_level": "MEDIUM"}
+    )
+    assert twin.risk_level == "MEDIUM"
+
+    twin = RobotTwinStore.apply_event(twin, "risk.detected", {"risk_level": "SEVERE"})
+    assert twin.risk_level == "HIGH"
+    assert RobotProjectState.model_validate(twin.model_dump(mode="json")).risk_level == "HIGH"
+
+
+def test_apply_event_leaves_input_twin_untouched() -> None:
+    twin = RobotProjectState(budget_total=100, budget_remaining=100)
+    updated = RobotTwinStore.apply_event(
+        twin, "purchase.completed", {"total_cost": 40.0}, {"at": "2026-01-01T00:00:00+00:00"}
+    )
+
+    assert updated.budget_remaining == 60.0
+    assert len(updated.purchase_history) == 1
+    assert twin.budget_remaining == 100.0
+    assert twin.purchase_history == []
+    assert twin.audit_trail == []
+    assert updated.suppliers is twin.suppliers
+
+
+def test_dump_cached_extends_previous_dump_for_appended_events() -> None:
+    twin = RobotProjectState(budget_total=100, budget_remaining=100)
+    previous = RobotTwinStore.dump_cached(twin)
+    for event_type, payload in [
+        ("risk.detected", {"description": "late motor", "risk_level": "MEDIUM"}),
+        ("purchase.completed", {"total_cost": 40.0}),
+    ]:
+        twin = RobotTwinStore.apply_event(twin, event_type, payload)
+        dumped = RobotTwinStore.dump_cached(twin)
+
+        assert dumped == twin.model_dump(mode="json")
+        assert list(dumped) == list(previous)
+        assert dumped["audit_trail"][:-1] == previous["audit_trail"]
+        previous = dumped
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import time
-from uuid import uuid4
 
 from pce.afs.feedback import AdaptiveFeedbackSystem
 from pce.ao.orchestrator import ActionOrchestrator
 from pce.core.cci import CCIMetric
 from pce.core.config import Settings
+from pce.core.ids import time_ordered_id
 from pce.de.engine import DecisionEngine
 from pce.epl.processor import EventProcessingLayer
 from pce.examples.scenarios import autonomous_event_example, financial_event_example
@@ -44,7 +44,7 @@ def run_loop(iterations: int = 10, sleep_s: float = 0.05) -> None:
 
         violated_values = [] if value_score >= 0.6 else ["long_term_coherence"]
         sm.remember_action(
-            action_id=str(uuid4()),
+            action_id=time_ordered_id(),
             event_id=event.event_id,
             action_type=plan.action_type,
             priority=plan.priority,
@@ -58,14 +58,9 @@ def run_loop(iterations: int = 10, sleep_s: float = 0.05) -> None:
 
         cci_after, components = cci_metric.from_state_manager(sm)
         sm.save_cci_snapshot(
-            cci_id=str(uuid4()),
+            cci_id=time_ordered_id(),
             cci=cci_after,
-            metrics={
-                "decision_consistency": components.decision_consistency,
-                "priority_stability": components.priority_stability,
-                "contradiction_rate": components.contradiction_rate,
-                "predictive_accuracy": components.predictive_accuracy,
-            },
+            metrics=components.as_dict(),
         )
 
         result.metadata["violated_values"] = violated_values